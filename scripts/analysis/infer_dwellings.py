@@ -24,11 +24,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from sqlalchemy import delete, func, select, text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
-from src.database import engine
+from src.database import engine, init_db
 from src.models import (
-    Base,
     Parcel,
     TaxStatus,
     STRListing,
@@ -127,7 +126,8 @@ def infer_dwellings(session: Session, reset: bool = False) -> dict:
         session.commit()
 
     # Get ALL parcels - this is our complete inventory
-    parcels = session.execute(select(Parcel)).scalars().all()
+    # Polygons are never read here and dominate the row size
+    parcels = session.execute(select(Parcel).options(defer(Parcel.geometry))).scalars().all()
     stats["parcels_total"] = len(parcels)
 
     print(f"Processing {len(parcels)} parcels (complete Grand List inventory)...")
@@ -403,7 +403,7 @@ def main():
     parser.add_argument("--coverage", action="store_true", help="Show coverage analysis")
     args = parser.parse_args()
 
-    Base.metadata.create_all(engine)
+    init_db()
 
     with Session(engine) as session:
         if args.stats:
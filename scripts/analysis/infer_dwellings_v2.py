@@ -30,11 +30,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from sqlalchemy import delete, func, select, text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 
-from src.database import engine
+from src.database import engine, init_db
 from src.models import (
-    Base,
     Parcel,
     TaxStatus,
     STRListing,
@@ -49,6 +48,10 @@ from src.models import (
 # DESCPROP Parsing
 # =============================================================================
 
+DWELLING_COUNT_PATTERN = re.compile(r'&\s*(\d+)\s*DWLS?')
+SINGLE_DWELLING_PATTERN = re.compile(r'&\s*DWL[.\s:]?')
+
+
 def parse_descprop_dwelling_count(descprop: str | None) -> int:
     """Parse DESCPROP field for dwelling count.
 
@@ -65,14 +68,16 @@ def parse_descprop_dwelling_count(descprop: str | None) -> int:
 
     text = descprop.upper()
 
-    # Check for explicit count first: "& 2 DWLS", "& 3 DWLS"
-    match = re.search(r'&\s*(\d+)\s*DWLS?', text)
-    if match:
-        return int(match.group(1))
+    # Most rows have no "& ... DWL" at all; skip the regexes
+    if "&" in text and "DWL" in text:
+        # Check for explicit count first: "& 2 DWLS", "& 3 DWLS"
+        match = DWELLING_COUNT_PATTERN.search(text)
+        if match:
+            return int(match.group(1))
 
-    # Single dwelling: "& DWL", "& DWL.", "& DWL:"
-    if re.search(r'&\s*DWL[.\s:]?', text):
-        return 1
+        # Single dwelling: "& DWL", "& DWL.", "& DWL:"
+        if SINGLE_DWELLING_PATTERN.search(text):
+            return 1
 
     # Multi-family indicator
     if "& MF" in text:
@@ -177,7 +182,8 @@ def infer_dwellings_positive_signal(session: Session, reset: bool = False) -> di
         session.commit()
 
     # Get all parcels
-    parcels = session.execute(select(Parcel)).scalars().all()
+    # Polygons are never read here and dominate the row size
+    parcels = session.execute(select(Parcel).options(defer(Parcel.geometry))).scalars().all()
     stats["parcels_total"] = len(parcels)
 
     print(f"Processing {len(parcels)} parcels with positive-signal logic...")
@@ -478,7 +484,7 @@ def main():
     )
     args = parser.parse_args()
 
-    Base.metadata.create_all(engine)
+    init_db()
 
     with Session(engine) as session:
         if args.stats:
@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pydantic_ai import Embedder
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select, update
 from sqlalchemy.orm import Session
 
 from src.database import engine, init_db
@@ -19,13 +19,13 @@ from src.models import FPFPost
 
 load_dotenv()
 
-# Configuration - use Gateway for OpenAI embeddings (large model for max quality)
-EMBEDDING_MODEL = "gateway/openai:text-embedding-3-large"
+# Configuration - use Gateway for OpenAI embeddings (1536 dims, HNSW-indexable)
+EMBEDDING_MODEL = "gateway/openai:text-embedding-3-small"
 BATCH_SIZE = 100  # Process 100 posts at a time
 COMMIT_EVERY = 500  # Commit after this many posts
 
 
-def get_text_for_embedding(post: FPFPost) -> str:
+def get_text_for_embedding(post: Row) -> str:
     """Combine title and content for embedding."""
     parts = []
     if post.title:
@@ -38,8 +38,9 @@ def get_text_for_embedding(post: FPFPost) -> str:
 
 
 async def embed_batch(
+    session: Session,
     embedder: Embedder,
-    posts: list[FPFPost],
+    posts: list[Row],
 ) -> int:
     """Embed a batch of posts. Returns count of successful embeddings."""
     texts = [get_text_for_embedding(p) for p in posts]
@@ -47,10 +48,18 @@ async def embed_batch(
     try:
         result = await embedder.embed_documents(texts)
 
-        for i, post in enumerate(posts):
-            post.embedding = result.embeddings[i]
-            post.embedding_model = EMBEDDING_MODEL
-            post.embedded_at = datetime.utcnow()
+        # Bulk UPDATE by primary key; no ORM objects accumulate in the session
+        embedded_at = datetime.utcnow()
+        session.execute(update(FPFPost), [
+            {
+                "id": post.id,
+                "person_id": post.person_id,  # Part of the (partitioned) primary key
+                "embedding": embedding,
+                "embedding_model": EMBEDDING_MODEL,
+                "embedded_at": embedded_at,
+            }
+            for post, embedding in zip(posts, result.embeddings)
+        ])
 
         return len(posts)
     except Exception as e:
@@ -76,16 +85,22 @@ async def main(force_reembed: bool = False, limit: int | None = None):
         print(f"Total posts in database: {total_posts}")
         print(f"Already embedded: {already_embedded}")
 
-        # Build query for posts needing embeddings
-        query = select(FPFPost)
+        # Build query for posts needing embeddings (text columns only)
+        query = select(
+            FPFPost.id, FPFPost.person_id, FPFPost.title, FPFPost.content, FPFPost.category
+        )
 
         if not force_reembed:
-            query = query.where(FPFPost.embedding.is_(None))
+            # Also pick up posts embedded by an older model
+            query = query.where(
+                FPFPost.embedding.is_(None)
+                | FPFPost.embedding_model.is_distinct_from(EMBEDDING_MODEL)
+            )
 
         if limit:
             query = query.limit(limit)
 
-        posts = list(session.scalars(query))
+        posts = session.execute(query).all()
         to_embed = len(posts)
 
         if to_embed == 0:
@@ -107,7 +122,7 @@ async def main(force_reembed: bool = False, limit: int | None = None):
 
             print(f"[Batch {batch_num}/{total_batches}] Embedding {len(batch)} posts...", end=" ")
 
-            count = await embed_batch(embedder, batch)
+            count = await embed_batch(session, embedder, batch)
             embedded += count
 
             if count < len(batch):
@@ -0,0 +1,87 @@
+"""Link Grand List people to their Front Porch Forum profiles.
+
+Sets Person.fpf_person_id by fuzzy-matching "First Last" against
+FPFPerson.name. Matching runs entirely in Postgres: pg_trgm's `%` operator
+shortlists candidates through the GIN trigram index on fpf_people.name, and
+a single UPDATE ... FROM applies the best match per person.
+
+Usage:
+    uv run python scripts/community/link_fpf_people.py
+    uv run python scripts/community/link_fpf_people.py --threshold 0.7
+    uv run python scripts/community/link_fpf_people.py --relink   # Redo existing links
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from src.database import engine, init_db
+from src.models import Person
+
+# Minimum trigram similarity for a match (0-1)
+DEFAULT_THRESHOLD = 0.8
+
+LINK_SQL = text("""
+    UPDATE people p
+    SET fpf_person_id = m.fpf_person_id,
+        updated_at = now()
+    FROM (
+        SELECT DISTINCT ON (p.id)
+            p.id AS person_id,
+            f.id AS fpf_person_id
+        FROM people p
+        JOIN fpf_people f ON f.name % (p.first_name || ' ' || p.last_name)
+        WHERE :relink OR p.fpf_person_id IS NULL
+        ORDER BY p.id, similarity(f.name, p.first_name || ' ' || p.last_name) DESC
+    ) m
+    WHERE p.id = m.person_id
+""")
+
+
+def link_fpf_to_people(session: Session, threshold: float, relink: bool = False) -> int:
+    """Link people to FPF profiles in one statement. Returns rows updated."""
+    # The % operator (and its index) use this threshold; transaction-local
+    session.execute(
+        text("SELECT set_config('pg_trgm.similarity_threshold', :t, true)"),
+        {"t": str(threshold)},
+    )
+    result = session.execute(LINK_SQL, {"relink": relink})
+    return result.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Link people to FPF profiles")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Minimum name similarity 0-1 (default {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--relink",
+        action="store_true",
+        help="Re-match people that already have an FPF link",
+    )
+    args = parser.parse_args()
+
+    init_db()
+
+    with Session(engine) as session:
+        linked = link_fpf_to_people(session, args.threshold, args.relink)
+        session.commit()
+
+        total_linked = session.scalar(
+            select(func.count(Person.id)).where(Person.fpf_person_id.isnot(None))
+        )
+
+    print(f"Linked this run: {linked}")
+    print(f"People with FPF profile: {total_linked}")
+
+
+if __name__ == "__main__":
+    main()
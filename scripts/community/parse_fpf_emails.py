@@ -7,15 +7,17 @@ from datetime import datetime
 from email.utils import parsedate_to_datetime
 
 from bs4 import BeautifulSoup
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
 from sqlalchemy.orm import Session
 
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.database import engine, Base
+from src.database import engine, init_db
 from src.models import FPFIssue, FPFPerson, FPFPost
 
+POST_INSERT_CHUNK = 500
+
 
 def parse_issue_info(subject: str, date_str: str) -> tuple[int | None, datetime, bool]:
     """Extract issue number and date from email. Returns (issue_number, published_at, is_forward)."""
@@ -211,6 +213,32 @@ def get_or_create_person(
     return person
 
 
+def attach_new_emails(session: Session, author_rows: dict[str, dict]) -> None:
+    """Give emails seen for the first time to a matching person who has none.
+
+    A poster first stored without an email is matched on name + road + town,
+    as get_or_create_person does, so the upsert updates them instead of
+    creating a second person.
+    """
+    known = set(session.execute(
+        select(FPFPerson.email).where(FPFPerson.email.in_(list(author_rows)))
+    ).scalars())
+    for email, row in author_rows.items():
+        if email in known:
+            continue
+        query = select(FPFPerson).where(
+            FPFPerson.name == row["name"], FPFPerson.email.is_(None)
+        )
+        if row["road"]:
+            query = query.where(FPFPerson.road == row["road"])
+        if row["town"]:
+            query = query.where(FPFPerson.town == row["town"])
+        person = session.execute(query.limit(1)).scalar_one_or_none()
+        if person:
+            person.email = email
+    session.flush()
+
+
 def import_email(session: Session, email_data: dict) -> tuple[int, int]:
     """Import a single email. Returns (issues_created, posts_created)."""
     gmail_id = email_data["id"]
@@ -255,37 +283,59 @@ def import_email(session: Session, email_data: dict) -> tuple[int, int]:
         return 1, 0
 
     posts_data = parse_posts_from_html(html)
-    posts_created = 0
+    if not posts_data:
+        return 1, 0
 
+    # Authors with an email are upserted in one statement (after claiming any
+    # email-less match); the rest fall back to name + road + town matching
+    author_rows: dict[str, dict] = {}
     for post_data in posts_data:
-        person = get_or_create_person(
-            session,
-            name=post_data["author_name"],
-            email=post_data.get("author_email"),
-            road=post_data.get("road"),
-            town=post_data.get("town"),
-            published_at=published_at,
-        )
-
-        post = FPFPost(
-            issue_id=issue.id,
-            person_id=person.id,
-            title=post_data["title"],
-            content=post_data.get("content", ""),
-            category=post_data.get("category"),
-            is_reply=post_data.get("is_reply", False),
-            published_at=published_at,
-        )
-        session.add(post)
-        posts_created += 1
-
-    return 1, posts_created
+        email = post_data.get("author_email")
+        if email and email not in author_rows:
+            author_rows[email] = {
+                "name": post_data["author_name"],
+                "email": email,
+                "road": post_data.get("road"),
+                "town": post_data.get("town"),
+                "first_seen_at": published_at,
+                "last_seen_at": published_at,
+            }
+    attach_new_emails(session, author_rows)
+    person_ids = FPFPerson.upsert_batch(session, list(author_rows.values()))
+
+    post_rows = []
+    for post_data in posts_data:
+        person_id = person_ids.get(post_data.get("author_email"))
+        if person_id is None:
+            person_id = get_or_create_person(
+                session,
+                name=post_data["author_name"],
+                email=None,
+                road=post_data.get("road"),
+                town=post_data.get("town"),
+                published_at=published_at,
+            ).id
+
+        post_rows.append({
+            "issue_id": issue.id,
+            "person_id": person_id,
+            "title": post_data["title"],
+            "content": post_data.get("content", ""),
+            "category": post_data.get("category"),
+            "is_reply": post_data.get("is_reply", False),
+            "published_at": published_at,
+        })
+
+    for start in range(0, len(post_rows), POST_INSERT_CHUNK):
+        session.execute(insert(FPFPost), post_rows[start:start + POST_INSERT_CHUNK])
+
+    return 1, len(post_rows)
 
 
 def main():
     """Main entry point."""
     # Create tables if they don't exist
-    Base.metadata.create_all(engine)
+    init_db()
 
     # Find email files
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -322,6 +372,7 @@ def main():
 
                 if i % 100 == 0:
                     session.commit()
+                    session.expunge_all()  # Keep the identity map bounded
                     print(f"[{i}/{len(email_files)}] {total_issues} issues, {total_posts} posts")
 
             except Exception as e:
@@ -339,10 +390,8 @@ def main():
 
     # Print person stats
     with SessionClass(engine) as session:
-        person_count = session.execute(
-            select(FPFPerson)
-        ).all()
-        print(f"  Unique people: {len(person_count)}")
+        person_count = session.scalar(select(func.count(FPFPerson.id)))
+        print(f"  Unique people: {person_count}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
-"""Run the complete FPF data pipeline: fetch -> parse -> embed.
+"""Run the complete FPF data pipeline: fetch -> parse -> link -> embed.
 
 This script orchestrates the full FPF data pipeline:
 1. Fetch emails from Gmail (requires credentials.json)
 2. Parse emails and import posts to database
-3. Generate embeddings for semantic search
+3. Link FPF authors to Grand List people
+4. Generate embeddings for semantic search
 
 Usage:
     # Run full pipeline
@@ -86,9 +87,9 @@ def main():
     if args.embed_only:
         steps_to_run = ["embed"]
     elif args.skip_fetch:
-        steps_to_run = ["parse", "embed"]
+        steps_to_run = ["parse", "link", "embed"]
     else:
-        steps_to_run = ["fetch", "parse", "embed"]
+        steps_to_run = ["fetch", "parse", "link", "embed"]
 
     # Build step commands
     steps = {
@@ -100,6 +101,10 @@ def main():
             "Parse emails into database",
             [sys.executable, str(scripts_dir / "parse_fpf_emails.py")],
         ),
+        "link": (
+            "Link FPF authors to people",
+            [sys.executable, str(scripts_dir / "link_fpf_people.py")],
+        ),
         "embed": (
             "Generate embeddings for posts",
             [sys.executable, str(scripts_dir / "embed_fpf_posts.py")]
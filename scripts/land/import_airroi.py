@@ -15,29 +15,29 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
 import sys
-import time
-import urllib.request
-from datetime import datetime
+import uuid
 from decimal import Decimal
 from pathlib import Path
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from sqlalchemy import create_engine, func, select, text
+import httpx
+from sqlalchemy import create_engine, func, select, text, update
 from sqlalchemy.orm import Session
 
-from src.database import engine
+from src.database import engine, init_db
 from src.models import (
-    Base,
     Parcel,
     BronzeSTRListing,
     STRListing,
 )
+from pydantic import ValidationError
+
 from src.transformations import (
-    STRBronzeInput,
+    STR_BRONZE_LIST_ADAPTER,
     STRSilverOutput,
     TransformationStats,
 )
@@ -56,13 +56,17 @@ MRV_TOWNS = ["Warren", "Waitsfield", "Fayston", "Moretown", "Duxbury"]
 # Request delay to be respectful to API
 REQUEST_DELAY_SECONDS = 0.5
 
+# Bronze rows streamed per transform partition
+TRANSFORM_BATCH_SIZE = 5000
+
 
 # =============================================================================
 # API Fetching
 # =============================================================================
 
 
-def fetch_airroi_page(
+async def fetch_airroi_page(
+    client: httpx.AsyncClient,
     city: str,
     state: str = "Vermont",
     offset: int = 0,
@@ -80,22 +84,14 @@ def fetch_airroi_page(
         }
     }
 
-    data = json.dumps(payload).encode('utf-8')
-
-    request = urllib.request.Request(
-        AIRROI_API_URL,
-        data=data,
-        headers={
-            "Content-Type": "application/json",
-            "X-API-KEY": AIRROI_API_KEY
-        }
-    )
-
-    with urllib.request.urlopen(request, timeout=30) as response:
-        return json.loads(response.read().decode())
+    response = await client.post(AIRROI_API_URL, json=payload)
+    response.raise_for_status()
+    return response.json()
 
 
-def fetch_all_listings(city: str, state: str = "Vermont") -> list[dict]:
+async def fetch_all_listings(
+    client: httpx.AsyncClient, city: str, state: str = "Vermont"
+) -> list[dict]:
     """Fetch all listings for a city from AirROI API."""
     all_results = []
     offset = 0
@@ -103,7 +99,7 @@ def fetch_all_listings(city: str, state: str = "Vermont") -> list[dict]:
 
     while True:
         print(f"  Fetching {city}: offset={offset}...")
-        data = fetch_airroi_page(city, state, offset, page_size)
+        data = await fetch_airroi_page(client, city, state, offset, page_size)
 
         results = data.get("results", [])
         if not results:
@@ -116,11 +112,29 @@ def fetch_all_listings(city: str, state: str = "Vermont") -> list[dict]:
             break
 
         offset += page_size
-        time.sleep(REQUEST_DELAY_SECONDS)
+        await asyncio.sleep(REQUEST_DELAY_SECONDS)
 
     return all_results
 
 
+async def fetch_towns_async(towns: list[str]) -> dict[str, list[dict]]:
+    """Fetch all listings for several towns concurrently.
+
+    Pages within a town stay sequential and rate limited; the towns are
+    fetched side by side over one connection pool.
+    """
+    async with httpx.AsyncClient(
+        timeout=30.0, headers={"X-API-KEY": AIRROI_API_KEY}
+    ) as client:
+        results = await asyncio.gather(*(fetch_all_listings(client, town) for town in towns))
+    return dict(zip(towns, results))
+
+
+def fetch_towns(towns: list[str]) -> dict[str, list[dict]]:
+    """Fetch all listings for each town, keyed by town."""
+    return asyncio.run(fetch_towns_async(towns))
+
+
 # =============================================================================
 # Bronze Layer: Raw Import
 # =============================================================================
@@ -128,8 +142,8 @@ def fetch_all_listings(city: str, state: str = "Vermont") -> list[dict]:
 
 def import_to_bronze(session: Session, listings: list[dict], city: str) -> int:
     """Import raw AirROI listings to bronze table."""
-    imported = 0
     skipped = 0
+    rows: list[dict] = []
 
     for listing in listings:
         listing_info = listing.get("listing_info", {})
@@ -145,18 +159,6 @@ def import_to_bronze(session: Session, listings: list[dict], city: str) -> int:
             skipped += 1
             continue
 
-        # Check if already exists
-        existing = session.execute(
-            select(BronzeSTRListing).where(
-                BronzeSTRListing.platform == "airbnb",
-                BronzeSTRListing.listing_id == listing_id
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            skipped += 1
-            continue
-
         # Parse first review date
         first_review_date = None
         # AirROI doesn't provide first_review_date directly
@@ -164,42 +166,46 @@ def import_to_bronze(session: Session, listings: list[dict], city: str) -> int:
         # Parse last review date from last_calendar_update if available
         last_review_date = None
 
-        # Create bronze record
-        record = BronzeSTRListing(
-            platform="airbnb",
-            listing_id=listing_id,
-            listing_url=f"https://www.airbnb.com/rooms/{listing_id}",
-            name=listing_info.get("listing_name"),
-            property_type=listing_info.get("listing_type"),
-            room_type=listing_info.get("room_type"),
-            address=None,  # AirROI doesn't provide full address
-            city=location.get("locality", city),
-            state=location.get("region", "VT"),
-            zip_code=location.get("district"),
-            lat=Decimal(str(location.get("latitude"))) if location.get("latitude") else None,
-            lng=Decimal(str(location.get("longitude"))) if location.get("longitude") else None,
-            bedrooms=props.get("bedrooms"),
-            bathrooms=Decimal(str(props.get("baths"))) if props.get("baths") else None,
-            max_guests=props.get("guests"),
-            price_per_night=Decimal(str(perf.get("ttm_avg_rate"))) if perf.get("ttm_avg_rate") else None,
-            currency="USD",
-            host_name=host_info.get("host_name"),
-            host_id=str(host_info.get("host_id", "")),
-            is_superhost=host_info.get("superhost"),
-            total_reviews=ratings.get("num_reviews"),
-            average_rating=Decimal(str(ratings.get("rating_overall"))) if ratings.get("rating_overall") else None,
-            first_review_date=first_review_date,
-            last_review_date=last_review_date,
-            scraped_at=datetime.utcnow(),
-            raw_json=json.dumps(listing),
-            api_source="airroi",
-        )
-
-        session.add(record)
-        imported += 1
+        rows.append({
+            "platform": "airbnb",
+            "listing_id": listing_id,
+            "listing_url": f"https://www.airbnb.com/rooms/{listing_id}",
+            "name": listing_info.get("listing_name"),
+            "property_type": listing_info.get("listing_type"),
+            "room_type": listing_info.get("room_type"),
+            "address": None,  # AirROI doesn't provide full address
+            "city": location.get("locality", city),
+            "state": location.get("region", "VT"),
+            "zip_code": location.get("district"),
+            "lat": float(location["latitude"]) if location.get("latitude") else None,
+            "lng": float(location["longitude"]) if location.get("longitude") else None,
+            "bedrooms": props.get("bedrooms"),
+            "bathrooms": Decimal(str(props.get("baths"))) if props.get("baths") else None,
+            "max_guests": props.get("guests"),
+            "price_per_night": (
+                Decimal(str(perf.get("ttm_avg_rate"))) if perf.get("ttm_avg_rate") else None
+            ),
+            "currency": "USD",
+            "host_name": host_info.get("host_name"),
+            "host_id": str(host_info.get("host_id", "")),
+            "is_superhost": host_info.get("superhost"),
+            "total_reviews": ratings.get("num_reviews"),
+            "average_rating": (
+                Decimal(str(ratings.get("rating_overall")))
+                if ratings.get("rating_overall")
+                else None
+            ),
+            "first_review_date": first_review_date,
+            "last_review_date": last_review_date,
+            "raw_json": listing,
+            "api_source": "airroi",
+        })
+
+    # New listings are inserted, already-scraped ones refreshed in place
+    written = BronzeSTRListing.upsert_batch(session, rows)
 
     session.commit()
-    return imported
+    return written
 
 
 # =============================================================================
@@ -209,8 +215,8 @@ def import_to_bronze(session: Session, listings: list[dict], city: str) -> int:
 
 def find_nearest_parcel(
     session: Session,
-    lat: Decimal,
-    lng: Decimal,
+    lat: float,
+    lng: float,
     max_distance_meters: float = 200.0
 ) -> tuple[str | None, float | None]:
     """Find the nearest parcel to a given lat/lng.
@@ -229,7 +235,7 @@ def find_nearest_parcel(
         WHERE lat IS NOT NULL AND lng IS NOT NULL
         ORDER BY (lat - :lat)^2 + (lng - :lng)^2
         LIMIT 1
-    """), {"lat": float(lat), "lng": float(lng)}).fetchone()
+    """), {"lat": lat, "lng": lng}).fetchone()
 
     if result and result[1] <= max_distance_meters:
         return str(result[0]), result[1]
@@ -237,112 +243,145 @@ def find_nearest_parcel(
 
 
 def transform_bronze_to_silver(session: Session) -> TransformationStats:
-    """Transform all unprocessed bronze STR records to silver."""
+    """Transform unprocessed and re-scraped bronze STR records to silver.
+
+    Bronze rows are streamed from a server-side cursor and transformed in
+    partitions of TRANSFORM_BATCH_SIZE, so memory stays bounded by the batch.
+    """
     stats = TransformationStats(source="bronze_str_listings")
 
-    # Get bronze records that haven't been transformed yet
-    subq = select(STRListing.bronze_id)
-    bronze_records = session.execute(
-        select(BronzeSTRListing).where(
-            ~BronzeSTRListing.id.in_(subq),
+    # Bronze records not transformed yet, or re-scraped since their silver row
+    pending = session.execute(
+        select(BronzeSTRListing, STRListing.id)
+        .outerjoin(STRListing, STRListing.bronze_id == BronzeSTRListing.id)
+        .where(
+            STRListing.id.is_(None)
+            | (BronzeSTRListing.scraped_at > STRListing.validated_at),
             BronzeSTRListing.api_source == "airroi"  # Only AirROI records
         )
-    ).scalars().all()
-
-    print(f"  Processing {len(bronze_records)} bronze records...")
+        .execution_options(yield_per=TRANSFORM_BATCH_SIZE)
+    )
 
-    for bronze in bronze_records:
-        stats.records_processed += 1
-
-        try:
-            # Convert SQLAlchemy model to Pydantic input
-            bronze_input = STRBronzeInput(
-                id=bronze.id,
-                platform=bronze.platform,
-                listing_id=bronze.listing_id,
-                listing_url=bronze.listing_url,
-                name=bronze.name,
-                property_type=bronze.property_type,
-                room_type=bronze.room_type,
-                address=bronze.address,
-                city=bronze.city,
-                state=bronze.state,
-                zip_code=bronze.zip_code,
-                lat=bronze.lat,
-                lng=bronze.lng,
-                bedrooms=bronze.bedrooms,
-                bathrooms=bronze.bathrooms,
-                max_guests=bronze.max_guests,
-                price_per_night=bronze.price_per_night,
-                currency=bronze.currency,
-                host_name=bronze.host_name,
-                host_id=bronze.host_id,
-                is_superhost=bronze.is_superhost,
-                total_reviews=bronze.total_reviews,
-                average_rating=bronze.average_rating,
-                first_review_date=bronze.first_review_date,
-                last_review_date=bronze.last_review_date,
-                scraped_at=bronze.scraped_at,
-            )
-
-            # Try to match to parcel via spatial centroid
-            parcel_id = None
-            match_method = None
-            match_confidence = None
-
-            if bronze.lat and bronze.lng:
-                parcel_id, distance = find_nearest_parcel(session, bronze.lat, bronze.lng)
-                if parcel_id:
-                    match_method = "spatial_centroid"
-                    # Confidence based on distance (0m = 1.0, 200m = 0.5)
-                    match_confidence = max(0.5, 1.0 - (distance / 400.0))
-                    stats.records_with_parcel_match += 1
-                else:
-                    stats.records_without_parcel_match += 1
-            else:
-                stats.records_without_parcel_match += 1
-
-            # Transform with Pydantic validation
-            silver = STRSilverOutput.from_bronze(
-                bronze_input,
-                parcel_id=parcel_id,
-                match_method=match_method,
-                match_confidence=match_confidence,
-            )
-
-            # Create silver record
-            str_listing = STRListing(
-                bronze_id=silver.bronze_id,
-                parcel_id=silver.parcel_id,
-                match_method=silver.match_method,
-                match_confidence=silver.match_confidence,
-                platform=silver.platform,
-                listing_id=silver.listing_id,
-                listing_url=silver.listing_url,
-                name=silver.name,
-                property_type=silver.property_type,
-                lat=silver.lat,
-                lng=silver.lng,
-                bedrooms=silver.bedrooms,
-                max_guests=silver.max_guests,
-                price_per_night_usd=silver.price_per_night_usd,
-                total_reviews=silver.total_reviews,
-                average_rating=silver.average_rating,
-                is_active=silver.is_active,
-                validated_at=datetime.utcnow(),
-            )
-
-            session.add(str_listing)
-            stats.records_valid += 1
-
-        except Exception as e:
-            stats.validation_errors.append(f"Listing {bronze.listing_id}: {str(e)}")
-            stats.records_skipped += 1
+    for rows in pending.partitions():
+        transform_batch(session, rows, stats)
+        session.flush()
+        session.expunge_all()  # Keep the identity map bounded
+        print(f"  Processed {stats.records_processed} bronze records...")
 
     session.commit()
     return stats
 
 
+def record_validation_failures(
+    records: list[BronzeSTRListing], error: ValidationError, stats: TransformationStats
+) -> set[int]:
+    """Report the rows of a failed batch validation. Returns their indexes."""
+    failed: dict[int, str] = {}
+    for detail in error.errors():
+        index, *field = detail["loc"]
+        failed.setdefault(index, f"{'.'.join(map(str, field))}: {detail['msg']}")
+    for index, message in sorted(failed.items()):
+        stats.add_error(f"Listing {records[index].listing_id}: {message}")
+    stats.records_skipped += len(failed)
+    return set(failed)
+
+
+def transform_batch(
+    session: Session,
+    rows: list[tuple[BronzeSTRListing, uuid.UUID | None]],
+    stats: TransformationStats,
+) -> None:
+    """Transform one partition of bronze records into pending silver rows.
+
+    Each row pairs a bronze record with the id of its existing silver row, if
+    any; those silver rows are refreshed in place, keeping the id that
+    str_review_status points at.
+    """
+    bronze_records = [bronze for bronze, _ in rows]
+    silver_ids = {bronze.id: silver_id for bronze, silver_id in rows if silver_id}
+    stats.records_processed += len(bronze_records)
+
+    # Convert SQLAlchemy models to Pydantic inputs in one batch; rows that
+    # fail validation are reported and dropped from the batch
+    try:
+        bronze_inputs = STR_BRONZE_LIST_ADAPTER.validate_python(
+            bronze_records, from_attributes=True
+        )
+    except ValidationError as e:
+        failed = record_validation_failures(bronze_records, e, stats)
+        bronze_records = [r for i, r in enumerate(bronze_records) if i not in failed]
+        bronze_inputs = STR_BRONZE_LIST_ADAPTER.validate_python(
+            bronze_records, from_attributes=True
+        )
+
+    # Try to match each listing to a parcel via spatial centroid
+    matches = []
+    for bronze in bronze_records:
+        parcel_id = None
+        match_method = None
+        match_confidence = None
+
+        if bronze.lat and bronze.lng:
+            parcel_id, distance = find_nearest_parcel(session, bronze.lat, bronze.lng)
+            if parcel_id:
+                match_method = "spatial_centroid"
+                # Confidence based on distance (0m = 1.0, 200m = 0.5)
+                match_confidence = max(0.5, 1.0 - (distance / 400.0))
+
+        matches.append((parcel_id, match_method, match_confidence))
+
+    # Transform the whole batch with one Pydantic validation call
+    try:
+        silvers = STRSilverOutput.from_bronze_batch(bronze_inputs, matches)
+    except ValidationError as e:
+        failed = record_validation_failures(bronze_records, e, stats)
+        keep = [i for i in range(len(bronze_records)) if i not in failed]
+        silvers = STRSilverOutput.from_bronze_batch(
+            [bronze_inputs[i] for i in keep], [matches[i] for i in keep]
+        )
+
+    refreshed: list[dict] = []
+    for silver in silvers:
+        if silver.parcel_id:
+            stats.records_with_parcel_match += 1
+        else:
+            stats.records_without_parcel_match += 1
+
+        values = {
+            "bronze_id": silver.bronze_id,
+            "parcel_id": silver.parcel_id,
+            "match_method": silver.match_method,
+            "match_confidence": silver.match_confidence,
+            "platform": silver.platform,
+            "listing_id": silver.listing_id,
+            "listing_url": silver.listing_url,
+            "name": silver.name,
+            "property_type": silver.property_type,
+            "lat": silver.lat,
+            "lng": silver.lng,
+            "bedrooms": silver.bedrooms,
+            "max_guests": silver.max_guests,
+            "price_per_night_usd": silver.price_per_night_usd,
+            "total_reviews": silver.total_reviews,
+            "average_rating": silver.average_rating,
+            "is_active": silver.is_active,
+        }
+        silver_id = silver_ids.get(silver.bronze_id)
+        if silver_id:
+            refreshed.append({**values, "id": silver_id})
+        else:
+            session.add(STRListing(**values))
+    stats.records_valid += len(silvers)
+
+    if refreshed:
+        session.execute(update(STRListing), refreshed)
+        session.execute(
+            update(STRListing)
+            .where(STRListing.id.in_([row["id"] for row in refreshed]))
+            .values(validated_at=func.now(), last_seen_at=func.now())
+        )
+
+
 # =============================================================================
 # Statistics
 # =============================================================================
@@ -418,7 +457,9 @@ def main():
     parser.add_argument("--transform", action="store_true", help="Transform bronze → silver")
     parser.add_argument("--all", action="store_true", help="Full pipeline")
     parser.add_argument("--stats", action="store_true", help="Show statistics")
-    parser.add_argument("--towns", action="store_true", help="Fetch all MRV towns (not just Warren)")
+    parser.add_argument(
+        "--towns", action="store_true", help="Fetch all MRV towns (not just Warren)"
+    )
     parser.add_argument("--city", default="Warren", help="City to fetch (default: Warren)")
     args = parser.parse_args()
 
@@ -428,20 +469,21 @@ def main():
 
     # Create tables if they don't exist
     print("Creating tables if needed...")
-    Base.metadata.create_all(engine)
+    init_db()
 
     with Session(engine) as session:
         if args.fetch or args.all:
             towns = MRV_TOWNS if args.towns else [args.city]
 
-            for town in towns:
-                print(f"\n=== Fetching AirROI listings for {town} ===")
-                listings = fetch_all_listings(town)
-                print(f"Fetched {len(listings)} listings")
+            print(f"\n=== Fetching AirROI listings for {', '.join(towns)} ===")
+            listings_by_town = fetch_towns(towns)
+
+            for town, listings in listings_by_town.items():
+                print(f"Fetched {len(listings)} listings for {town}")
 
                 print(f"\n=== Importing to bronze layer ===")
                 imported = import_to_bronze(session, listings, town)
-                print(f"Imported {imported} new records to bronze")
+                print(f"Upserted {imported} records to bronze")
 
         if args.transform or args.all:
             print("\n=== Transforming bronze → silver ===")
@@ -452,7 +494,7 @@ def main():
             print(f"Matched to parcel: {stats.records_with_parcel_match}")
             print(f"No parcel match: {stats.records_without_parcel_match}")
             if stats.validation_errors:
-                print(f"Errors ({len(stats.validation_errors)}):")
+                print(f"Errors ({stats.error_count}):")
                 for err in stats.validation_errors[:5]:
                     print(f"  - {err}")
 
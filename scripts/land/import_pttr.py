@@ -14,31 +14,30 @@ Usage:
 """
 
 import argparse
-import json
+import asyncio
 import sys
-import urllib.request
-import urllib.parse
 from datetime import datetime
 from pathlib import Path
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import httpx
 from sqlalchemy import create_engine, func, select, text
 from sqlalchemy.orm import Session
 
-from src.database import engine
+from src.database import engine, init_db
 from src.models import (
-    Base,
-    Parcel,
     BronzePTTRTransfer,
     PropertyTransfer,
+    copy_rows,
+    encode_raw_json,
+    uuid7,
 )
 from src.transformations import (
-    PTTRBronzeInput,
-    PTTRSilverOutput,
+    INTENDED_USE_MAP,
+    STATE_CODES,
     TransformationStats,
-    match_by_span,
 )
 
 
@@ -75,57 +74,72 @@ PTTR_FIELDS = [
     "Longitude",
 ]
 
+# Records per request; the feature service caps pages at 1000
+PAGE_SIZE = 1000
+
+# Pages fetched concurrently
+MAX_CONCURRENT_REQUESTS = 8
+
 
 # =============================================================================
 # API Fetching
 # =============================================================================
 
 
-def fetch_pttr_page(
+async def fetch_pttr_count(client: httpx.AsyncClient, where: str) -> int:
+    """Count the PTTR records matching the query."""
+    response = await client.get(
+        f"{PTTR_API_BASE}/query",
+        params={"where": where, "returnCountOnly": "true", "f": "json"},
+    )
+    response.raise_for_status()
+    return response.json()["count"]
+
+
+async def fetch_pttr_page(
+    client: httpx.AsyncClient,
     where: str = "TOWNNAME = 'Warren'",
     offset: int = 0,
-    limit: int = 1000,
+    limit: int = PAGE_SIZE,
 ) -> dict:
     """Fetch a page of PTTR records from the ArcGIS API."""
     params = {
         "where": where,
         "outFields": ",".join(PTTR_FIELDS),
         "returnGeometry": "true",
+        "orderByFields": "OBJECTID",  # Stable paging across concurrent requests
         "resultOffset": str(offset),
         "resultRecordCount": str(limit),
         "f": "json",
     }
 
-    url = f"{PTTR_API_BASE}/query?{urllib.parse.urlencode(params)}"
     print(f"  Fetching: offset={offset}, limit={limit}")
-
-    with urllib.request.urlopen(url, timeout=30) as response:
-        return json.loads(response.read().decode())
+    response = await client.get(f"{PTTR_API_BASE}/query", params=params)
+    response.raise_for_status()
+    return response.json()
 
 
-def fetch_all_pttr(where: str = "TOWNNAME = 'Warren'") -> list[dict]:
-    """Fetch all PTTR records matching the query."""
-    all_features = []
-    offset = 0
-    limit = 1000
+async def fetch_all_pttr_async(where: str = "TOWNNAME = 'Warren'") -> list[dict]:
+    """Fetch all PTTR records matching the query, MAX_CONCURRENT_REQUESTS pages at a time."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-    while True:
-        data = fetch_pttr_page(where=where, offset=offset, limit=limit)
-        features = data.get("features", [])
+    async with httpx.AsyncClient(timeout=30.0) as client:
+        async def fetch(offset: int) -> list[dict]:
+            async with semaphore:
+                data = await fetch_pttr_page(client, where=where, offset=offset)
+            return data.get("features", [])
 
-        if not features:
-            break
+        total = await fetch_pttr_count(client, where)
+        pages = await asyncio.gather(*(fetch(offset) for offset in range(0, total, PAGE_SIZE)))
 
-        all_features.extend(features)
-        print(f"  Fetched {len(all_features)} total records...")
-
-        # Check if there are more records
-        if len(features) < limit:
-            break
+    all_features = [feature for page in pages for feature in page]
+    print(f"  Fetched {len(all_features)} total records...")
+    return all_features
 
-        offset += limit
 
-    return all_features
+def fetch_all_pttr(where: str = "TOWNNAME = 'Warren'") -> list[dict]:
+    """Fetch all PTTR records matching the query."""
+    return asyncio.run(fetch_all_pttr_async(where))
 
 
 # =============================================================================
@@ -135,26 +149,21 @@ def fetch_all_pttr(where: str = "TOWNNAME = 'Warren'") -> list[dict]:
 
 def import_to_bronze(session: Session, features: list[dict]) -> int:
     """Import raw PTTR features to bronze table."""
-    imported = 0
     skipped = 0
+    rows: list[dict] = []
+
+    # One query for the known OBJECTIDs instead of a SELECT per feature
+    seen = set(session.scalars(select(BronzePTTRTransfer.objectid)))
 
     for feature in features:
         attrs = feature.get("attributes", {})
         geom = feature.get("geometry", {})
 
         objectid = attrs.get("OBJECTID")
-        if not objectid:
-            skipped += 1
-            continue
-
-        # Check if already exists
-        existing = session.execute(
-            select(BronzePTTRTransfer).where(BronzePTTRTransfer.objectid == objectid)
-        ).scalar_one_or_none()
-
-        if existing:
+        if not objectid or objectid in seen:
             skipped += 1
             continue
+        seen.add(objectid)
 
         # Parse transfer date (ArcGIS uses epoch milliseconds)
         transfer_date = None
@@ -186,34 +195,35 @@ def import_to_bronze(session: Session, features: list[dict]) -> int:
         if sale_price:
             sale_price = int(sale_price)
 
-        # Create bronze record
-        record = BronzePTTRTransfer(
-            objectid=objectid,
-            globalid=None,  # Not in this API
-            span=span,
-            property_address=attrs.get("propLocStr"),
-            town=attrs.get("TOWNNAME") or attrs.get("propLocCty"),
-            sale_price=sale_price,
-            transfer_date=transfer_date,
-            transfer_type=None,  # Not directly available
-            buyer_name=buyer_name or None,
-            buyer_state=attrs.get("buyerState"),
-            buyer_zip=attrs.get("buyerZip"),
-            seller_name=seller_name or None,
-            intended_use=attrs.get("bUsePrDesc"),
-            property_type_code=attrs.get("intPrpType"),
-            lat=attrs.get("Latitude"),
-            lng=attrs.get("Longitude"),
-            raw_json=json.dumps(feature),
-            fetched_at=datetime.utcnow(),
-            api_source="vcgi_pttr_arcgis_online",
-        )
-
-        session.add(record)
-        imported += 1
+        # Bronze row; COPY skips Python defaults, so id is generated here
+        rows.append({
+            "id": uuid7(),
+            "objectid": objectid,
+            "globalid": None,  # Not in this API
+            "span": span,
+            "property_address": attrs.get("propLocStr"),
+            "town": attrs.get("TOWNNAME") or attrs.get("propLocCty"),
+            "sale_price": sale_price,
+            "transfer_date": transfer_date,
+            "transfer_type": None,  # Not directly available
+            "buyer_name": buyer_name or None,
+            "buyer_state": attrs.get("buyerState"),
+            "buyer_zip": attrs.get("buyerZip"),
+            "seller_name": seller_name or None,
+            "intended_use": attrs.get("bUsePrDesc"),
+            "property_type_code": attrs.get("intPrpType"),
+            "lat": attrs.get("Latitude"),
+            "lng": attrs.get("Longitude"),
+            "raw_json": encode_raw_json(feature),
+            "api_source": "vcgi_pttr_arcgis_online",
+        })
+
+    # Bronze rows have no relationships to maintain, so skip INSERT for COPY
+    if rows:
+        copy_rows(session, "bronze_pttr_transfers", list(rows[0]), (row.values() for row in rows))
 
     session.commit()
-    return imported
+    return len(rows)
 
 
 # =============================================================================
@@ -221,103 +231,88 @@ def import_to_bronze(session: Session, features: list[dict]) -> int:
 # =============================================================================
 
 
-def build_span_lookup(session: Session) -> dict[str, str]:
-    """Build SPAN → parcel_id lookup dictionary."""
-    result = session.execute(select(Parcel.span, Parcel.id))
-    # Normalize SPANs for matching
-    return {
-        row.span.strip().upper().replace("-", "").replace(" ", ""): str(row.id)
-        for row in result
-        if row.span
-    }
+# Set-based bronze → silver transform. Mirrors PTTRSilverOutput.from_bronze:
+# the state and intended-use lookups are passed in from src.transformations,
+# SPANs are matched after stripping dashes and spaces, and rows missing a
+# SPAN, a positive sale price or transfer date are left in bronze.
+SILVER_TRANSFORM_SQL = text("""
+    WITH states (raw, code) AS (
+        SELECT * FROM unnest(CAST(:state_keys AS text[]), CAST(:state_codes AS text[]))
+    ),
+    uses (raw, category) AS (
+        SELECT * FROM unnest(CAST(:use_keys AS text[]), CAST(:use_categories AS text[]))
+    ),
+    parcel_spans AS (
+        SELECT DISTINCT ON (span_key) translate(upper(trim(span)), '- ', '') AS span_key, id
+        FROM parcels
+        WHERE span IS NOT NULL AND span <> ''
+        ORDER BY span_key, id
+    ),
+    pending AS (
+        SELECT
+            b.id AS bronze_id,
+            p.id AS parcel_id,
+            trim(b.span) AS span,
+            b.sale_price,
+            b.transfer_date,
+            b.transfer_type,
+            b.buyer_name,
+            COALESCE(s.code, CASE
+                WHEN upper(trim(b.buyer_state)) ~ '^[A-Z]{2}$' THEN upper(trim(b.buyer_state))
+            END) AS buyer_state,
+            b.seller_name,
+            CASE WHEN b.intended_use <> '' THEN COALESCE(u.category, 'other') END AS intended_use,
+            CASE WHEN b.sale_price > 10000000
+                THEN 'Unusually high sale price: $' || to_char(b.sale_price, 'FM999,999,999,999')
+            END AS validation_notes
+        FROM bronze_pttr_transfers b
+        LEFT JOIN states s ON s.raw = upper(trim(b.buyer_state))
+        LEFT JOIN uses u ON u.raw = upper(trim(b.intended_use))
+        LEFT JOIN parcel_spans p ON p.span_key = translate(upper(trim(b.span)), '- ', '')
+        WHERE NOT EXISTS (SELECT 1 FROM property_transfers pt WHERE pt.bronze_id = b.id)
+          AND trim(b.span) <> ''
+          AND b.sale_price > 0
+          AND b.transfer_date IS NOT NULL
+    )
+    INSERT INTO property_transfers (
+        id, bronze_id, parcel_id, span, sale_price, transfer_date, transfer_type,
+        buyer_name, buyer_state, is_out_of_state_buyer, seller_name, intended_use,
+        is_primary_residence, is_secondary_residence, validation_notes
+    )
+    SELECT
+        uuid7(), bronze_id, parcel_id, span, sale_price, transfer_date, transfer_type,
+        buyer_name, buyer_state, COALESCE(buyer_state <> 'VT', false), seller_name, intended_use,
+        intended_use = 'primary', intended_use = 'secondary', validation_notes
+    FROM pending
+    RETURNING parcel_id IS NOT NULL AS matched
+""")
 
 
 def transform_bronze_to_silver(session: Session) -> TransformationStats:
-    """Transform all unprocessed bronze records to silver."""
+    """Transform all unprocessed bronze records to silver in one statement."""
     stats = TransformationStats(source="bronze_pttr_transfers")
 
-    # Build parcel lookup
-    print("  Building SPAN → parcel lookup...")
-    span_lookup = build_span_lookup(session)
-    print(f"  Found {len(span_lookup)} parcels with SPANs")
-
-    # Get bronze records that haven't been transformed yet
-    # (no corresponding silver record with same bronze_id)
-    subq = select(PropertyTransfer.bronze_id)
-    bronze_records = session.execute(
-        select(BronzePTTRTransfer).where(
-            ~BronzePTTRTransfer.id.in_(subq)
+    # Bronze records that haven't been transformed yet (no silver row with same bronze_id)
+    stats.records_processed = session.scalar(
+        select(func.count(BronzePTTRTransfer.id)).where(
+            ~select(PropertyTransfer.id)
+            .where(PropertyTransfer.bronze_id == BronzePTTRTransfer.id)
+            .exists()
         )
-    ).scalars().all()
-
-    print(f"  Processing {len(bronze_records)} bronze records...")
-
-    for bronze in bronze_records:
-        stats.records_processed += 1
-
-        try:
-            # Convert SQLAlchemy model to Pydantic input
-            bronze_input = PTTRBronzeInput(
-                id=bronze.id,
-                objectid=bronze.objectid,
-                span=bronze.span,
-                property_address=bronze.property_address,
-                town=bronze.town,
-                sale_price=bronze.sale_price,
-                transfer_date=bronze.transfer_date,
-                transfer_type=bronze.transfer_type,
-                buyer_name=bronze.buyer_name,
-                buyer_state=bronze.buyer_state,
-                buyer_zip=bronze.buyer_zip,
-                seller_name=bronze.seller_name,
-                intended_use=bronze.intended_use,
-                property_type_code=bronze.property_type_code,
-                lat=bronze.lat,
-                lng=bronze.lng,
-            )
-
-            # Try to match to parcel
-            parcel_id = None
-            if bronze.span:
-                match = match_by_span(bronze.span, span_lookup)
-                if match.parcel_id:
-                    parcel_id = match.parcel_id
-                    stats.records_with_parcel_match += 1
-                else:
-                    stats.records_without_parcel_match += 1
-
-            # Transform with Pydantic validation
-            silver = PTTRSilverOutput.from_bronze(bronze_input, parcel_id)
-
-            if silver is None:
-                stats.records_skipped += 1
-                continue
-
-            # Create silver record
-            transfer = PropertyTransfer(
-                bronze_id=silver.bronze_id,
-                parcel_id=silver.parcel_id,
-                span=silver.span,
-                sale_price=silver.sale_price,
-                transfer_date=silver.transfer_date,
-                transfer_type=silver.transfer_type,
-                buyer_name=silver.buyer_name,
-                buyer_state=silver.buyer_state,
-                is_out_of_state_buyer=silver.is_out_of_state_buyer,
-                seller_name=silver.seller_name,
-                intended_use=silver.intended_use,
-                is_primary_residence=silver.is_primary_residence,
-                is_secondary_residence=silver.is_secondary_residence,
-                validated_at=datetime.utcnow(),
-                validation_notes=silver.validation_notes,
-            )
-
-            session.add(transfer)
-            stats.records_valid += 1
-
-        except Exception as e:
-            stats.validation_errors.append(f"Record {bronze.objectid}: {str(e)}")
-            stats.records_skipped += 1
+    )
+    print(f"  Processing {stats.records_processed} bronze records...")
+
+    matched = session.execute(SILVER_TRANSFORM_SQL, {
+        "state_keys": list(STATE_CODES),
+        "state_codes": list(STATE_CODES.values()),
+        "use_keys": list(INTENDED_USE_MAP),
+        "use_categories": list(INTENDED_USE_MAP.values()),
+    }).scalars().all()
+
+    stats.records_valid = len(matched)
+    stats.records_skipped = stats.records_processed - stats.records_valid
+    stats.records_with_parcel_match = sum(matched)
+    stats.records_without_parcel_match = stats.records_valid - stats.records_with_parcel_match
 
     session.commit()
     return stats
@@ -341,10 +336,14 @@ def print_stats(session: Session):
         select(func.count(PropertyTransfer.id)).where(PropertyTransfer.parcel_id.isnot(None))
     )
     out_of_state = session.scalar(
-        select(func.count(PropertyTransfer.id)).where(PropertyTransfer.is_out_of_state_buyer == True)
+        select(func.count(PropertyTransfer.id)).where(
+            PropertyTransfer.is_out_of_state_buyer.is_(True)
+        )
     )
     secondary = session.scalar(
-        select(func.count(PropertyTransfer.id)).where(PropertyTransfer.is_secondary_residence == True)
+        select(func.count(PropertyTransfer.id)).where(
+            PropertyTransfer.is_secondary_residence.is_(True)
+        )
     )
 
     print(f"\n=== Silver Layer: property_transfers ===")
@@ -399,7 +398,7 @@ def main():
 
     # Create tables if they don't exist
     print("Creating tables if needed...")
-    Base.metadata.create_all(engine)
+    init_db()
 
     with Session(engine) as session:
         if args.fetch or args.all:
@@ -420,7 +419,7 @@ def main():
             print(f"Matched to parcel: {stats.records_with_parcel_match}")
             print(f"No parcel match: {stats.records_without_parcel_match}")
             if stats.validation_errors:
-                print(f"Errors ({len(stats.validation_errors)}):")
+                print(f"Errors ({stats.error_count}):")
                 for err in stats.validation_errors[:5]:
                     print(f"  - {err}")
 
@@ -3,7 +3,7 @@
 This script implements the bronze → silver data pipeline for STR data:
 1. Read JSON output from Apify scraper runs (Airbnb/VRBO)
 2. Store in bronze_str_listings table (raw, unmodified)
-3. Match to parcels via spatial join (PostGIS ST_Contains)
+3. Match to parcels via spatial join (geohash-bucketed PostGIS ST_Covers)
 4. Store in str_listings table (silver, linked to parcels)
 
 Usage:
@@ -21,6 +21,7 @@ Search for listings in Warren/Mad River Valley area and download results as JSON
 import argparse
 import json
 import sys
+import uuid
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
@@ -29,22 +30,27 @@ from typing import Any
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from sqlalchemy import create_engine, func, select, text
+from sqlalchemy import bindparam, create_engine, func, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Session
 
-from src.database import engine
+from src.database import engine, init_db
 from src.models import (
-    Base,
     Parcel,
     BronzeSTRListing,
     STRListing,
+    uuid7,
 )
 from src.transformations import (
     STRBronzeInput,
     STRSilverOutput,
     TransformationStats,
+    str_active_since,
 )
 
+# Bronze rows streamed per transform partition
+TRANSFORM_BATCH_SIZE = 5000
+
 
 # =============================================================================
 # JSON Parsing - Handle different scraper output formats
@@ -66,8 +72,12 @@ def parse_airbnb_listing(data: dict) -> dict:
         "city": data.get("city") or data.get("location", {}).get("city"),
         "state": data.get("state") or data.get("location", {}).get("state"),
         "zip_code": data.get("zipcode") or data.get("zip_code"),
-        "lat": data.get("lat") or data.get("latitude") or (data.get("location", {}) or {}).get("lat"),
-        "lng": data.get("lng") or data.get("longitude") or (data.get("location", {}) or {}).get("lng"),
+        "lat": (
+            data.get("lat") or data.get("latitude") or (data.get("location", {}) or {}).get("lat")
+        ),
+        "lng": (
+            data.get("lng") or data.get("longitude") or (data.get("location", {}) or {}).get("lng")
+        ),
         "bedrooms": data.get("bedrooms") or data.get("bedroomCount"),
         "bathrooms": data.get("bathrooms") or data.get("bathroomCount"),
         "max_guests": data.get("guests") or data.get("personCapacity") or data.get("maxGuests"),
@@ -159,8 +169,8 @@ def import_json_to_bronze(session: Session, json_file: Path, scraper_run_id: str
     else:
         listings = data
 
-    imported = 0
     skipped = 0
+    rows: list[dict] = []
 
     for item in listings:
         parsed = parse_listing(item)
@@ -175,19 +185,6 @@ def import_json_to_bronze(session: Session, json_file: Path, scraper_run_id: str
             skipped += 1
             continue
 
-        # Check if already exists
-        existing = session.execute(
-            select(BronzeSTRListing).where(
-                BronzeSTRListing.platform == platform,
-                BronzeSTRListing.listing_id == listing_id,
-            )
-        ).scalar_one_or_none()
-
-        if existing:
-            # Update last_seen
-            skipped += 1
-            continue
-
         # Parse price
         price = parsed.get("price_per_night")
         if price and isinstance(price, str):
@@ -195,41 +192,40 @@ def import_json_to_bronze(session: Session, json_file: Path, scraper_run_id: str
         elif price:
             price = float(price)
 
-        record = BronzeSTRListing(
-            platform=platform,
-            listing_id=listing_id,
-            listing_url=parsed.get("listing_url"),
-            name=parsed.get("name"),
-            property_type=parsed.get("property_type"),
-            room_type=parsed.get("room_type"),
-            address=parsed.get("address"),
-            city=parsed.get("city"),
-            state=parsed.get("state"),
-            zip_code=parsed.get("zip_code"),
-            lat=Decimal(str(parsed["lat"])) if parsed.get("lat") else None,
-            lng=Decimal(str(parsed["lng"])) if parsed.get("lng") else None,
-            bedrooms=parsed.get("bedrooms"),
-            bathrooms=Decimal(str(parsed["bathrooms"])) if parsed.get("bathrooms") else None,
-            max_guests=parsed.get("max_guests"),
-            price_per_night=Decimal(str(price)) if price else None,
-            currency=parsed.get("currency", "USD"),
-            host_name=parsed.get("host_name"),
-            host_id=parsed.get("host_id"),
-            is_superhost=parsed.get("is_superhost"),
-            total_reviews=parsed.get("total_reviews"),
-            average_rating=Decimal(str(parsed["average_rating"])) if parsed.get("average_rating") else None,
-            first_review_date=None,
-            last_review_date=None,
-            raw_json=json.dumps(parsed["raw_json"]),
-            scraped_at=datetime.utcnow(),
-            scraper_run_id=scraper_run_id,
-        )
-
-        session.add(record)
-        imported += 1
+        rows.append({
+            "platform": platform,
+            "listing_id": listing_id,
+            "listing_url": parsed.get("listing_url"),
+            "name": parsed.get("name"),
+            "property_type": parsed.get("property_type"),
+            "room_type": parsed.get("room_type"),
+            "address": parsed.get("address"),
+            "city": parsed.get("city"),
+            "state": parsed.get("state"),
+            "zip_code": parsed.get("zip_code"),
+            "lat": float(parsed["lat"]) if parsed.get("lat") else None,
+            "lng": float(parsed["lng"]) if parsed.get("lng") else None,
+            "bedrooms": parsed.get("bedrooms"),
+            "bathrooms": Decimal(str(parsed["bathrooms"])) if parsed.get("bathrooms") else None,
+            "max_guests": parsed.get("max_guests"),
+            "price_per_night": Decimal(str(price)) if price else None,
+            "currency": parsed.get("currency", "USD"),
+            "host_name": parsed.get("host_name"),
+            "host_id": parsed.get("host_id"),
+            "is_superhost": parsed.get("is_superhost"),
+            "total_reviews": parsed.get("total_reviews"),
+            "average_rating": Decimal(str(parsed["average_rating"])) if parsed.get("average_rating") else None,
+            "first_review_date": None,
+            "last_review_date": None,
+            "raw_json": parsed["raw_json"],
+            "scraper_run_id": scraper_run_id,
+        })
+
+    # New listings are inserted, already-scraped ones refreshed in place
+    written = BronzeSTRListing.upsert_batch(session, rows)
 
     session.commit()
-    return imported
+    return written
 
 
 # =============================================================================
@@ -237,126 +233,206 @@ def import_json_to_bronze(session: Session, json_file: Path, scraper_run_id: str
 # =============================================================================
 
 
-def match_listing_to_parcel(session: Session, lat: float, lng: float) -> tuple[str | None, str | None, float | None]:
-    """Match a coordinate to a parcel using PostGIS spatial functions.
-
-    First tries ST_Contains with parcel geometry polygons.
+# Geohash-8 cells are a regular lon/lat grid of 2^20 x 2^20 cells
+GEOHASH8_LNG_STEP = 360 / 2**20
+GEOHASH8_LAT_STEP = 180 / 2**20
+
+# Enumerate the grid cells over each parcel's bounding box and keep those the
+# polygon touches. Only parcels without cells are expanded; a trigger clears
+# a parcel's cells when its geometry changes.
+PARCEL_GEOHASH_COVER_SQL = text(f"""
+    INSERT INTO parcel_geohash_cells (geohash8, parcel_id)
+    SELECT ST_GeoHash(ST_Centroid(cell.env), 8), p.id
+    FROM parcels p
+    CROSS JOIN LATERAL generate_series(
+        floor((ST_XMin(p.geometry) + 180) / {GEOHASH8_LNG_STEP})::int,
+        floor((ST_XMax(p.geometry) + 180) / {GEOHASH8_LNG_STEP})::int
+    ) AS i
+    CROSS JOIN LATERAL generate_series(
+        floor((ST_YMin(p.geometry) + 90) / {GEOHASH8_LAT_STEP})::int,
+        floor((ST_YMax(p.geometry) + 90) / {GEOHASH8_LAT_STEP})::int
+    ) AS j
+    CROSS JOIN LATERAL (
+        SELECT ST_MakeEnvelope(
+            -180 + i * {GEOHASH8_LNG_STEP}, -90 + j * {GEOHASH8_LAT_STEP},
+            -180 + (i + 1) * {GEOHASH8_LNG_STEP}, -90 + (j + 1) * {GEOHASH8_LAT_STEP},
+            4326
+        ) AS env
+    ) cell
+    WHERE p.geometry IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM parcel_geohash_cells c WHERE c.parcel_id = p.id)
+      AND ST_Intersects(p.geometry, cell.env)
+    ON CONFLICT DO NOTHING
+""")
+
+# Polygon match: index lookup of the listing's geohash cell, then the exact
+# predicate on the few candidate parcels sharing it
+POLYGON_MATCH_SQL = text("""
+    UPDATE str_listings s
+    SET parcel_id = m.parcel_id,
+        match_method = 'spatial',
+        match_confidence = 0.95
+    FROM (
+        SELECT DISTINCT ON (s.id) s.id, p.id AS parcel_id
+        FROM str_listings s
+        JOIN parcel_geohash_cells c ON c.geohash8 = s.geohash8
+        JOIN parcels p ON p.id = c.parcel_id
+        WHERE s.id = ANY(:ids)
+          AND ST_Covers(p.geometry, s.geom::geometry)
+        ORDER BY s.id, p.id
+    ) m
+    WHERE s.id = m.id
+""").bindparams(bindparam("ids", type_=ARRAY(UUID(as_uuid=True))))
+
+# Fallback for parcels without polygons: nearest parcel centroid within 200m.
+# Confidence decreases with distance: 0m = 0.95, 100m = 0.70, 200m = 0.45
+CENTROID_MATCH_SQL = text("""
+    UPDATE str_listings s
+    SET parcel_id = m.parcel_id,
+        match_method = 'spatial_centroid',
+        match_confidence = GREATEST(0.45, 0.95 - m.distance_m / 200)
+    FROM (
+        SELECT s.id, n.parcel_id, n.distance_m
+        FROM str_listings s
+        CROSS JOIN LATERAL (
+            SELECT p.id AS parcel_id,
+                ST_Distance(
+                    s.geom,
+                    ST_SetSRID(ST_MakePoint(p.lng::float, p.lat::float), 4326)::geography
+                ) AS distance_m
+            FROM parcels p
+            WHERE p.lat IS NOT NULL AND p.lng IS NOT NULL
+            ORDER BY distance_m
+            LIMIT 1
+        ) n
+        WHERE s.id = ANY(:ids)
+          AND s.parcel_id IS NULL
+          AND s.geom IS NOT NULL
+    ) m
+    WHERE s.id = m.id AND m.distance_m <= 200
+""").bindparams(bindparam("ids", type_=ARRAY(UUID(as_uuid=True))))
+
+
+def match_listings_to_parcels(session: Session, listing_ids: list[uuid.UUID]) -> int:
+    """Match silver listings to parcels using PostGIS spatial functions.
+
+    First tries the parcel geometry polygons, bucketed by geohash-8 cell.
     Falls back to point-to-point distance matching using parcel centroids.
+    Returns the number of listings matched.
     """
-    if not lat or not lng:
-        return None, None, None
-
-    # Try 1: Use ST_Contains if parcels have geometry polygons
-    result = session.execute(text("""
-        SELECT id, span
-        FROM parcels
-        WHERE geometry IS NOT NULL
-          AND ST_Contains(geometry, ST_SetSRID(ST_MakePoint(:lng, :lat), 4326))
-        LIMIT 1
-    """), {"lat": lat, "lng": lng}).fetchone()
-
-    if result:
-        return str(result.id), "spatial", 0.95  # High confidence for polygon match
-
-    # Try 2: Point-to-point distance matching using parcel lat/lng centroids
-    # This works when we have parcel coordinates but not full geometry
-    result = session.execute(text("""
-        SELECT id, span,
-            ST_Distance(
-                ST_SetSRID(ST_MakePoint(:lng, :lat), 4326)::geography,
-                ST_SetSRID(ST_MakePoint(lng::float, lat::float), 4326)::geography
-            ) as distance_m
-        FROM parcels
-        WHERE lat IS NOT NULL AND lng IS NOT NULL
-        ORDER BY distance_m
-        LIMIT 1
-    """), {"lat": lat, "lng": lng}).fetchone()
-
-    if result and result.distance_m <= 200:  # Within 200m threshold
-        # Confidence decreases with distance
-        # 0m = 0.95, 100m = 0.70, 200m = 0.45
-        confidence = max(0.45, 0.95 - (result.distance_m / 200))
-        return str(result.id), "spatial_centroid", confidence
-
-    return None, None, None
+    if not listing_ids:
+        return 0
+
+    session.execute(PARCEL_GEOHASH_COVER_SQL)
+    matched = session.execute(POLYGON_MATCH_SQL, {"ids": listing_ids}).rowcount
+    matched += session.execute(CENTROID_MATCH_SQL, {"ids": listing_ids}).rowcount
+    return matched
 
 
 def transform_bronze_to_silver(session: Session) -> TransformationStats:
-    """Transform all unprocessed bronze STR records to silver."""
+    """Transform unprocessed and re-scraped bronze STR records to silver.
+
+    Bronze rows are streamed from a server-side cursor and transformed in
+    partitions of TRANSFORM_BATCH_SIZE, so memory stays bounded by the batch.
+    """
     stats = TransformationStats(source="bronze_str_listings")
 
-    # Get bronze records that haven't been transformed yet
-    subq = select(STRListing.bronze_id)
-    bronze_records = session.execute(
-        select(BronzeSTRListing).where(
-            ~BronzeSTRListing.id.in_(subq)
+    # Bronze records not transformed yet, or re-scraped since their silver row
+    pending = session.execute(
+        select(BronzeSTRListing, STRListing.id)
+        .outerjoin(STRListing, STRListing.bronze_id == BronzeSTRListing.id)
+        .where(
+            STRListing.id.is_(None)
+            | (BronzeSTRListing.scraped_at > STRListing.validated_at)
         )
-    ).scalars().all()
+        .execution_options(yield_per=TRANSFORM_BATCH_SIZE)
+    )
+
+    for rows in pending.partitions():
+        transform_batch(session, rows, stats)
+        session.expunge_all()  # Keep the identity map bounded
+        print(f"  Processed {stats.records_processed} bronze STR listings...")
 
-    print(f"  Processing {len(bronze_records)} bronze STR listings...")
+    session.commit()
+    return stats
+
+
+def transform_batch(
+    session: Session,
+    rows: list[tuple[BronzeSTRListing, uuid.UUID | None]],
+    stats: TransformationStats,
+) -> None:
+    """Transform one partition of bronze records and match it to parcels.
 
-    for bronze in bronze_records:
+    Each row pairs a bronze record with the id of its existing silver row, if
+    any; those silver rows are refreshed in place (keeping their id, which
+    str_review_status points at) and re-matched.
+    """
+    listing_ids: list[uuid.UUID] = []
+    refreshed: list[dict] = []
+    # Active = reviewed in the last year; the clock is read once per batch
+    active_since = str_active_since(datetime.utcnow())
+
+    for bronze, silver_id in rows:
         stats.records_processed += 1
 
         try:
-            # Match to parcel via spatial join
-            parcel_id = None
-            match_method = None
-            match_confidence = None
-
-            if bronze.lat and bronze.lng:
-                parcel_id, match_method, match_confidence = match_listing_to_parcel(
-                    session, float(bronze.lat), float(bronze.lng)
-                )
-
-            if parcel_id:
-                stats.records_with_parcel_match += 1
-            else:
-                stats.records_without_parcel_match += 1
-
-            # Determine if active (reviews in last year)
             is_active = True
             if bronze.last_review_date:
-                days_since_review = (datetime.utcnow() - bronze.last_review_date).days
-                is_active = days_since_review < 365
+                is_active = bronze.last_review_date > active_since
 
             # Convert price to cents for precision
             price_cents = None
             if bronze.price_per_night:
                 price_cents = int(float(bronze.price_per_night) * 100)
 
-            # Create silver record
-            listing = STRListing(
-                bronze_id=bronze.id,
-                parcel_id=parcel_id,
-                match_method=match_method,
-                match_confidence=Decimal(str(match_confidence)) if match_confidence else None,
-                platform=bronze.platform,
-                listing_id=bronze.listing_id,
-                listing_url=bronze.listing_url,
-                name=bronze.name,
-                property_type=bronze.property_type,
-                lat=bronze.lat,
-                lng=bronze.lng,
-                bedrooms=bronze.bedrooms,
-                max_guests=bronze.max_guests,
-                price_per_night_usd=price_cents,
-                total_reviews=bronze.total_reviews,
-                average_rating=bronze.average_rating,
-                is_active=is_active,
-                validated_at=datetime.utcnow(),
-                last_seen_at=datetime.utcnow(),
-            )
-
-            session.add(listing)
+            values = {
+                "bronze_id": bronze.id,
+                "platform": bronze.platform,
+                "listing_id": bronze.listing_id,
+                "listing_url": bronze.listing_url,
+                "name": bronze.name,
+                "property_type": bronze.property_type,
+                "lat": bronze.lat,
+                "lng": bronze.lng,
+                "bedrooms": bronze.bedrooms,
+                "max_guests": bronze.max_guests,
+                "price_per_night_usd": price_cents,
+                "total_reviews": bronze.total_reviews,
+                "average_rating": bronze.average_rating,
+                "is_active": is_active,
+            }
+
+            if silver_id:
+                # Refresh the silver row; its parcel match is redone below
+                refreshed.append({
+                    **values, "id": silver_id,
+                    "parcel_id": None, "match_method": None, "match_confidence": None,
+                })
+                listing_ids.append(silver_id)
+            else:
+                listing = STRListing(id=uuid7(), **values)
+                session.add(listing)
+                listing_ids.append(listing.id)
             stats.records_valid += 1
 
         except Exception as e:
-            stats.validation_errors.append(f"Listing {bronze.listing_id}: {str(e)}")
+            stats.add_error(f"Listing {bronze.listing_id}: {str(e)}")
             stats.records_skipped += 1
 
-    session.commit()
-    return stats
+    if refreshed:
+        session.execute(update(STRListing), refreshed)
+        session.execute(
+            update(STRListing)
+            .where(STRListing.id.in_([row["id"] for row in refreshed]))
+            .values(validated_at=func.now(), last_seen_at=func.now())
+        )
+
+    # Match the whole batch to parcels in two set-based statements
+    session.flush()
+    matched = match_listings_to_parcels(session, listing_ids)
+    stats.records_with_parcel_match += matched
+    stats.records_without_parcel_match += len(listing_ids) - matched
 
 
 # =============================================================================
@@ -432,7 +508,7 @@ def main():
 
     # Create tables if they don't exist
     print("Creating tables if needed...")
-    Base.metadata.create_all(engine)
+    init_db()
 
     with Session(engine) as session:
         if args.import_files:
@@ -446,7 +522,7 @@ def main():
 
                 print(f"  Importing {path.name}...")
                 imported = import_json_to_bronze(session, path, args.run_id)
-                print(f"    Imported {imported} listings")
+                print(f"    Upserted {imported} listings")
                 total_imported += imported
 
             print(f"\nTotal imported: {total_imported}")
@@ -460,7 +536,7 @@ def main():
             print(f"Matched to parcel: {stats.records_with_parcel_match}")
             print(f"No parcel match: {stats.records_without_parcel_match}")
             if stats.validation_errors:
-                print(f"Errors ({len(stats.validation_errors)}):")
+                print(f"Errors ({stats.error_count}):")
                 for err in stats.validation_errors[:5]:
                     print(f"  - {err}")
 
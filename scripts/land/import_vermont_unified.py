@@ -26,9 +26,10 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterator
-from uuid import uuid4
+from uuid import UUID
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -36,9 +37,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from sqlalchemy import create_engine, delete, func, select, text
 from sqlalchemy.orm import Session
 
-from src.database import engine
+from src.database import engine, init_db, refresh_current_parcel_owners
 from src.models import (
-    Base,
     Dwelling,
     DwellingUse,
     Organization,
@@ -47,6 +47,7 @@ from src.models import (
     Parcel,
     Person,
     PropertyOwnership,
+    uuid7,
 )
 
 
@@ -66,7 +67,8 @@ PAGE_SIZE = 1000
 # Data Classes
 # =============================================================================
 
-@dataclass
+# Slotted: a full import holds every row in memory before grouping by SPAN
+@dataclass(slots=True, frozen=True)
 class VermontRow:
     """Single row from Vermont's parcel API."""
     span: str
@@ -90,9 +92,9 @@ class VermontRow:
     geometry: dict | None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParsedOwner:
-    """Result of parsing an owner name."""
+    """Result of parsing an owner name (cached and shared, so immutable)."""
     is_organization: bool
     org_type: str | None  # 'llc', 'trust', 'corporation', etc.
     first_name: str | None
@@ -204,14 +206,27 @@ def parse_feature(feature: dict) -> VermontRow | None:
 # Owner Parsing
 # =============================================================================
 
-# Patterns for detecting organizations
-LLC_PATTERN = re.compile(r'\bLLC\b|\bL\.L\.C\b', re.IGNORECASE)
-TRUST_PATTERN = re.compile(r'\bTRUST\b|\bTRUSTEE\b', re.IGNORECASE)
-CORP_PATTERN = re.compile(r'\bINC\b|\bCORP\b|\bCORPORATION\b', re.IGNORECASE)
-ESTATE_PATTERN = re.compile(r'\bESTATE\b', re.IGNORECASE)
+# Organization markers in one alternation, matched against the uppercased
+# name in a single scan; group names are the org types
+ORG_PATTERN = re.compile(
+    r'\b(?:(?P<llc>LLC|L\.L\.C)'
+    r'|(?P<corporation>INC|CORP|CORPORATION)'
+    r'|(?P<trust>TRUST|TRUSTEE)'
+    r'|(?P<estate>ESTATE))\b'
+)
+# When several markers appear, the first listed wins (an "LLC ... TRUST" is an LLC)
+ORG_TYPE_PRIORITY = ("llc", "corporation", "trust", "estate")
+DWELLING_COUNT_PATTERN = re.compile(r'&\s*(\d+)\s*DWLS?')
+SINGLE_DWELLING_PATTERN = re.compile(r'&\s*DWL[.\s:]?')
 SUFFIXES = {"JR", "SR", "II", "III", "IV", "V"}
 
 
+# Per-string normalizers are memoized: the same owner names and DESCPROP
+# values repeat across many Grand List rows (condo units, multi-parcel owners)
+NORMALIZER_CACHE_SIZE = 131072
+
+
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def parse_owner_name(raw_name: str | None) -> ParsedOwner | None:
     """Parse a Grand List owner name into Person or Organization.
 
@@ -228,40 +243,12 @@ def parse_owner_name(raw_name: str | None) -> ParsedOwner | None:
         return None
 
     # Check for organization patterns
-    if LLC_PATTERN.search(name):
-        return ParsedOwner(
-            is_organization=True,
-            org_type="llc",
-            first_name=None,
-            last_name=None,
-            suffix=None,
-            raw_name=name,
-        )
-
-    if CORP_PATTERN.search(name):
-        return ParsedOwner(
-            is_organization=True,
-            org_type="corporation",
-            first_name=None,
-            last_name=None,
-            suffix=None,
-            raw_name=name,
-        )
-
-    if TRUST_PATTERN.search(name):
+    found = {m.lastgroup for m in ORG_PATTERN.finditer(name.upper())}
+    org_type = next((t for t in ORG_TYPE_PRIORITY if t in found), None)
+    if org_type:
         return ParsedOwner(
             is_organization=True,
-            org_type="trust",
-            first_name=None,
-            last_name=None,
-            suffix=None,
-            raw_name=name,
-        )
-
-    if ESTATE_PATTERN.search(name):
-        return ParsedOwner(
-            is_organization=True,
-            org_type="estate",
+            org_type=org_type,
             first_name=None,
             last_name=None,
             suffix=None,
@@ -324,6 +311,7 @@ def get_property_type(cat_code: str | None, descprop: str | None) -> str:
     return "other"
 
 
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
 def get_dwelling_count_from_descprop(descprop: str | None) -> int:
     """Parse DESCPROP to estimate dwelling count.
 
@@ -338,12 +326,12 @@ def get_dwelling_count_from_descprop(descprop: str | None) -> int:
     text = descprop.upper()
 
     # Check for explicit count
-    match = re.search(r'&\s*(\d+)\s*DWLS?', text)
+    match = DWELLING_COUNT_PATTERN.search(text)
     if match:
         return int(match.group(1))
 
     # Single dwelling
-    if re.search(r'&\s*DWL[.\s:]?', text):
+    if SINGLE_DWELLING_PATTERN.search(text):
         return 1
 
     # Multi-family
@@ -368,6 +356,124 @@ def clear_derived_tables(session: Session):
     print("  Cleared: property_ownerships, dwellings, people, organizations")
 
 
+# Trigram similarity only shortlists organization candidates; a candidate is
+# reused only if org_names_match confirms it
+ORG_CANDIDATE_LIMIT = 10
+
+KEY_PUNCTUATION = re.compile(r"[.,']")
+
+
+@lru_cache(maxsize=NORMALIZER_CACHE_SIZE)
+def dedup_key(*parts: str | None) -> str:
+    """Normalize name parts into one in-memory cache key.
+
+    Punctuation, case, and spacing differences ("MAD RIVER, L.L.C." vs
+    "MAD RIVER LLC") hash to the same dict slot, so they hit the cache
+    instead of falling through to a trigram query.
+    """
+    joined = " ".join(p for p in parts if p)
+    return " ".join(KEY_PUNCTUATION.sub("", joined).upper().split())
+
+
+def find_existing_person(
+    session: Session, first_name: str, last_name: str, town: str | None
+) -> Person | None:
+    """Find a Person already in the database with a matching name and town.
+
+    Candidates are shortlisted in SQL via the trigram (`%`) and metaphone
+    indexes on last_name, so no Python-side pairwise comparison is needed:
+    - Mailing town must match (case-insensitive), so JOHN SMITH in Warren
+      and JOHN SMYTH in Boston stay separate people
+    - First name must match exactly (case-insensitive)
+    - Last name must be trigram-similar AND sound alike (metaphone)
+    """
+    return session.execute(
+        select(Person)
+        .where(
+            func.lower(func.coalesce(Person.primary_town, "")) == (town or "").lower(),
+            func.upper(Person.first_name) == first_name.upper(),
+            Person.last_name.op("%")(last_name),
+            func.metaphone(Person.last_name, 10) == func.metaphone(last_name, 10),
+        )
+        .order_by(func.similarity(Person.last_name, last_name).desc())
+        .limit(1)
+    ).scalar_one_or_none()
+
+
+def org_name_tokens(name: str) -> frozenset[str]:
+    """Split an organization name into its normalized word tokens.
+
+    Every token is significant, including numerals, roman numerals, and
+    single-letter initials.
+
+    >>> org_name_tokens("Mad River, L.L.C.") == org_name_tokens("MAD RIVER LLC")
+    True
+    >>> org_name_tokens("SMITH FAMILY TRUST II") == org_name_tokens("SMITH FAMILY TRUST")
+    False
+    """
+    return frozenset(dedup_key(name).replace("&", " AND ").split())
+
+
+def org_names_match(a: str, b: str) -> bool:
+    """Whether two organization names denote the same organization.
+
+    True for an exact dedup_key match, or when both names have the same set
+    of tokens ("SMITH & JONES LLC" vs "JONES AND SMITH LLC"). A trigram score
+    alone never merges two names. "LOT 2 LLC" vs "LOT 3 LLC" and "A B C TRUST"
+    vs "A B D TRUST" score high but name different owners.
+    """
+    return dedup_key(a) == dedup_key(b) or org_name_tokens(a) == org_name_tokens(b)
+
+
+def find_existing_organization(session: Session, name: str) -> Organization | None:
+    """Find an Organization already in the database with the same name.
+
+    The trigram (`%`) index shortlists candidates in SQL, and org_names_match
+    confirms them in Python.
+    """
+    candidates = session.execute(
+        select(Organization)
+        .where(Organization.name.op("%")(name))
+        .order_by(func.similarity(Organization.name, name).desc())
+        .limit(ORG_CANDIDATE_LIMIT)
+    ).scalars()
+    return next((org for org in candidates if org_names_match(org.name, name)), None)
+
+
+def load_owner_indexes(
+    session: Session,
+) -> tuple[dict[tuple[str, str], list[tuple[str, UUID]]], dict[str, UUID]]:
+    """Stream existing owners into in-memory lookup indexes.
+
+    Returns (person_index, org_index):
+    - person_index: (lower last name, lower town) → [(UPPER first name, id)]
+    - org_index: dedup_key(name) → id
+
+    One streamed SELECT per table replaces a trigram query per owner row;
+    find_existing_person/organization remain the fuzzy fallback.
+    """
+    person_index: dict[tuple[str, str], list[tuple[str, UUID]]] = {}
+    people = session.execute(
+        select(
+            Person.id,
+            func.upper(Person.first_name),
+            func.lower(Person.last_name),
+            func.lower(func.coalesce(Person.primary_town, "")),
+        ).execution_options(yield_per=5000)
+    )
+    for person_id, first, last, town in people:
+        person_index.setdefault((last, town), []).append((first, person_id))
+
+    org_index: dict[str, UUID] = {}
+    orgs = session.execute(
+        select(Organization.id, Organization.name).execution_options(yield_per=5000)
+    )
+    for org_id, name in orgs:
+        org_index.setdefault(dedup_key(name), org_id)
+
+    return person_index, org_index
+
+
 def import_all(session: Session, rows: list[VermontRow]):
     """Import all rows, creating parcels, dwellings, and owners."""
 
@@ -386,9 +492,19 @@ def import_all(session: Session, rows: list[VermontRow]):
     orgs_created = 0
     ownerships_created = 0
 
-    # Cache for deduplication
-    person_cache: dict[str, Person] = {}  # "FIRST LAST" → Person
-    org_cache: dict[str, Organization] = {}  # raw_name → Organization
+    # Cache for deduplication, seeded from owners already in the database
+    person_index, org_cache = load_owner_indexes(session)  # org: dedup_key(name) → id
+    # (first, last, mailing city) → Person id; the same name in another town
+    # is a different person, as in find_existing_person
+    person_cache: dict[tuple[str, str, str], UUID] = {}
+
+    # Ownerships are buffered and bulk-inserted at each commit
+    ownership_rows: list[dict] = []
+
+    def flush_ownerships():
+        session.flush()  # Parcels, dwellings, and owners must exist first
+        PropertyOwnership.bulk_upsert(session, ownership_rows)
+        ownership_rows.clear()
 
     for span, unit_rows in span_groups.items():
         # Get or create parcel from first row
@@ -414,7 +530,7 @@ def import_all(session: Session, rows: list[VermontRow]):
         else:
             # Create new parcel
             parcel = Parcel(
-                id=uuid4(),
+                id=uuid7(),
                 span=span,
                 address=first_row.address,
                 town=TOWN,
@@ -431,8 +547,6 @@ def import_all(session: Session, rows: list[VermontRow]):
             session.add(parcel)
             parcels_created += 1
 
-        session.flush()  # Get parcel.id
-
         # Create a dwelling for each row (each condo unit)
         for i, row in enumerate(unit_rows):
             # Determine if this is a condo unit
@@ -449,7 +563,7 @@ def import_all(session: Session, rows: list[VermontRow]):
 
             # Create dwelling
             dwelling = Dwelling(
-                id=uuid4(),
+                id=uuid7(),
                 parcel_id=parcel.id,
                 unit_number=unit_number,
                 assessed_value=row.assessed_total,
@@ -462,15 +576,18 @@ def import_all(session: Session, rows: list[VermontRow]):
             session.add(dwelling)
             dwellings_created += 1
 
-            session.flush()  # Get dwelling.id
-
             # Parse and create owner
             parsed = parse_owner_name(row.owner_name)
             if parsed:
                 if parsed.is_organization:
                     # Get or create organization
-                    org = org_cache.get(parsed.raw_name)
-                    if not org:
+                    org_key = dedup_key(parsed.raw_name)
+                    org_id = org_cache.get(org_key)
+                    if not org_id:
+                        org = find_existing_organization(session, parsed.raw_name)
+                        if org:
+                            org_id = org_cache[org_key] = org.id
+                    if not org_id:
                         # Map org_type string to enum
                         org_type_map = {
                             "llc": OrganizationType.LLC,
@@ -479,7 +596,7 @@ def import_all(session: Session, rows: list[VermontRow]):
                             "estate": OrganizationType.OTHER,
                         }
                         org = Organization(
-                            id=uuid4(),
+                            id=uuid7(),
                             name=parsed.raw_name,
                             display_name=parsed.raw_name.title(),
                             org_type=org_type_map.get(parsed.org_type, OrganizationType.OTHER),
@@ -487,32 +604,50 @@ def import_all(session: Session, rows: list[VermontRow]):
                             registered_address=row.mailing_address,
                         )
                         session.add(org)
-                        org_cache[parsed.raw_name] = org
+                        org_id = org_cache[org_key] = org.id
                         orgs_created += 1
 
-                    session.flush()
-
                     # Create ownership link
-                    ownership = PropertyOwnership(
-                        id=uuid4(),
-                        organization_id=org.id,
-                        parcel_id=parcel.id,
-                        dwelling_id=dwelling.id,
-                        ownership_share=Decimal("1.0"),
-                        ownership_type=OwnershipType.FEE_SIMPLE,
-                        is_primary_owner=True,
-                        as_listed_name=parsed.raw_name,
-                        data_source="grand_list",
-                    )
-                    session.add(ownership)
+                    ownership_rows.append({
+                        "id": uuid7(),
+                        "person_id": None,
+                        "organization_id": org_id,
+                        "parcel_id": parcel.id,
+                        "dwelling_id": dwelling.id,
+                        "ownership_share": Decimal("1.0"),
+                        "ownership_type": OwnershipType.FEE_SIMPLE,
+                        "is_primary_owner": True,
+                        "as_listed_name": parsed.raw_name,
+                        "data_source": "grand_list",
+                    })
                     ownerships_created += 1
 
                 else:
                     # Get or create person
-                    cache_key = f"{parsed.first_name or ''} {parsed.last_name or ''}".strip().upper()
-                    person = person_cache.get(cache_key)
+                    cache_key = (
+                        dedup_key(parsed.first_name),
+                        dedup_key(parsed.last_name),
+                        dedup_key(row.mailing_city),
+                    )
+                    person_id = person_cache.get(cache_key)
 
-                    if not person:
+                    if not person_id and parsed.first_name and parsed.last_name:
+                        # Exact first name among same last name + town, then fuzzy SQL
+                        # within the same town
+                        candidates = person_index.get(
+                            (parsed.last_name.lower(), (row.mailing_city or "").lower()), []
+                        )
+                        first = parsed.first_name.upper()
+                        person_id = next((pid for f, pid in candidates if f == first), None)
+                        if not person_id:
+                            person = find_existing_person(
+                                session, parsed.first_name, parsed.last_name, row.mailing_city
+                            )
+                            person_id = person.id if person else None
+                        if person_id:
+                            person_cache[cache_key] = person_id
+
+                    if not person_id:
                         # Determine residency from mailing state
                         is_warren_resident = (
                             row.mailing_state and
@@ -526,9 +661,10 @@ def import_all(session: Session, rows: list[VermontRow]):
                             full_address = f"{full_address}, {row.mailing_zip}".strip(", ")
 
                         person = Person(
-                            id=uuid4(),
+                            id=uuid7(),
                             first_name=parsed.first_name or "Unknown",
                             last_name=parsed.last_name or "Unknown",
+                            full_name=parsed.raw_name,
                             suffix=parsed.suffix,
                             primary_address=full_address or None,
                             primary_town=row.mailing_city,
@@ -536,33 +672,36 @@ def import_all(session: Session, rows: list[VermontRow]):
                             is_warren_resident=is_warren_resident,
                         )
                         session.add(person)
-                        person_cache[cache_key] = person
+                        person_id = person_cache[cache_key] = person.id
                         people_created += 1
 
-                    session.flush()
-
                     # Create ownership link
-                    ownership = PropertyOwnership(
-                        id=uuid4(),
-                        person_id=person.id,
-                        parcel_id=parcel.id,
-                        dwelling_id=dwelling.id,
-                        ownership_share=Decimal("1.0"),
-                        ownership_type=OwnershipType.FEE_SIMPLE,
-                        is_primary_owner=True,
-                        as_listed_name=parsed.raw_name,
-                        data_source="grand_list",
-                    )
-                    session.add(ownership)
+                    ownership_rows.append({
+                        "id": uuid7(),
+                        "person_id": person_id,
+                        "organization_id": None,
+                        "parcel_id": parcel.id,
+                        "dwelling_id": dwelling.id,
+                        "ownership_share": Decimal("1.0"),
+                        "ownership_type": OwnershipType.FEE_SIMPLE,
+                        "is_primary_owner": True,
+                        "as_listed_name": parsed.raw_name,
+                        "data_source": "grand_list",
+                    })
                     ownerships_created += 1
 
         # Commit every 100 parcels
         if (parcels_created + parcels_updated) % 100 == 0:
+            flush_ownerships()
             session.commit()
             print(f"    Processed {parcels_created + parcels_updated} parcels...")
 
+    flush_ownerships()
     session.commit()
 
+    # Gold layer: current owners per parcel
+    refresh_current_parcel_owners()
+
     print(f"\n  === Import Complete ===")
     print(f"  Parcels: {parcels_created} created, {parcels_updated} updated")
     print(f"  Dwellings: {dwellings_created} created")
@@ -700,7 +839,7 @@ def main():
 
     # Create tables
     print("Creating tables if needed...")
-    Base.metadata.create_all(engine)
+    init_db()
 
     with Session(engine) as session:
         rows = []
@@ -0,0 +1,34 @@
+"""Upgrade an existing Open Valley database to the current schema.
+
+API startup and the import scripts only run init_db, which creates missing
+tables and keeps partitions current. Schema changes to tables that already
+hold data (type conversions, generated columns, partitioning legacy tables,
+index builds) happen here instead.
+
+Some of these rewrite whole tables under an exclusive lock, so run this
+during a maintenance window, before deploying code that needs the new schema.
+
+Usage:
+    uv run python scripts/migrate_db.py
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database import migrate_db
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upgrade the database schema in place")
+    parser.parse_args()
+
+    print("Migrating database schema...")
+    migrate_db()
+    print("Done.")
+
+
+if __name__ == "__main__":
+    main()
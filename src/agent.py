@@ -11,6 +11,7 @@ from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic_ai import Agent, Embedder, RunContext
 from sqlalchemy import func, select
+from sqlalchemy.orm import selectinload
 
 from .database import SessionLocal, engine
 from .models import (
@@ -24,6 +25,7 @@ from .models import (
     STRListing,
     TaxStatus,
 )
+from .transformations import normalize_state_in_text
 
 load_dotenv()
 
@@ -73,17 +75,8 @@ class MailingAddressAnalysis(BaseModel):
         if match:
             self.state = match.group(1)
         else:
-            # Pattern 2: State name spelled out followed by zip
-            state_map = {
-                'VERMONT': 'VT', 'FLORIDA': 'FL', 'NEW YORK': 'NY',
-                'CONNECTICUT': 'CT', 'MASSACHUSETTS': 'MA', 'NEW JERSEY': 'NJ',
-                'NEW HAMPSHIRE': 'NH', 'CALIFORNIA': 'CA', 'TEXAS': 'TX',
-                'RHODE ISLAND': 'RI', 'PENNSYLVANIA': 'PA', 'MAINE': 'ME',
-            }
-            for state_name, abbrev in state_map.items():
-                if state_name in addr_upper:
-                    self.state = abbrev
-                    break
+            # Pattern 2: State name spelled out, found in one scan
+            self.state = normalize_state_in_text(addr_upper)
 
         # Compute residency flags
         if self.state:
@@ -275,8 +268,8 @@ When answering questions:
     deps_type=WarrenContext,
 )
 
-# Initialize embedder for semantic search (via Gateway, large model for max quality)
-fpf_embedder = Embedder("gateway/openai:text-embedding-3-large")
+# Initialize embedder for semantic search (via Gateway); must match embed_fpf_posts.py
+fpf_embedder = Embedder("gateway/openai:text-embedding-3-small")
 
 
 @warren_agent.tool
@@ -461,7 +454,11 @@ def search_properties(
     """
     db = SessionLocal()
     try:
-        query = db.query(Parcel)
+        # Batch-load owners and tax status for all results instead of per parcel
+        query = db.query(Parcel).options(
+            selectinload(Parcel.property_ownerships).selectinload(PropertyOwnership.person),
+            selectinload(Parcel.tax_status),
+        )
 
         if address_contains:
             query = query.filter(Parcel.address.ilike(f"%{address_contains}%"))
@@ -583,26 +580,25 @@ def get_dwelling_breakdown(ctx: RunContext[WarrenContext]) -> DwellingBreakdownR
     from sqlalchemy.orm import Session
 
     with Session(engine) as db:
-        total = db.scalar(select(func.count(Dwelling.id))) or 0
-        homestead = db.scalar(
-            select(func.count(Dwelling.id)).where(Dwelling.tax_classification == "HOMESTEAD")
-        ) or 0
-        nhs_res = db.scalar(
-            select(func.count(Dwelling.id)).where(Dwelling.tax_classification == "NHS_RESIDENTIAL")
-        ) or 0
-        nhs_nonres = db.scalar(
-            select(func.count(Dwelling.id)).where(Dwelling.tax_classification == "NHS_NONRESIDENTIAL")
-        ) or 0
-        str_count = db.scalar(
-            select(func.count(Dwelling.id)).where(Dwelling.str_listing_id.isnot(None))
-        ) or 0
+        # All class counts in one scan over the stored classification column
+        total, homestead, nhs_res, nhs_nonres, str_count = db.execute(
+            select(
+                func.count(Dwelling.id),
+                func.count(Dwelling.id).filter(Dwelling.tax_classification == "HOMESTEAD"),
+                func.count(Dwelling.id).filter(Dwelling.tax_classification == "NHS_RESIDENTIAL"),
+                func.count(Dwelling.id).filter(
+                    Dwelling.tax_classification == "NHS_NONRESIDENTIAL"
+                ),
+                func.count(Dwelling.id).filter(Dwelling.str_listing_id.isnot(None)),
+            )
+        ).one()
 
         # Use type breakdown
         use_types = db.execute(
-            select(Dwelling.use_type, func.count(Dwelling.id))
-            .group_by(Dwelling.use_type)
+            select(Dwelling.dwelling_use, func.count(Dwelling.id))
+            .group_by(Dwelling.dwelling_use)
         ).all()
-        use_breakdown = {row[0] or "unknown": row[1] for row in use_types}
+        use_breakdown = {row[0].value if row[0] else "unknown": row[1] for row in use_types}
 
         # Calculate percentages
         primary_pct = (homestead / total * 100) if total > 0 else 0
@@ -719,7 +715,8 @@ async def search_fpf_posts(
         # Build query with cosine similarity
         # pgvector cosine_distance returns 0 for identical, 2 for opposite
         # Convert to similarity: 1 - (distance / 2) gives us 0-1 range
-        similarity = 1 - (FPFPost.embedding.cosine_distance(query_embedding) / 2)
+        distance = FPFPost.embedding.cosine_distance(query_embedding)
+        similarity = 1 - (distance / 2)
 
         stmt = (
             select(
@@ -730,7 +727,7 @@ async def search_fpf_posts(
             )
             .join(FPFPerson, FPFPost.person_id == FPFPerson.id)
             .where(FPFPost.embedding.isnot(None))
-            .order_by(similarity.desc())
+            .order_by(distance)  # Ascending <=> so the HNSW index is used
         )
 
         if category:
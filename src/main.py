@@ -1,5 +1,8 @@
 """FastAPI application for Warren Community Intelligence."""
 
+import asyncio
+import gzip
+import json
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -7,14 +10,16 @@ from contextlib import asynccontextmanager
 import logfire
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 from sqlalchemy import func
 from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
 
 import httpx
 
 from .agent import WarrenContext, warren_agent
-from .database import SessionLocal, init_db
+from .database import SessionLocal, init_db, retry_on_disconnect
 from .models import Dwelling, Organization, Parcel, Person, PropertyOwnership, STRListing, TaxStatus
 
 # Vermont Geodata ArcGIS REST API
@@ -27,9 +32,11 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize database and start the parcels GeoJSON refresh loop."""
     init_db()
+    refresh_task = asyncio.create_task(_refresh_loop())
     yield
+    refresh_task.cancel()
 
 
 app = FastAPI(
@@ -53,6 +60,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (GeoJSON compresses 5-10x)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 
 @app.get("/")
 async def root():
@@ -293,12 +303,16 @@ async def get_dashboard_stats():
             FROM parcel_categories
         """)).fetchone()
 
-        # Dwelling statistics using raw SQL (avoid ORM/schema mismatch)
+        # Dwelling statistics using raw SQL (avoid ORM/schema mismatch); one
+        # pass over dwellings for every count, STR-linked included
         dwelling_stats = db.execute(sql_text("""
             SELECT
                 COUNT(*) as total,
                 COUNT(*) FILTER (WHERE homestead_filed = true) as homestead,
-                COUNT(*) FILTER (WHERE homestead_filed = false OR homestead_filed IS NULL) as nhs_residential
+                COUNT(*) FILTER (
+                    WHERE homestead_filed = false OR homestead_filed IS NULL
+                ) as nhs_residential,
+                COUNT(*) FILTER (WHERE str_listing_id IS NOT NULL) as str_linked
             FROM dwellings
         """)).fetchone()
 
@@ -314,15 +328,12 @@ async def get_dashboard_stats():
             homestead_pct = 0.0
             nhs_pct = 0.0
 
-        # STR listing count
-        str_count = db.query(func.count(STRListing.id)).filter(
-            STRListing.is_active == True
+        # STR listing count (bare predicate matches the partial ix_str_listings_active)
+        str_count = db.query(func.count()).select_from(STRListing).filter(
+            STRListing.is_active
         ).scalar() or 0
 
-        # STR-linked dwellings using raw SQL
-        str_linked_result = db.execute(sql_text(
-            "SELECT COUNT(*) FROM dwellings WHERE str_listing_id IS NOT NULL"
-        )).scalar() or 0
+        str_linked_result = dwelling_stats.str_linked or 0
 
         # People count
         people_count = db.query(func.count(Person.id)).scalar() or 0
@@ -392,10 +403,15 @@ async def get_dashboard_stats():
 # GeoJSON API for MapLibre
 # =============================================================================
 
-# Cache for Vermont Geodata response (avoid repeated API calls)
-_geojson_cache: dict = {"data": None, "timestamp": 0}
+# Cache for Vermont Geodata response (avoid repeated API calls).
+# Stores the serialized body and a pre-gzipped copy so cache hits cost no CPU.
+_geojson_cache: dict = {"body": None, "body_gz": None, "timestamp": 0}
 CACHE_TTL = 3600  # 1 hour
 
+# Serializes cache rebuilds so a cold request and the refresh loop never
+# fetch and encode the parcels at the same time.
+_geojson_refresh_lock = asyncio.Lock()
+
 
 @app.get("/api/dwellings/geojson")
 async def get_dwellings_geojson():
@@ -463,20 +479,34 @@ async def get_dwellings_geojson():
 
 
 @app.get("/api/parcels/geojson")
-async def get_parcels_geojson():
+async def get_parcels_geojson(request: Request):
     """Return Warren parcels as GeoJSON with homestead classification.
 
-    Fetches geometry from Vermont Geodata API and enriches with local
-    homestead filing status for choropleth visualization.
+    Served from the cache kept warm by the background refresh loop; only
+    the very first request before warmup builds it inline.
     """
-    import time
+    if not _geojson_cache["body"]:
+        async with _geojson_refresh_lock:
+            # The refresh loop may have filled the cache while we waited
+            if not _geojson_cache["body"]:
+                await _refresh_parcels_geojson()
+    return _cached_geojson_response(request)
 
-    current_time = time.time()
 
-    # Check cache
-    if _geojson_cache["data"] and (current_time - _geojson_cache["timestamp"]) < CACHE_TTL:
-        logger.debug("Returning cached GeoJSON")
-        return _geojson_cache["data"]
+async def _refresh_loop():
+    """Rebuild the parcels GeoJSON cache every CACHE_TTL seconds."""
+    while True:
+        try:
+            async with _geojson_refresh_lock:
+                await _refresh_parcels_geojson()
+        except Exception:
+            logger.exception("Parcels GeoJSON refresh failed")
+        await asyncio.sleep(CACHE_TTL)
+
+
+async def _refresh_parcels_geojson():
+    """Fetch geometry from Vermont Geodata and enrich with local homestead status."""
+    import time
 
     # Fetch from Vermont Geodata
     logger.info("Fetching parcels from Vermont Geodata API...")
@@ -512,6 +542,21 @@ async def get_parcels_geojson():
 
     logger.info(f"Fetched {len(all_features)} parcels from Vermont Geodata")
 
+    # The DB query, enrichment and encoding are blocking; keep them off the
+    # event loop so other requests are served while the cache rebuilds.
+    body, body_gz = await asyncio.to_thread(_build_parcels_geojson, all_features)
+
+    # Update cache
+    _geojson_cache["body"] = body
+    _geojson_cache["body_gz"] = body_gz
+    _geojson_cache["timestamp"] = time.time()
+
+
+def _build_parcels_geojson(all_features: list[dict]) -> tuple[bytes, bytes]:
+    """Enrich parcel features with local homestead status and encode them.
+
+    Returns the serialized FeatureCollection and a gzipped copy of it.
+    """
     # Get local homestead and property_type data for enrichment
     db = SessionLocal()
     try:
@@ -559,11 +604,19 @@ async def get_parcels_geojson():
         "features": all_features,
     }
 
-    # Update cache
-    _geojson_cache["data"] = result
-    _geojson_cache["timestamp"] = current_time
+    body = json.dumps(result, separators=(",", ":")).encode()
+    return body, gzip.compress(body, compresslevel=6)
+
 
-    return result
+def _cached_geojson_response(request: Request) -> Response:
+    """Serve the cached parcels GeoJSON, pre-compressed if the client accepts gzip."""
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=_geojson_cache["body_gz"],
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(content=_geojson_cache["body"], media_type="application/json")
 
 
 # =============================================================================
@@ -591,39 +644,39 @@ async def get_homestead_transitions():
     try:
         result = db.execute(sql_text("""
             SELECT
-                b.raw_json::json->'attributes'->>'span' as span,
-                (b.raw_json::json->'attributes'->>'Latitude')::float as lat,
-                (b.raw_json::json->'attributes'->>'Longitude')::float as lng,
+                b.raw_json->'attributes'->>'span' as span,
+                (b.raw_json->'attributes'->>'Latitude')::float as lat,
+                (b.raw_json->'attributes'->>'Longitude')::float as lng,
                 pt.transfer_date,
                 pt.sale_price,
-                b.raw_json::json->'attributes'->>'sellerSt' as seller_state,
-                b.raw_json::json->'attributes'->>'bUsePrDesc' as use_desc,
+                b.raw_json->'attributes'->>'sellerSt' as seller_state,
+                b.raw_json->'attributes'->>'bUsePrDesc' as use_desc,
                 pt.buyer_state,
                 CASE
                     -- TRUE LOSS: VT seller (was homestead) → non-primary buyer
-                    WHEN b.raw_json::json->'attributes'->>'sellerSt' = 'VT'
+                    WHEN b.raw_json->'attributes'->>'sellerSt' = 'VT'
                          AND (pt.intended_use = 'secondary'
-                              OR b.raw_json::json->'attributes'->>'bUsePrDesc' LIKE 'Non-PR%')
+                              OR b.raw_json->'attributes'->>'bUsePrDesc' LIKE 'Non-PR%')
                     THEN 'TRUE_LOSS'
 
                     -- TRUE GAIN: Non-VT seller (was 2nd home) → primary buyer
-                    WHEN b.raw_json::json->'attributes'->>'sellerSt' IS NOT NULL
-                         AND b.raw_json::json->'attributes'->>'sellerSt' != 'VT'
-                         AND b.raw_json::json->'attributes'->>'bUsePrDesc'
+                    WHEN b.raw_json->'attributes'->>'sellerSt' IS NOT NULL
+                         AND b.raw_json->'attributes'->>'sellerSt' != 'VT'
+                         AND b.raw_json->'attributes'->>'bUsePrDesc'
                              IN ('Domicile/Primary Residence', 'Principal Residence')
                     THEN 'TRUE_GAIN'
 
                     -- STAYED HOMESTEAD: VT seller → primary buyer (no change)
-                    WHEN b.raw_json::json->'attributes'->>'sellerSt' = 'VT'
-                         AND b.raw_json::json->'attributes'->>'bUsePrDesc'
+                    WHEN b.raw_json->'attributes'->>'sellerSt' = 'VT'
+                         AND b.raw_json->'attributes'->>'bUsePrDesc'
                              IN ('Domicile/Primary Residence', 'Principal Residence')
                     THEN 'STAYED_HOMESTEAD'
 
                     -- STAYED NON-HOMESTEAD: Non-VT seller → non-primary buyer (no change)
-                    WHEN b.raw_json::json->'attributes'->>'sellerSt' IS NOT NULL
-                         AND b.raw_json::json->'attributes'->>'sellerSt' != 'VT'
+                    WHEN b.raw_json->'attributes'->>'sellerSt' IS NOT NULL
+                         AND b.raw_json->'attributes'->>'sellerSt' != 'VT'
                          AND (pt.intended_use = 'secondary'
-                              OR b.raw_json::json->'attributes'->>'bUsePrDesc' LIKE 'Non-PR%')
+                              OR b.raw_json->'attributes'->>'bUsePrDesc' LIKE 'Non-PR%')
                     THEN 'STAYED_NON_HOMESTEAD'
 
                     -- OTHER: Unknown seller state, open land, commercial, etc.
@@ -632,13 +685,17 @@ async def get_homestead_transitions():
             FROM property_transfers pt
             JOIN bronze_pttr_transfers b ON pt.bronze_id = b.id
             WHERE pt.transfer_date >= '2019-01-01'
-              AND (b.raw_json::json->'attributes'->>'Latitude')::float != 0
-              AND (b.raw_json::json->'attributes'->>'Longitude')::float != 0
+              AND (b.raw_json->'attributes'->>'Latitude')::float != 0
+              AND (b.raw_json->'attributes'->>'Longitude')::float != 0
             ORDER BY pt.transfer_date
         """))
 
         features = []
+        counts = dict.fromkeys(
+            ("TRUE_GAIN", "TRUE_LOSS", "STAYED_HOMESTEAD", "STAYED_NON_HOMESTEAD", "OTHER"), 0
+        )
         for row in result:
+            counts[row.transition_type] += 1
             features.append({
                 "type": "Feature",
                 "geometry": {
@@ -663,35 +720,35 @@ async def get_homestead_transitions():
                 EXTRACT(YEAR FROM pt.transfer_date)::int as year,
                 -- TRUE LOSS: VT seller → non-primary (de-homesteading)
                 COUNT(*) FILTER (WHERE
-                    b.raw_json::json->'attributes'->>'sellerSt' = 'VT'
+                    b.raw_json->'attributes'->>'sellerSt' = 'VT'
                     AND (pt.intended_use = 'secondary'
-                         OR b.raw_json::json->'attributes'->>'bUsePrDesc' LIKE 'Non-PR%')
+                         OR b.raw_json->'attributes'->>'bUsePrDesc' LIKE 'Non-PR%')
                 ) as true_losses,
                 -- TRUE GAIN: Non-VT seller → primary (re-homesteading)
                 COUNT(*) FILTER (WHERE
-                    b.raw_json::json->'attributes'->>'sellerSt' IS NOT NULL
-                    AND b.raw_json::json->'attributes'->>'sellerSt' != 'VT'
-                    AND b.raw_json::json->'attributes'->>'bUsePrDesc'
+                    b.raw_json->'attributes'->>'sellerSt' IS NOT NULL
+                    AND b.raw_json->'attributes'->>'sellerSt' != 'VT'
+                    AND b.raw_json->'attributes'->>'bUsePrDesc'
                         IN ('Domicile/Primary Residence', 'Principal Residence')
                 ) as true_gains,
                 -- STAYED HOMESTEAD: VT seller → primary (no change)
                 COUNT(*) FILTER (WHERE
-                    b.raw_json::json->'attributes'->>'sellerSt' = 'VT'
-                    AND b.raw_json::json->'attributes'->>'bUsePrDesc'
+                    b.raw_json->'attributes'->>'sellerSt' = 'VT'
+                    AND b.raw_json->'attributes'->>'bUsePrDesc'
                         IN ('Domicile/Primary Residence', 'Principal Residence')
                 ) as stayed_homestead,
                 -- STAYED NON-HOMESTEAD: Non-VT seller → non-primary (no change)
                 COUNT(*) FILTER (WHERE
-                    b.raw_json::json->'attributes'->>'sellerSt' IS NOT NULL
-                    AND b.raw_json::json->'attributes'->>'sellerSt' != 'VT'
+                    b.raw_json->'attributes'->>'sellerSt' IS NOT NULL
+                    AND b.raw_json->'attributes'->>'sellerSt' != 'VT'
                     AND (pt.intended_use = 'secondary'
-                         OR b.raw_json::json->'attributes'->>'bUsePrDesc' LIKE 'Non-PR%')
+                         OR b.raw_json->'attributes'->>'bUsePrDesc' LIKE 'Non-PR%')
                 ) as stayed_non_homestead
             FROM property_transfers pt
             JOIN bronze_pttr_transfers b ON pt.bronze_id = b.id
             WHERE pt.transfer_date >= '2019-01-01'
-              AND (b.raw_json::json->'attributes'->>'Latitude')::float != 0
-              AND (b.raw_json::json->'attributes'->>'Longitude')::float != 0
+              AND (b.raw_json->'attributes'->>'Latitude')::float != 0
+              AND (b.raw_json->'attributes'->>'Longitude')::float != 0
             GROUP BY 1
             ORDER BY 1
         """))
@@ -707,12 +764,12 @@ async def get_homestead_transitions():
             for row in stats_result
         }
 
-        # Count by transition type
-        true_gains = sum(1 for f in features if f["properties"]["transition_type"] == "TRUE_GAIN")
-        true_losses = sum(1 for f in features if f["properties"]["transition_type"] == "TRUE_LOSS")
-        stayed_homestead = sum(1 for f in features if f["properties"]["transition_type"] == "STAYED_HOMESTEAD")
-        stayed_non_homestead = sum(1 for f in features if f["properties"]["transition_type"] == "STAYED_NON_HOMESTEAD")
-        other = sum(1 for f in features if f["properties"]["transition_type"] == "OTHER")
+        # Counts by transition type (tallied in the feature loop above)
+        true_gains = counts["TRUE_GAIN"]
+        true_losses = counts["TRUE_LOSS"]
+        stayed_homestead = counts["STAYED_HOMESTEAD"]
+        stayed_non_homestead = counts["STAYED_NON_HOMESTEAD"]
+        other = counts["OTHER"]
 
         return {
             "type": "FeatureCollection",
@@ -741,7 +798,12 @@ from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import text
+from functools import lru_cache
+import hmac
+from uuid import UUID
+from pydantic_core import from_json
+from sqlalchemy import Float, cast, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from .models import STRReviewStatus
 from .schemas import (
     STRReviewQueueItem,
@@ -753,78 +815,134 @@ from .schemas import (
     STRReviewStats,
 )
 
+# Admin handlers are plain `def` so FastAPI runs them in its threadpool;
+# they use the synchronous SessionLocal and must not block the event loop.
+
 # Simple bearer token auth for admin endpoints
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "dev-admin-token")
+_ADMIN_TOKEN_BYTES = ADMIN_TOKEN.encode()
 security = HTTPBearer(auto_error=False)
 
 
 async def verify_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    """Verify admin bearer token."""
+    """Verify admin bearer token (constant-time compare)."""
     if not credentials:
         raise HTTPException(status_code=401, detail="Admin token required")
-    if credentials.credentials != ADMIN_TOKEN:
+    if not hmac.compare_digest(credentials.credentials.encode(), _ADMIN_TOKEN_BYTES):
         raise HTTPException(status_code=403, detail="Invalid admin token")
     return True
 
 
+# Match-score bonus per use_type bucket (see _classify_use_type)
+_USE_TYPE_BONUS = (0.0, 0.3, 0.2)
+
+
+@lru_cache(maxsize=512)
+def _classify_use_type(use_type: str) -> int:
+    """Bucket a raw use_type: 1 = rental/STR, 2 = vacation/seasonal, 0 = other."""
+    use_lower = use_type.lower()
+    if "rental" in use_lower or "str" in use_lower:
+        return 1
+    if "vacation" in use_lower or "seasonal" in use_lower:
+        return 2
+    return 0
+
+
 def compute_dwelling_match_score(listing: STRListing, dwelling: Dwelling) -> float:
     """Compute how likely a dwelling matches an STR listing."""
-    score = 0.0
+    return compute_dwelling_match_scores(listing, [dwelling])[0]
 
-    # Bedroom match (strong signal)
-    if listing.bedrooms and dwelling.bedrooms:
-        if listing.bedrooms == dwelling.bedrooms:
-            score += 0.4
-        elif abs(listing.bedrooms - dwelling.bedrooms) == 1:
-            score += 0.2
 
-    # Not homestead (STRs unlikely to be primary residence)
-    if not dwelling.homestead_filed:
-        score += 0.2
+def compute_dwelling_match_scores(listing: STRListing, dwellings) -> list[float]:
+    """Score candidate dwellings (ORM objects or raw rows) against one listing.
 
-    # Has use_type indicating STR or non-primary use
-    if dwelling.use_type:
-        use_lower = dwelling.use_type.lower()
-        if "rental" in use_lower or "str" in use_lower:
-            score += 0.3
-        elif "vacation" in use_lower or "seasonal" in use_lower:
+    Listing attributes are read once and every candidate is scored in a
+    single pass:
+    - Bedroom match (strong signal): +0.4 exact, +0.2 off by one
+    - Not homestead (STRs unlikely to be primary residence): +0.2
+    - use_type indicating STR (+0.3) or other non-primary use (+0.2)
+    - Already linked to another STR: -0.2
+    """
+    listing_bedrooms = listing.bedrooms
+    scores = []
+    for dwelling in dwellings:
+        score = 0.0
+
+        bedrooms = dwelling.bedrooms
+        if listing_bedrooms and bedrooms:
+            if listing_bedrooms == bedrooms:
+                score += 0.4
+            elif abs(listing_bedrooms - bedrooms) == 1:
+                score += 0.2
+
+        if not dwelling.homestead_filed:
             score += 0.2
 
-    # Penalize if already linked to another STR
-    if dwelling.str_listing_id:
-        score -= 0.2
+        if dwelling.use_type:
+            score += _USE_TYPE_BONUS[_classify_use_type(dwelling.use_type)]
 
-    return max(0.0, min(1.0, score))
+        if dwelling.str_listing_id:
+            score -= 0.2
 
+        scores.append(max(0.0, min(1.0, score)))
+    return scores
 
-@app.get("/api/admin/str-review/stats", dependencies=[Depends(verify_admin)])
-async def get_str_review_stats() -> STRReviewStats:
-    """Get statistics about STR review progress."""
-    db = SessionLocal()
-    try:
-        total = db.query(func.count(STRListing.id)).scalar() or 0
-        matched = db.query(func.count(STRListing.id)).filter(
-            STRListing.parcel_id.isnot(None)
-        ).scalar() or 0
 
-        # Get review status counts
-        unreviewed = db.query(func.count(STRListing.id)).outerjoin(
-            STRReviewStatus, STRListing.id == STRReviewStatus.str_listing_id
-        ).filter(
-            (STRReviewStatus.id.is_(None)) | (STRReviewStatus.status == "unreviewed")
-        ).scalar() or 0
+# Status counts change only on review actions, so paging through the queue
+# can reuse them for a few seconds instead of re-aggregating every request.
+_status_counts_cache: dict = {"counts": None, "timestamp": 0}
+STATUS_COUNTS_TTL = 5  # seconds
 
-        confirmed = db.query(func.count(STRReviewStatus.id)).filter(
-            STRReviewStatus.status == "confirmed"
-        ).scalar() or 0
 
-        rejected = db.query(func.count(STRReviewStatus.id)).filter(
-            STRReviewStatus.status == "rejected"
-        ).scalar() or 0
+def _str_review_status_counts(db) -> dict:
+    """Return listing totals and review status counts from one aggregate query."""
+    import time
 
-        skipped = db.query(func.count(STRReviewStatus.id)).filter(
+    current_time = time.time()
+    if _status_counts_cache["counts"] and (
+        current_time - _status_counts_cache["timestamp"]
+    ) < STATUS_COUNTS_TTL:
+        return _status_counts_cache["counts"]
+
+    row = db.query(
+        func.count(STRListing.id).label("total"),
+        func.count(STRListing.id).filter(STRListing.parcel_id.isnot(None)).label("matched"),
+        func.count(STRListing.id).filter(
+            (STRReviewStatus.id.is_(None)) | (STRReviewStatus.status == "unreviewed")
+        ).label("unreviewed"),
+        func.count(STRReviewStatus.id).filter(
+            STRReviewStatus.status == "confirmed"
+        ).label("confirmed"),
+        func.count(STRReviewStatus.id).filter(
+            STRReviewStatus.status == "rejected"
+        ).label("rejected"),
+        func.count(STRReviewStatus.id).filter(
             STRReviewStatus.status == "skipped"
-        ).scalar() or 0
+        ).label("skipped"),
+    ).outerjoin(
+        STRReviewStatus, STRListing.id == STRReviewStatus.str_listing_id
+    ).one()
+
+    counts = dict(row._mapping)
+    _status_counts_cache["counts"] = counts
+    _status_counts_cache["timestamp"] = current_time
+    return counts
+
+
+@app.get("/api/admin/str-review/stats", dependencies=[Depends(verify_admin)])
+@retry_on_disconnect
+def get_str_review_stats() -> STRReviewStats:
+    """Get statistics about STR review progress."""
+    db = SessionLocal()
+    try:
+        counts = _str_review_status_counts(db)
+
+        total = counts["total"]
+        matched = counts["matched"]
+        unreviewed = counts["unreviewed"]
+        confirmed = counts["confirmed"]
+        rejected = counts["rejected"]
+        skipped = counts["skipped"]
 
         reviewed = confirmed + rejected + skipped
         completion = (reviewed / total * 100) if total > 0 else 0
@@ -842,17 +960,54 @@ async def get_str_review_stats() -> STRReviewStats:
         db.close()
 
 
+# Columns for queue rows, in the positional order _queue_item_from_row unpacks.
+# Only what the queue item needs (no ORM object hydration); numeric columns
+# are cast to float in SQL so the driver returns floats.
+_QUEUE_COLUMNS = (
+    STRListing.id,
+    STRListing.platform,
+    STRListing.listing_id,
+    STRListing.name,
+    STRListing.listing_url,
+    STRListing.lat,
+    STRListing.lng,
+    STRListing.bedrooms,
+    STRListing.max_guests,
+    STRListing.price_per_night_usd,
+    STRListing.total_reviews,
+    cast(STRListing.average_rating, Float).label("average_rating"),
+    STRListing.match_method,
+    cast(STRListing.match_confidence, Float).label("match_confidence"),
+    Parcel.id.label("parcel_id"),
+    Parcel.span.label("parcel_span"),
+    Parcel.address.label("parcel_address"),
+    STRReviewStatus.status.label("review_status"),
+    STRReviewStatus.dwelling_id,
+    STRReviewStatus.reviewed_by,
+    STRReviewStatus.reviewed_at,
+)
+
+# Queue pages above this size stream from a server-side cursor
+QUEUE_STREAM_THRESHOLD = 200
+QUEUE_STREAM_BATCH = 200
+
+
 @app.get("/api/admin/str-review/queue", dependencies=[Depends(verify_admin)])
-async def get_str_review_queue(
+@retry_on_disconnect
+def get_str_review_queue(
     status: str = "unreviewed",
     limit: int = 100,
     offset: int = 0,
 ) -> STRReviewQueueResponse:
-    """Get STR listings for review with pagination."""
+    """Get STR listings for review with pagination.
+
+    Pages larger than QUEUE_STREAM_THRESHOLD are streamed with the same
+    JSON shape instead of being materialized in memory.
+    """
     db = SessionLocal()
+    streaming = False
     try:
-        # Build query for listings
-        query = db.query(STRListing, Parcel, STRReviewStatus).outerjoin(
+        query = db.query(*_QUEUE_COLUMNS).select_from(STRListing).outerjoin(
             Parcel, STRListing.parcel_id == Parcel.id
         ).outerjoin(
             STRReviewStatus, STRListing.id == STRReviewStatus.str_listing_id
@@ -867,182 +1022,218 @@ async def get_str_review_queue(
             query = query.filter(STRReviewStatus.status == status)
         # "all" returns everything
 
-        # Get total before pagination
-        total = query.count()
-
-        # Apply pagination
-        listings = query.offset(offset).limit(limit).all()
-
-        # Convert to response items
-        items = []
-        for listing, parcel, review_status in listings:
-            # Count candidate dwellings on parcel
-            candidate_count = 0
-            if parcel:
-                candidate_count = db.query(func.count(Dwelling.id)).filter(
-                    Dwelling.parcel_id == parcel.id
-                ).scalar() or 0
-
-            items.append(STRReviewQueueItem(
-                id=str(listing.id),
-                platform=listing.platform,
-                listing_id=listing.listing_id,
-                name=listing.name,
-                listing_url=listing.listing_url,
-                lat=float(listing.lat) if listing.lat else None,
-                lng=float(listing.lng) if listing.lng else None,
-                bedrooms=listing.bedrooms,
-                max_guests=listing.max_guests,
-                price_per_night_usd=listing.price_per_night_usd,
-                total_reviews=listing.total_reviews,
-                average_rating=float(listing.average_rating) if listing.average_rating else None,
-                parcel_id=str(parcel.id) if parcel else None,
-                parcel_span=parcel.span if parcel else None,
-                parcel_address=parcel.address if parcel else None,
-                match_method=listing.match_method,
-                match_confidence=float(listing.match_confidence) if listing.match_confidence else None,
-                review_status=review_status.status if review_status else "unreviewed",
-                dwelling_id=str(review_status.dwelling_id) if review_status and review_status.dwelling_id else None,
-                candidate_dwelling_count=candidate_count,
-                reviewed_by=review_status.reviewed_by if review_status else None,
-                reviewed_at=review_status.reviewed_at.isoformat() if review_status and review_status.reviewed_at else None,
-            ))
-
-        # Get status counts for summary
-        unreviewed_count = db.query(func.count(STRListing.id)).outerjoin(
-            STRReviewStatus, STRListing.id == STRReviewStatus.str_listing_id
-        ).filter(
-            (STRReviewStatus.id.is_(None)) | (STRReviewStatus.status == "unreviewed")
-        ).scalar() or 0
-
-        confirmed_count = db.query(func.count(STRReviewStatus.id)).filter(
-            STRReviewStatus.status == "confirmed"
-        ).scalar() or 0
+        # Total comes from the shared status counts instead of a second scan
+        counts = _str_review_status_counts(db)
+        if status in ("unreviewed", "confirmed", "rejected", "skipped"):
+            total = counts[status]
+        else:
+            total = counts["total"]
+
+        query = query.offset(offset).limit(limit)
+        summary = {
+            "total": total,
+            "unreviewed_count": counts["unreviewed"],
+            "confirmed_count": counts["confirmed"],
+            "rejected_count": counts["rejected"],
+            "skipped_count": counts["skipped"],
+        }
 
-        rejected_count = db.query(func.count(STRReviewStatus.id)).filter(
-            STRReviewStatus.status == "rejected"
-        ).scalar() or 0
+        # Large pages stream from a server-side cursor; the generator owns the session
+        if limit > QUEUE_STREAM_THRESHOLD:
+            streaming = True
+            return StreamingResponse(
+                _stream_queue_response(db, query, summary), media_type="application/json"
+            )
 
-        skipped_count = db.query(func.count(STRReviewStatus.id)).filter(
-            STRReviewStatus.status == "skipped"
-        ).scalar() or 0
+        listings = query.all()
+        dwelling_counts = _candidate_dwelling_counts(db, listings)
+        items = [_queue_item_from_row(row, dwelling_counts) for row in listings]
 
-        return STRReviewQueueResponse(
-            items=items,
-            total=total,
-            unreviewed_count=unreviewed_count,
-            confirmed_count=confirmed_count,
-            rejected_count=rejected_count,
-            skipped_count=skipped_count,
-        )
+        # Encode straight to JSON bytes in pydantic-core; returning the model
+        # would round-trip it through jsonable Python objects and json.dumps
+        response = STRReviewQueueResponse(items=items, **summary)
+        return Response(response.model_dump_json(), media_type="application/json")
+    finally:
+        if not streaming:
+            db.close()
+
+
+def _candidate_dwelling_counts(db, rows) -> dict:
+    """Count dwellings for every parcel in a batch of queue rows in one query."""
+    parcel_ids = [row.parcel_id for row in rows if row.parcel_id]
+    if not parcel_ids:
+        return {}
+    return dict(
+        db.query(Dwelling.parcel_id, func.count(Dwelling.id))
+        .filter(Dwelling.parcel_id.in_(parcel_ids))
+        .group_by(Dwelling.parcel_id)
+        .all()
+    )
+
+
+def _queue_item_from_row(row, dwelling_counts: dict) -> STRReviewQueueItem:
+    """Build a queue item from a positional _QUEUE_COLUMNS row."""
+    (
+        id_, platform, listing_id, name, listing_url, lat, lng, bedrooms, max_guests,
+        price_per_night_usd, total_reviews, average_rating, match_method, match_confidence,
+        parcel_id, parcel_span, parcel_address, review_status, dwelling_id, reviewed_by,
+        reviewed_at,
+    ) = row
+    return STRReviewQueueItem(
+        id=id_,
+        platform=platform,
+        listing_id=listing_id,
+        name=name,
+        listing_url=listing_url,
+        lat=lat,
+        lng=lng,
+        bedrooms=bedrooms,
+        max_guests=max_guests,
+        price_per_night_usd=price_per_night_usd,
+        total_reviews=total_reviews,
+        average_rating=average_rating,
+        parcel_id=parcel_id,
+        parcel_span=parcel_span,
+        parcel_address=parcel_address,
+        match_method=match_method,
+        match_confidence=match_confidence,
+        review_status=review_status or "unreviewed",
+        dwelling_id=dwelling_id,
+        candidate_dwelling_count=dwelling_counts.get(parcel_id, 0),
+        reviewed_by=reviewed_by,
+        reviewed_at=reviewed_at,
+    )
+
+
+def _stream_queue_response(db, query, summary: dict):
+    """Yield an STRReviewQueueResponse JSON body, encoding rows batch by batch.
+
+    Rows come from a server-side cursor in QUEUE_STREAM_BATCH chunks, so
+    memory stays bounded and bytes reach the client while the scan runs.
+    """
+    try:
+        yield b'{"items":['
+        first = True
+        result = db.execute(query.statement, execution_options={"yield_per": QUEUE_STREAM_BATCH})
+        for batch in result.partitions():
+            dwelling_counts = _candidate_dwelling_counts(db, batch)
+            chunk = b",".join(
+                _queue_item_from_row(row, dwelling_counts).model_dump_json().encode()
+                for row in batch
+            )
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]," + json.dumps(summary, separators=(",", ":")).encode()[1:]
     finally:
         db.close()
 
 
+# Candidate dwellings on a parcel, scored and ranked for an STR listing.
+# Raw SQL to avoid ORM schema mismatch; mirrors compute_dwelling_match_scores().
+_CANDIDATE_DWELLINGS_SQL = text("""
+    WITH scored AS (
+        SELECT
+            d.id, d.unit_number, d.use_type, d.bedrooms,
+            d.tax_classification, d.homestead_filed, d.str_listing_id,
+            s.id as existing_str_id, s.name as existing_str_name,
+            (CASE
+                WHEN NULLIF(d.bedrooms, 0) = NULLIF(:listing_bedrooms, 0) THEN 0.4
+                WHEN ABS(NULLIF(d.bedrooms, 0) - NULLIF(:listing_bedrooms, 0)) = 1
+                THEN 0.2
+                ELSE 0
+            END)
+            + (CASE WHEN NOT COALESCE(d.homestead_filed, false) THEN 0.2 ELSE 0 END)
+            + (CASE
+                WHEN LOWER(d.use_type) LIKE '%rental%'
+                     OR LOWER(d.use_type) LIKE '%str%' THEN 0.3
+                WHEN LOWER(d.use_type) LIKE '%vacation%'
+                     OR LOWER(d.use_type) LIKE '%seasonal%' THEN 0.2
+                ELSE 0
+            END)
+            - (CASE WHEN d.str_listing_id IS NOT NULL THEN 0.2 ELSE 0 END)
+            AS raw_score
+        FROM dwellings d
+        LEFT JOIN str_listings s ON d.str_listing_id = s.id
+        WHERE d.parcel_id = :parcel_id
+    )
+    SELECT *, GREATEST(0, LEAST(1, raw_score))::float AS match_score
+    FROM scored
+    ORDER BY match_score DESC, unit_number
+""")
+
+
 @app.get("/api/admin/str-review/{listing_id}", dependencies=[Depends(verify_admin)])
-async def get_str_review_detail(listing_id: str) -> STRReviewDetailResponse:
+@retry_on_disconnect
+def get_str_review_detail(listing_id: UUID) -> STRReviewDetailResponse:
     """Get detailed STR listing with candidate dwellings."""
-    from uuid import UUID
     db = SessionLocal()
     try:
-        # Get listing with parcel and review status
-        listing_uuid = UUID(listing_id)
-        result = db.query(STRListing, Parcel, STRReviewStatus).outerjoin(
+        # Get listing with parcel, review status, and parcel GeoJSON in one query
+        result = db.query(
+            STRListing,
+            Parcel,
+            STRReviewStatus,
+            func.ST_AsGeoJSON(Parcel.geometry).label("parcel_geojson"),
+        ).outerjoin(
             Parcel, STRListing.parcel_id == Parcel.id
         ).outerjoin(
             STRReviewStatus, STRListing.id == STRReviewStatus.str_listing_id
-        ).filter(STRListing.id == listing_uuid).first()
+        ).filter(STRListing.id == listing_id).first()
 
         if not result:
             raise HTTPException(status_code=404, detail="STR listing not found")
 
-        listing, parcel, review_status = result
+        listing, parcel, review_status, geojson_result = result
 
-        # Get candidate dwellings on parcel using raw SQL to avoid ORM schema mismatch
+        # Get candidate dwellings on parcel, scored and ranked in SQL
         candidates = []
         if parcel:
-            dwelling_query = text("""
-                SELECT
-                    d.id, d.unit_number, d.use_type, d.bedrooms,
-                    d.tax_classification, d.homestead_filed, d.str_listing_id,
-                    s.id as existing_str_id, s.name as existing_str_name
-                FROM dwellings d
-                LEFT JOIN str_listings s ON d.str_listing_id = s.id
-                WHERE d.parcel_id = :parcel_id
-            """)
-            dwelling_rows = db.execute(dwelling_query, {"parcel_id": parcel.id}).fetchall()
+            dwelling_rows = db.execute(_CANDIDATE_DWELLINGS_SQL, {
+                "parcel_id": parcel.id,
+                "listing_bedrooms": listing.bedrooms,
+            }).fetchall()
 
             for row in dwelling_rows:
-                # Compute match score manually
-                score = 0.0
-                if listing.bedrooms and row.bedrooms:
-                    if listing.bedrooms == row.bedrooms:
-                        score += 0.4
-                    elif abs(listing.bedrooms - row.bedrooms) == 1:
-                        score += 0.2
-                if not row.homestead_filed:
-                    score += 0.2
-                if row.use_type:
-                    use_lower = row.use_type.lower()
-                    if "rental" in use_lower or "str" in use_lower:
-                        score += 0.3
-                    elif "vacation" in use_lower or "seasonal" in use_lower:
-                        score += 0.2
-                if row.str_listing_id:
-                    score -= 0.2
-                score = max(0.0, min(1.0, score))
-
                 candidates.append(CandidateDwelling(
-                    id=str(row.id),
+                    id=row.id,
                     unit_number=row.unit_number,
                     use_type=row.use_type,
                     bedrooms=row.bedrooms,
                     tax_classification=row.tax_classification,
                     homestead_filed=row.homestead_filed or False,
-                    existing_str_id=str(row.existing_str_id) if row.existing_str_id else None,
+                    existing_str_id=row.existing_str_id,
                     existing_str_name=row.existing_str_name,
-                    match_score=score,
+                    match_score=row.match_score,
                 ))
 
-            # Sort by match score descending
-            candidates.sort(key=lambda c: c.match_score, reverse=True)
-
-        # Get parcel GeoJSON
-        parcel_geojson = None
-        if parcel and parcel.geometry:
-            # Fetch GeoJSON from geometry column
-            geojson_result = db.execute(text(
-                "SELECT ST_AsGeoJSON(geometry) FROM parcels WHERE id = :id"
-            ), {"id": parcel.id}).scalar()
-            if geojson_result:
-                import json
-                parcel_geojson = json.loads(geojson_result)
+        # pydantic-core's Rust parser: much faster than json.loads on large polygons
+        parcel_geojson = from_json(geojson_result) if geojson_result else None
 
         candidate_count = len(candidates)
 
         queue_item = STRReviewQueueItem(
-            id=str(listing.id),
+            id=listing.id,
             platform=listing.platform,
             listing_id=listing.listing_id,
             name=listing.name,
             listing_url=listing.listing_url,
-            lat=float(listing.lat) if listing.lat else None,
-            lng=float(listing.lng) if listing.lng else None,
+            lat=listing.lat,
+            lng=listing.lng,
             bedrooms=listing.bedrooms,
             max_guests=listing.max_guests,
             price_per_night_usd=listing.price_per_night_usd,
             total_reviews=listing.total_reviews,
             average_rating=float(listing.average_rating) if listing.average_rating else None,
-            parcel_id=str(parcel.id) if parcel else None,
+            parcel_id=parcel.id if parcel else None,
             parcel_span=parcel.span if parcel else None,
             parcel_address=parcel.address if parcel else None,
             match_method=listing.match_method,
             match_confidence=float(listing.match_confidence) if listing.match_confidence else None,
             review_status=review_status.status if review_status else "unreviewed",
-            dwelling_id=str(review_status.dwelling_id) if review_status and review_status.dwelling_id else None,
+            dwelling_id=review_status.dwelling_id if review_status else None,
             candidate_dwelling_count=candidate_count,
             reviewed_by=review_status.reviewed_by if review_status else None,
-            reviewed_at=review_status.reviewed_at.isoformat() if review_status and review_status.reviewed_at else None,
+            reviewed_at=review_status.reviewed_at if review_status else None,
         )
 
         return STRReviewDetailResponse(
@@ -1055,80 +1246,88 @@ async def get_str_review_detail(listing_id: str) -> STRReviewDetailResponse:
 
 
 @app.put("/api/admin/str-review/{listing_id}/link", dependencies=[Depends(verify_admin)])
-async def update_str_review(
-    listing_id: str,
+def update_str_review(
+    listing_id: UUID,
     action: STRReviewAction,
 ) -> STRReviewActionResponse:
     """Confirm, reject, or skip an STR-dwelling link."""
-    from uuid import UUID
     db = SessionLocal()
     try:
-        listing_uuid = UUID(listing_id)
-
-        # Get or create review status
-        review_status = db.query(STRReviewStatus).filter(
-            STRReviewStatus.str_listing_id == listing_uuid
-        ).first()
-
-        if not review_status:
-            # Verify listing exists
-            listing = db.query(STRListing).filter(STRListing.id == listing_uuid).first()
-            if not listing:
-                raise HTTPException(status_code=404, detail="STR listing not found")
-
-            review_status = STRReviewStatus(
-                str_listing_id=listing_uuid,
-                status="unreviewed",
-            )
-            db.add(review_status)
+        dwelling_uuid = action.dwelling_id if action.action == "confirm" else None
+
+        # One round-trip: listing and target dwelling existence.
+        # Locks the listing row so concurrent reviews of it serialize.
+        row = db.query(
+            STRListing.id,
+            Dwelling.id.label("target_dwelling_id"),
+        ).outerjoin(
+            Dwelling, Dwelling.id == dwelling_uuid
+        ).filter(
+            STRListing.id == listing_id
+        ).with_for_update(of=STRListing).first()
+
+        if not row:
+            raise HTTPException(status_code=404, detail="STR listing not found")
 
         # Process action
         if action.action == "confirm":
-            dwelling_uuid = UUID(action.dwelling_id)
-
-            # Verify dwelling exists
-            dwelling = db.query(Dwelling).filter(Dwelling.id == dwelling_uuid).first()
-            if not dwelling:
+            if not row.target_dwelling_id:
                 raise HTTPException(status_code=404, detail="Dwelling not found")
 
-            # Update review status
-            review_status.status = "confirmed"
-            review_status.dwelling_id = dwelling_uuid
-            review_status.rejection_reason = None
-            review_status.notes = action.notes
-            review_status.reviewed_by = "admin"  # TODO: get from auth
-            review_status.reviewed_at = datetime.utcnow()
+            review_values = {
+                "status": "confirmed",
+                "dwelling_id": dwelling_uuid,
+                "rejection_reason": None,
+                "notes": action.notes,
+            }
 
             # Set the canonical link on the dwelling
-            dwelling.str_listing_id = listing_uuid
+            db.query(Dwelling).filter(Dwelling.id == dwelling_uuid).update(
+                {Dwelling.str_listing_id: listing_id}, synchronize_session=False
+            )
 
             message = f"Linked STR to dwelling {action.dwelling_id}"
 
         elif action.action == "reject":
-            review_status.status = "rejected"
-            review_status.dwelling_id = None
-            review_status.rejection_reason = action.rejection_reason
-            review_status.notes = action.notes
-            review_status.reviewed_by = "admin"
-            review_status.reviewed_at = datetime.utcnow()
+            review_values = {
+                "status": "rejected",
+                "dwelling_id": None,
+                "rejection_reason": action.rejection_reason,
+                "notes": action.notes,
+            }
 
-            message = f"Rejected: {action.rejection_reason}"
+            message = f"Rejected: {action.rejection_reason.value}"
 
         elif action.action == "skip":
-            review_status.status = "skipped"
-            review_status.notes = action.notes
-            review_status.reviewed_by = "admin"
-            review_status.reviewed_at = datetime.utcnow()
+            review_values = {
+                "status": "skipped",
+                "notes": action.notes,
+            }
 
             message = "Skipped for later review"
 
+        now = datetime.utcnow()
+        review_values["reviewed_by"] = "admin"  # TODO: get from auth
+        review_values["reviewed_at"] = now
+
+        # Create or update the review status in one statement
+        db.execute(
+            pg_insert(STRReviewStatus)
+            .values(str_listing_id=listing_id, **review_values)
+            .on_conflict_do_update(
+                index_elements=[STRReviewStatus.str_listing_id],
+                set_={**review_values, "updated_at": now},
+            )
+        )
+
         db.commit()
+        _status_counts_cache["timestamp"] = 0
 
         return STRReviewActionResponse(
             success=True,
-            listing_id=listing_id,
+            listing_id=str(listing_id),
             action=action.action,
-            dwelling_id=action.dwelling_id,
+            dwelling_id=str(dwelling_uuid) if dwelling_uuid else None,
             message=message,
         )
     except HTTPException:
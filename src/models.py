@@ -11,7 +11,7 @@ Key Concepts:
 - is_owner_occupied: WHO lives there (owner vs tenant) - determines tax classification
 - STR listings: SEPARATE DATA that can attach to any dwelling
 
-Tax Classification (derived, not stored):
+Tax Classification (derived; a generated column on dwellings):
 - HOMESTEAD: dwelling_use=FULL_TIME_RESIDENCE + is_owner_occupied=True
 - NHS_RESIDENTIAL: second_home, short_term_rental, vacant (1-4 units)
 - NHS_NONRESIDENTIAL: long-term rental, commercial, 5+ units
@@ -22,44 +22,88 @@ References:
 - See src/schemas.py for Pydantic validation models
 """
 
+import io
+import json
+import os
+import time
 import uuid
+from collections.abc import Iterable, Sequence
 from datetime import date, datetime
 from decimal import Decimal
 
-from geoalchemy2 import Geometry
-from pgvector.sqlalchemy import Vector
+from geoalchemy2 import Geography, Geometry
+from pgvector.sqlalchemy import HALFVEC
 from sqlalchemy import (
+    CHAR,
     Boolean,
+    CheckConstraint,
+    Column,
+    Computed,
     Date,
     DateTime,
     Enum as SQLEnum,
+    FetchedValue,
+    Float,
     ForeignKey,
     Index,
     Integer,
+    MetaData,
     Numeric,
+    SmallInteger,
     String,
+    Table,
     Text,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID, insert as pg_insert
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .database import Base
 from .schemas import (
+    DataSource,
     DwellingType,
     DwellingUse,
     OrganizationType,
     OwnershipType,
+    STRMatchMethod,
+    STRPlatform,
+    STRRejectionReason,
     TaxClassification,
 )
 
 
+
+def _enum_values(enum_cls) -> list[str]:
+    """Enum labels for SQLEnum(values_callable=...): store values, not member names."""
+    return [member.value for member in enum_cls]
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    48-bit Unix milliseconds followed by random bits: new primary keys land
+    on the right-hand edge of the B-tree instead of a random leaf.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    return uuid.UUID(int=(
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                            # version
+        | (rand >> 62 & 0xFFF) << 64           # rand_a
+        | 0b10 << 62                           # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF         # rand_b
+    ))
+
+
 class Parcel(Base):
     """A property parcel in Warren, VT."""
 
     __tablename__ = "parcels"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     span: Mapped[str] = mapped_column(String(20), unique=True, nullable=False, index=True)
     address: Mapped[str | None] = mapped_column(Text)
@@ -82,7 +126,7 @@ class Parcel(Base):
     lat: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
     lng: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
     geometry: Mapped[str | None] = mapped_column(Geometry("MULTIPOLYGON", srid=4326))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     property_ownerships: Mapped[list["PropertyOwnership"]] = relationship(
@@ -103,13 +147,33 @@ class Parcel(Base):
         return f"<Parcel {self.span}: {self.address}>"
 
 
+class ParcelGeohashCell(Base):
+    """A geohash-8 cell touched by a parcel's polygon.
+
+    Derived from Parcel.geometry: the STR import covers parcels that have no
+    cells yet, and a trigger (created by init_db) deletes a parcel's cells
+    when its geometry changes so the next import recomputes them. STR listings
+    match parcels by an indexed equi-join on their own geohash8.
+    """
+
+    __tablename__ = "parcel_geohash_cells"
+
+    geohash8: Mapped[str] = mapped_column(CHAR(8), primary_key=True)
+    parcel_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("parcels.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
+
+
 class TaxStatus(Base):
     """Tax status for a parcel in a given year."""
 
     __tablename__ = "tax_status"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     parcel_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("parcels.id"), nullable=False
@@ -154,7 +218,7 @@ class Person(Base):
     __tablename__ = "people"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # Identity
@@ -174,6 +238,12 @@ class Person(Base):
         String(20),
         doc="Name suffix: Jr, Sr, III, etc."
     )
+    display_name: Mapped[str] = mapped_column(
+        String(220),
+        Computed("first_name || ' ' || last_name || COALESCE(' ' || suffix, '')", persisted=True),
+        index=True,
+        doc="Full display name with suffix (generated by Postgres)"
+    )
 
     # Contact
     email: Mapped[str | None] = mapped_column(
@@ -210,16 +280,16 @@ class Person(Base):
     )
 
     # Data provenance
-    data_sources: Mapped[list[str] | None] = mapped_column(
-        ARRAY(String),
-        doc="Where we learned about this person: ['grand_list', 'fpf', 'pttr', 'manual']"
+    data_sources_mask: Mapped[int] = mapped_column(
+        SmallInteger, default=0, server_default="0", index=True,
+        doc="Where we learned about this person, as DataSource bit flags"
     )
     notes: Mapped[str | None] = mapped_column(Text)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -233,16 +303,41 @@ class Person(Base):
         "FPFPerson", foreign_keys=[fpf_person_id]
     )
 
+    __table_args__ = (
+        # Trigram indexes shortlist fuzzy dedup candidates in SQL (pg_trgm)
+        Index(
+            'ix_people_full_name_trgm', 'full_name',
+            postgresql_using='gin', postgresql_ops={'full_name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_people_last_name_trgm', 'last_name',
+            postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_people_display_name_trgm', 'display_name',
+            postgresql_using='gin', postgresql_ops={'display_name': 'gin_trgm_ops'},
+        ),
+    )
+
     def __repr__(self) -> str:
-        return f"<Person {self.first_name} {self.last_name}>"
+        return f"<Person {self.display_name}>"
 
     @property
-    def display_name(self) -> str:
-        """Full display name with suffix."""
-        name = f"{self.first_name} {self.last_name}"
-        if self.suffix:
-            name += f" {self.suffix}"
-        return name
+    def data_sources(self) -> list[str]:
+        """Data sources as names (e.g. ['grand_list', 'fpf']), for API compatibility."""
+        return [s.name.lower() for s in DataSource if self.data_sources_mask & s]
+
+    @data_sources.setter
+    def data_sources(self, names: list[str]) -> None:
+        mask = DataSource(0)
+        for name in names:
+            mask |= DataSource[name.upper()]
+        self.data_sources_mask = int(mask)
+
+
+# Phonetic last-name lookups (fuzzystrmatch); defined after the class because
+# it is an expression index
+Index('ix_people_last_name_metaphone', func.metaphone(Person.last_name, 10))
 
 
 class PropertyOwnership(Base):
@@ -262,12 +357,12 @@ class PropertyOwnership(Base):
     __tablename__ = "property_ownerships"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
-    # Link to parcel
+    # Link to parcel (indexed by the composite indexes below)
     parcel_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("parcels.id"), nullable=False, index=True
+        UUID(as_uuid=True), ForeignKey("parcels.id"), nullable=False
     )
 
     # Owner: exactly one of these must be set
@@ -322,10 +417,10 @@ class PropertyOwnership(Base):
         doc="Where this ownership record came from: 'grand_list', 'pttr', 'manual'"
     )
 
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    # Timestamps (server-side so bulk inserts don't compute them per row)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -338,12 +433,57 @@ class PropertyOwnership(Base):
         "Dwelling", back_populates="property_ownerships"
     )
 
+    __table_args__ = (
+        # Natural key for bulk upserts; NULLS NOT DISTINCT so the unused
+        # person_id/organization_id (and dwelling_id) still collide
+        Index(
+            'ix_property_ownership_natural_key',
+            'parcel_id', 'dwelling_id', 'person_id', 'organization_id',
+            unique=True, postgresql_nulls_not_distinct=True,
+        ),
+        # "Who is the primary owner of parcel X" answered by an index-only scan
+        Index(
+            'ix_po_parcel_primary_covering', 'parcel_id', 'is_primary_owner',
+            postgresql_include=['person_id', 'organization_id', 'ownership_share'],
+        ),
+        # Current owners only; skips historical (disposed) rows
+        Index('ix_po_current', 'parcel_id', postgresql_where=text('disposed_date IS NULL')),
+        # Owner: exactly one of person_id/organization_id
+        CheckConstraint(
+            '(person_id IS NULL) <> (organization_id IS NULL)', name='ck_po_single_owner'
+        ),
+        Index('ix_po_person_only', 'person_id', postgresql_where=text('organization_id IS NULL')),
+        Index('ix_po_org_only', 'organization_id', postgresql_where=text('person_id IS NULL')),
+    )
+
     def __repr__(self) -> str:
-        owner = self.person.display_name if self.person else (
-            self.organization.name if self.organization else "Unknown"
-        )
+        # FKs only, so logging an ownership never triggers a lazy load
+        owner = self.person_id or self.organization_id
         return f"<PropertyOwnership {owner} @ parcel {self.parcel_id}>"
 
+    @classmethod
+    def bulk_upsert(cls, session, rows: list[dict], chunk_size: int = 1000) -> None:
+        """Insert ownership rows with multi-row INSERTs, updating on natural-key conflict.
+
+        All rows must have the same keys. Bypasses the ORM unit of work, so
+        referenced parcels, dwellings, people, and organizations must already
+        be flushed.
+        """
+        for start in range(0, len(rows), chunk_size):
+            stmt = pg_insert(cls).values(rows[start:start + chunk_size])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['parcel_id', 'dwelling_id', 'person_id', 'organization_id'],
+                set_={
+                    "ownership_share": stmt.excluded.ownership_share,
+                    "ownership_type": stmt.excluded.ownership_type,
+                    "is_primary_owner": stmt.excluded.is_primary_owner,
+                    "as_listed_name": stmt.excluded.as_listed_name,
+                    "data_source": stmt.excluded.data_source,
+                    "updated_at": func.now(),
+                },
+            )
+            session.execute(stmt)
+
 
 class OrganizationMembership(Base):
     """Records membership/roles in organizations.
@@ -362,7 +502,7 @@ class OrganizationMembership(Base):
     __tablename__ = "organization_memberships"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     person_id: Mapped[uuid.UUID] = mapped_column(
@@ -392,7 +532,7 @@ class OrganizationMembership(Base):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     person: Mapped["Person"] = relationship("Person", back_populates="organization_memberships")
@@ -420,12 +560,15 @@ class ChangeLog(Base):
     - Accountability for manual corrections
 
     Triggered automatically via PostgreSQL triggers for key tables.
+
+    Range-partitioned by month on changed_at (partitions are created by
+    init_db), so the primary key must include changed_at.
     """
 
     __tablename__ = "change_log"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # What changed
@@ -445,13 +588,13 @@ class ChangeLog(Base):
         String(50),
         doc="Which field changed (null for create/delete)"
     )
-    old_value: Mapped[str | None] = mapped_column(
-        Text,
-        doc="Previous value (JSON for complex types)"
+    old_value: Mapped[object | None] = mapped_column(
+        JSONB,
+        doc="Previous value (any JSON value)"
     )
-    new_value: Mapped[str | None] = mapped_column(
-        Text,
-        doc="New value (JSON for complex types)"
+    new_value: Mapped[object | None] = mapped_column(
+        JSONB,
+        doc="New value (any JSON value)"
     )
 
     # Who/why
@@ -470,7 +613,7 @@ class ChangeLog(Base):
 
     # When
     changed_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=func.now(), primary_key=True, index=True
     )
 
     # Verification
@@ -481,12 +624,60 @@ class ChangeLog(Base):
     # Indexes
     __table_args__ = (
         Index('ix_change_log_table_record', 'table_name', 'record_id'),
+        {'postgresql_partition_by': 'RANGE (changed_at)'},
     )
 
     def __repr__(self) -> str:
         return f"<ChangeLog {self.change_type} {self.table_name}.{self.field_name}>"
 
 
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text(value) -> str:
+    """Encode a value as a COPY text-format field (\\N for NULL)."""
+    if value is None:
+        return "\\N"
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_rows(
+    session,
+    table_name: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+    chunk_rows: int = 10_000,
+) -> int:
+    """COPY rows into a table on the session's connection. Returns rows written.
+
+    Each row is a sequence ordered like `columns`. Rows are consumed lazily and
+    sent in chunks of `chunk_rows`, so a generator keeps memory flat. COPY skips
+    Python-side column defaults: pass every column that needs a value (ids
+    included). Meant for tables without ORM-managed relationships, e.g. Bronze.
+    """
+    cursor = session.connection().connection.cursor()
+    sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+    buf = io.StringIO()
+    written = 0
+    for row in rows:
+        buf.write("\t".join(_copy_text(value) for value in row))
+        buf.write("\n")
+        written += 1
+        if written % chunk_rows == 0:
+            buf.seek(0)
+            cursor.copy_expert(sql, buf)
+            buf = io.StringIO()
+    if buf.tell():
+        buf.seek(0)
+        cursor.copy_expert(sql, buf)
+    return written
+
+
+# Compact encoder for payloads bound for jsonb columns such as bronze raw_json:
+# jsonb drops whitespace and decodes \u escapes, so don't produce them
+encode_raw_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
 # Persistence models for conversations and artifacts
 
 class Conversation(Base):
@@ -495,13 +686,13 @@ class Conversation(Base):
     __tablename__ = "conversations"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     user_id: Mapped[str | None] = mapped_column(String(100))
     title: Mapped[str | None] = mapped_column(Text)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -514,14 +705,14 @@ class Message(Base):
     __tablename__ = "messages"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     conversation_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=False
     )
     role: Mapped[str] = mapped_column(String(20), nullable=False)  # user, assistant, tool
     content: Mapped[str] = mapped_column(Text, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     conversation: Mapped["Conversation"] = relationship("Conversation", back_populates="messages")
@@ -534,7 +725,7 @@ class Artifact(Base):
     __tablename__ = "artifacts"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     message_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("messages.id"), nullable=False
@@ -542,7 +733,7 @@ class Artifact(Base):
     artifact_type: Mapped[str] = mapped_column(String(20), nullable=False)  # map, chart, table
     data: Mapped[str] = mapped_column(Text, nullable=False)  # JSON string
     is_public: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     message: Mapped["Message"] = relationship("Message", back_populates="artifacts")
@@ -569,7 +760,7 @@ class FPFIssue(Base):
     __tablename__ = "fpf_issues"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     issue_number: Mapped[int | None] = mapped_column(Integer, unique=True, index=True)
     published_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -589,35 +780,68 @@ class FPFPerson(Base):
     __tablename__ = "fpf_people"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     name: Mapped[str] = mapped_column(Text, nullable=False, index=True)
     email: Mapped[str | None] = mapped_column(String(255), unique=True)
     road: Mapped[str | None] = mapped_column(Text)
     town: Mapped[str | None] = mapped_column(String(50), index=True)
-    first_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    last_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    first_seen_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     posts: Mapped[list["FPFPost"]] = relationship("FPFPost", back_populates="person")
 
+    __table_args__ = (
+        # Fuzzy Person <-> FPF name linking (scripts/community/link_fpf_people.py)
+        Index(
+            'ix_fpf_people_name_trgm', 'name',
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<FPFPerson {self.name}>"
 
+    @classmethod
+    def upsert_batch(cls, session, rows: list[dict]) -> dict[str, uuid.UUID]:
+        """Insert-or-touch people by email in one statement. Returns {email: id}.
+
+        Rows need email, name, road, town, first_seen_at and last_seen_at;
+        emails must be unique within the batch. Existing people keep their
+        name and only have their seen-at window widened.
+        """
+        if not rows:
+            return {}
+        stmt = pg_insert(cls).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['email'],
+            set_={
+                "first_seen_at": func.least(cls.first_seen_at, stmt.excluded.first_seen_at),
+                "last_seen_at": func.greatest(cls.last_seen_at, stmt.excluded.last_seen_at),
+            },
+        ).returning(cls.id, cls.email)
+        return {email: person_id for person_id, email in session.execute(stmt)}
+
 
 class FPFPost(Base):
-    """An individual post from an FPF digest."""
+    """An individual post from an FPF digest.
+
+    Hash-partitioned by person_id (FPF_POST_PARTITIONS partitions, created
+    by init_db), so the primary key includes person_id and a person's
+    timeline only touches one partition.
+    """
 
     __tablename__ = "fpf_posts"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     issue_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("fpf_issues.id"), nullable=False
     )
     person_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("fpf_people.id"), nullable=False
+        UUID(as_uuid=True), ForeignKey("fpf_people.id"), primary_key=True
     )
     title: Mapped[str] = mapped_column(Text, nullable=False)
     content: Mapped[str] = mapped_column(Text, nullable=False)
@@ -625,8 +849,12 @@ class FPFPost(Base):
     is_reply: Mapped[bool] = mapped_column(Boolean, default=False)
     published_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
-    # Embedding columns for semantic search (3072 dims for text-embedding-3-large)
-    embedding: Mapped[list[float] | None] = mapped_column(Vector(3072), nullable=True)
+    # Embedding columns for semantic search (text-embedding-3-small, stored as FP16).
+    # Deferred: the vector dwarfs the rest of the row and is only needed by
+    # the <=> ORDER BY in SQL, so loading a post never fetches it implicitly.
+    embedding: Mapped[list[float] | None] = mapped_column(
+        HALFVEC(1536), nullable=True, deferred=True, deferred_group="embedding"
+    )
     embedding_model: Mapped[str | None] = mapped_column(String(50), nullable=True)
     embedded_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
@@ -634,10 +862,18 @@ class FPFPost(Base):
     issue: Mapped["FPFIssue"] = relationship("FPFIssue", back_populates="posts")
     person: Mapped["FPFPerson"] = relationship("FPFPerson", back_populates="posts")
 
+    __table_args__ = (
+        {'postgresql_partition_by': 'HASH (person_id)'},
+    )
+
     def __repr__(self) -> str:
         return f"<FPFPost {self.title[:30]}>"
 
 
+# Person timeline, newest first (built per partition)
+Index('ix_fpf_posts_person_published', FPFPost.person_id, FPFPost.published_at.desc())
+
+
 class Organization(Base):
     """An entity that can own property or have members.
 
@@ -662,7 +898,7 @@ class Organization(Base):
     __tablename__ = "organizations"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # Identity
@@ -702,9 +938,9 @@ class Organization(Base):
     notes: Mapped[str | None] = mapped_column(Text)
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
@@ -718,10 +954,19 @@ class Organization(Base):
         "Person", foreign_keys=[primary_person_id]
     )
 
+    __table_args__ = (
+        Index(
+            'ix_organizations_name_trgm', 'name',
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+        # Organization.can_file_homestead
+        Index('ix_org_homestead_eligible', 'id', postgresql_where=text("org_type = 'TRUST'")),
+    )
+
     def __repr__(self) -> str:
         return f"<Organization {self.name}>"
 
-    @property
+    @hybrid_property
     def can_file_homestead(self) -> bool:
         """True if this organization type can file a homestead declaration.
 
@@ -731,10 +976,15 @@ class Organization(Base):
         return self.org_type == OrganizationType.TRUST
 
 
-# Note: pgvector 0.7.4 limits HNSW/IVFFlat indexes to 2000 dimensions.
-# With text-embedding-3-large (3072 dims), we use sequential scan which is
-# still fast for ~60k posts. For larger datasets, consider using the
-# text-embedding-3-small model (1536 dims) with HNSW indexing.
+# FPF post embeddings are 1536-dim halfvecs, small enough for an HNSW index
+# (pgvector limits indexed dimensions). Search must ORDER BY the <=> distance
+# for the planner to use it.
+Index(
+    'ix_fpf_post_embedding_hnsw', FPFPost.embedding,
+    postgresql_using='hnsw',
+    postgresql_ops={'embedding': 'halfvec_cosine_ops'},
+    postgresql_with={'m': 16, 'ef_construction': 64},
+)
 
 
 # =============================================================================
@@ -760,16 +1010,20 @@ class BronzePTTRTransfer(Base):
 
     This is the raw data exactly as received from the API. Do not transform
     or validate here - that happens in the Silver layer.
+
+    Range-partitioned by fetched_at month (partitions created by init_db), so
+    the primary key includes fetched_at and objectid can only be indexed, not
+    unique; import_pttr.py skips objectids it has already stored.
     """
 
     __tablename__ = "bronze_pttr_transfers"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # API identifiers
-    objectid: Mapped[int] = mapped_column(Integer, unique=True, nullable=False, index=True)
+    objectid: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     globalid: Mapped[str | None] = mapped_column(String(50))
 
     # Property identification - RAW (may have formatting issues)
@@ -795,14 +1049,20 @@ class BronzePTTRTransfer(Base):
     property_type_code: Mapped[str | None] = mapped_column(String(50))
 
     # Location - RAW from API
-    lat: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
-    lng: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
+    lat: Mapped[float | None] = mapped_column(Float)
+    lng: Mapped[float | None] = mapped_column(Float)
 
     # Metadata
-    raw_json: Mapped[str | None] = mapped_column(Text)  # Full API response for debugging
-    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    raw_json: Mapped[dict | None] = mapped_column(JSONB, deferred=True)  # Full API response
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), primary_key=True
+    )
     api_source: Mapped[str] = mapped_column(String(100), default="vcgi_pttr")
 
+    __table_args__ = (
+        {'postgresql_partition_by': 'RANGE (fetched_at)'},
+    )
+
     def __repr__(self) -> str:
         return f"<BronzePTTR {self.span} ${self.sale_price} {self.transfer_date}>"
 
@@ -822,7 +1082,7 @@ class BronzeSTRListing(Base):
     __tablename__ = "bronze_str_listings"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # Platform identification
@@ -840,8 +1100,8 @@ class BronzeSTRListing(Base):
     city: Mapped[str | None] = mapped_column(String(100))
     state: Mapped[str | None] = mapped_column(String(50))
     zip_code: Mapped[str | None] = mapped_column(String(20))
-    lat: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
-    lng: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
+    lat: Mapped[float | None] = mapped_column(Float)
+    lng: Mapped[float | None] = mapped_column(Float)
 
     # Capacity/Size
     bedrooms: Mapped[int | None] = mapped_column(Integer)
@@ -864,8 +1124,8 @@ class BronzeSTRListing(Base):
     last_review_date: Mapped[datetime | None] = mapped_column(DateTime)
 
     # Metadata
-    raw_json: Mapped[str | None] = mapped_column(Text)  # Full scraper output
-    scraped_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    raw_json: Mapped[dict | None] = mapped_column(JSONB, deferred=True)  # Full scraper output
+    scraped_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     scraper_run_id: Mapped[str | None] = mapped_column(String(100))
     api_source: Mapped[str | None] = mapped_column(String(50))  # "airroi", "apify_airbnb", etc.
 
@@ -874,6 +1134,31 @@ class BronzeSTRListing(Base):
         Index('ix_bronze_str_platform_listing', 'platform', 'listing_id', unique=True),
     )
 
+    @classmethod
+    def upsert_batch(cls, session, rows: list[dict]) -> int:
+        """Insert new listings and refresh known ones in place. Returns rows written.
+
+        Keyed on ix_bronze_str_platform_listing; all rows need the same keys,
+        and a repeated (platform, listing_id) keeps its last row. Refreshed
+        listings take the new scrape's values and scraped_at but keep their
+        id, so Silver rows still point at them. Runs as multi-VALUES batches
+        of the engine's insertmanyvalues_page_size.
+        """
+        if not rows:
+            return 0
+        rows = list({(row["platform"], row["listing_id"]): row for row in rows}.values())
+        stmt = pg_insert(cls)
+        refreshed = rows[0].keys() - {"id", "platform", "listing_id"}
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['platform', 'listing_id'],
+            set_={
+                **{column: stmt.excluded[column] for column in refreshed},
+                "scraped_at": func.now(),
+            },
+        )
+        session.execute(stmt, rows)
+        return len(rows)
+
     def __repr__(self) -> str:
         return f"<BronzeSTR {self.platform}:{self.listing_id}>"
 
@@ -894,13 +1179,12 @@ class PropertyTransfer(Base):
     __tablename__ = "property_transfers"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
-    # Link to bronze source
-    bronze_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("bronze_pttr_transfers.id"), nullable=False
-    )
+    # Link to bronze source. Not a foreign key: Postgres can only reference a
+    # partitioned table through a key that includes the partition column
+    bronze_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
 
     # Link to parcel (may be null if SPAN doesn't match)
     parcel_id: Mapped[uuid.UUID | None] = mapped_column(
@@ -908,17 +1192,17 @@ class PropertyTransfer(Base):
     )
 
     # Validated identifiers
-    span: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    span: Mapped[str] = mapped_column(String(20), nullable=False)
 
     # Validated transfer details
     sale_price: Mapped[int] = mapped_column(Integer, nullable=False)
-    transfer_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    transfer_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     transfer_type: Mapped[str | None] = mapped_column(String(100))
 
     # Normalized buyer info
     buyer_name: Mapped[str | None] = mapped_column(Text)
     buyer_state: Mapped[str | None] = mapped_column(String(2))  # Normalized to 2-letter code
-    is_out_of_state_buyer: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    is_out_of_state_buyer: Mapped[bool] = mapped_column(Boolean, default=False)
 
     # Seller info
     seller_name: Mapped[str | None] = mapped_column(Text)
@@ -929,12 +1213,26 @@ class PropertyTransfer(Base):
     is_secondary_residence: Mapped[bool | None] = mapped_column(Boolean)
 
     # Validation metadata
-    validated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    validated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     validation_notes: Mapped[str | None] = mapped_column(Text)
 
     # Relationships
     parcel: Mapped["Parcel"] = relationship("Parcel", foreign_keys=[parcel_id])
-    bronze_record: Mapped["BronzePTTRTransfer"] = relationship("BronzePTTRTransfer")
+    bronze_record: Mapped["BronzePTTRTransfer"] = relationship(
+        "BronzePTTRTransfer",
+        primaryjoin="foreign(PropertyTransfer.bronze_id) == BronzePTTRTransfer.id",
+    )
+
+    __table_args__ = (
+        CheckConstraint("buyer_state ~ '^[A-Z]{2}$'", name='ck_pt_buyer_state_code'),
+        # Transfer history by SPAN, ordered by date
+        Index('ix_pt_span_date', 'span', 'transfer_date'),
+        # Out-of-state buyers are the minority; index only those rows
+        Index(
+            'ix_pt_out_of_state_buyer', 'transfer_date', 'span',
+            postgresql_where=text('is_out_of_state_buyer'),
+        ),
+    )
 
     def __repr__(self) -> str:
         return f"<PropertyTransfer {self.span} ${self.sale_price} {self.transfer_date}>"
@@ -954,7 +1252,7 @@ class STRListing(Base):
     __tablename__ = "str_listings"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # Link to bronze source
@@ -964,13 +1262,17 @@ class STRListing(Base):
 
     # Link to parcel (may be null if no match)
     parcel_id: Mapped[uuid.UUID | None] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("parcels.id"), nullable=True, index=True
+        UUID(as_uuid=True), ForeignKey("parcels.id"), nullable=True
+    )
+    match_method: Mapped[STRMatchMethod | None] = mapped_column(
+        SQLEnum(STRMatchMethod, values_callable=_enum_values)
     )
-    match_method: Mapped[str | None] = mapped_column(String(50))  # spatial, spatial_centroid, address, manual
     match_confidence: Mapped[Decimal | None] = mapped_column(Numeric(3, 2))  # 0.00 to 1.00
 
     # Platform info
-    platform: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    platform: Mapped[STRPlatform] = mapped_column(
+        SQLEnum(STRPlatform, values_callable=_enum_values), nullable=False, index=True
+    )
     listing_id: Mapped[str] = mapped_column(String(100), nullable=False)
     listing_url: Mapped[str | None] = mapped_column(Text)
 
@@ -979,8 +1281,19 @@ class STRListing(Base):
     property_type: Mapped[str | None] = mapped_column(String(50))  # Normalized
 
     # Validated location
-    lat: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
-    lng: Mapped[Decimal | None] = mapped_column(Numeric(9, 6))
+    lat: Mapped[float | None] = mapped_column(Float)
+    lng: Mapped[float | None] = mapped_column(Float)
+    # Point derived from lat/lng, GiST-indexed for spatial joins
+    geom: Mapped[str | None] = mapped_column(
+        Geography("POINT", srid=4326, spatial_index=False),
+        Computed("ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography", persisted=True),
+    )
+    # Geohash cell of the point, equi-joined against ParcelGeohashCell
+    geohash8: Mapped[str | None] = mapped_column(
+        CHAR(8),
+        Computed("ST_GeoHash(ST_SetSRID(ST_MakePoint(lng, lat), 4326), 8)", persisted=True),
+        index=True,
+    )
 
     # Capacity
     bedrooms: Mapped[int | None] = mapped_column(Integer)
@@ -992,16 +1305,26 @@ class STRListing(Base):
     # Activity metrics
     total_reviews: Mapped[int | None] = mapped_column(Integer)
     average_rating: Mapped[Decimal | None] = mapped_column(Numeric(3, 2))
-    is_active: Mapped[bool] = mapped_column(Boolean, default=True, index=True)
+    is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
     # Validation metadata
-    validated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    last_seen_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    validated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
+    last_seen_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
 
     # Relationships
     parcel: Mapped["Parcel"] = relationship("Parcel", foreign_keys=[parcel_id])
     bronze_record: Mapped["BronzeSTRListing"] = relationship("BronzeSTRListing")
 
+    __table_args__ = (
+        Index('ix_str_listings_geom', 'geom', postgresql_using='gist'),
+        Index('ix_str_parcel_active', 'parcel_id', 'is_active'),
+        Index(
+            'ix_str_listings_active', 'parcel_id',
+            postgresql_where=text('is_active'),
+            postgresql_include=['price_per_night_usd', 'bedrooms'],
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<STRListing {self.platform}:{self.listing_id}>"
 
@@ -1029,7 +1352,7 @@ class STRReviewStatus(Base):
     __tablename__ = "str_review_status"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     str_listing_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("str_listings.id"),
@@ -1039,7 +1362,7 @@ class STRReviewStatus(Base):
 
     # Review state
     status: Mapped[str] = mapped_column(
-        String(20), default="unreviewed", index=True,
+        String(20), default="unreviewed",
         doc="Review status: unreviewed, confirmed, rejected, skipped"
     )
 
@@ -1050,9 +1373,10 @@ class STRReviewStatus(Base):
     )
 
     # Rejection info (set when status=rejected)
-    rejection_reason: Mapped[str | None] = mapped_column(
-        String(100),
-        doc="Reason for rejection: not_in_warren, duplicate, invalid, cannot_determine, other"
+    rejection_reason: Mapped[STRRejectionReason | None] = mapped_column(
+        SQLEnum(STRRejectionReason, values_callable=_enum_values),
+        doc="Reason for rejection: not_str, duplicate, wrong_location, "
+            "no_matching_dwelling, other"
     )
 
     # Audit trail
@@ -1070,15 +1394,20 @@ class STRReviewStatus(Base):
     )
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
     str_listing: Mapped["STRListing"] = relationship("STRListing")
     dwelling: Mapped["Dwelling | None"] = relationship("Dwelling")
 
+    __table_args__ = (
+        # Queue/stats filter by status and join on str_listing_id
+        Index('ix_str_review_status_status_listing', 'status', 'str_listing_id'),
+    )
+
     def __repr__(self) -> str:
         return f"<STRReviewStatus {self.str_listing_id} status={self.status}>"
 
@@ -1122,7 +1451,7 @@ class Dwelling(Base):
        - ANY dwelling can have STR listing, even FULL_TIME_RESIDENCE
        - dwelling_use=SHORT_TERM_RENTAL means STR is PRIMARY use
 
-    Tax Classification (DERIVED, not stored):
+    Tax Classification (DERIVED, generated column computed by Postgres):
     - HOMESTEAD: dwelling_use=FULL_TIME_RESIDENCE + is_owner_occupied=True
     - NHS_RESIDENTIAL: second_home, short_term_rental, vacant (1-4 units)
     - NHS_NONRESIDENTIAL: is_owner_occupied=False (LTR), commercial, 5+ units
@@ -1137,14 +1466,14 @@ class Dwelling(Base):
     __tablename__ = "dwellings"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # ==========================================================================
     # PARCEL RELATIONSHIP
     # ==========================================================================
     parcel_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("parcels.id"), nullable=False, index=True,
+        UUID(as_uuid=True), ForeignKey("parcels.id"), nullable=False,
         doc="Parent parcel (1 parcel → N dwellings)"
     )
 
@@ -1267,12 +1596,50 @@ class Dwelling(Base):
     last_attestation_date: Mapped[datetime | None] = mapped_column(DateTime)
     attestation_filing_year: Mapped[int | None] = mapped_column(Integer)
 
+    # ==========================================================================
+    # DERIVED CLASSIFICATION (generated by Postgres; populated on flush)
+    # ==========================================================================
+    tax_classification: Mapped[TaxClassification | None] = mapped_column(
+        SQLEnum(TaxClassification),
+        Computed(
+            """
+            CASE
+                WHEN dwelling_use = 'FULL_TIME_RESIDENCE' AND is_owner_occupied
+                    THEN 'HOMESTEAD'::taxclassification
+                WHEN dwelling_use = 'FULL_TIME_RESIDENCE' AND NOT is_owner_occupied
+                    THEN 'NHS_NONRESIDENTIAL'::taxclassification
+                WHEN dwelling_use IN ('SECOND_HOME', 'SHORT_TERM_RENTAL', 'VACANT')
+                    THEN 'NHS_RESIDENTIAL'::taxclassification
+                WHEN dwelling_use IN ('SEASONAL', 'COMMERCIAL')
+                    THEN 'NHS_NONRESIDENTIAL'::taxclassification
+            END
+            """,
+            persisted=True,
+        ),
+        index=True,
+        doc="Act 73 class from dwelling_use + is_owner_occupied: "
+            "FULL_TIME_RESIDENCE + owner → HOMESTEAD, + tenant → NHS_NONRESIDENTIAL (LTR); "
+            "SECOND_HOME/SHORT_TERM_RENTAL/VACANT → NHS_RESIDENTIAL; "
+            "SEASONAL/COMMERCIAL → NHS_NONRESIDENTIAL; otherwise NULL. "
+            "5+ unit buildings need parcel-level context and are not handled here."
+    )
+    is_habitable_dwelling: Mapped[bool] = mapped_column(
+        Boolean,
+        Computed(
+            "COALESCE(has_separate_entrance AND has_sleeping_facilities "
+            "AND has_cooking_facilities AND has_sanitary_facilities "
+            "AND is_year_round_habitable, false)",
+            persisted=True,
+        ),
+        doc="True if this meets the Act 73 dwelling definition (all habitability requirements)"
+    )
+
     # ==========================================================================
     # METADATA
     # ==========================================================================
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, server_default=func.now(), server_onupdate=FetchedValue()
     )
     data_source: Mapped[str | None] = mapped_column(
         String(50),
@@ -1290,8 +1657,16 @@ class Dwelling(Base):
     parcel: Mapped["Parcel"] = relationship("Parcel", back_populates="dwellings")
     str_listing: Mapped["STRListing | None"] = relationship("STRListing")
     resident: Mapped["Person | None"] = relationship("Person", foreign_keys=[resident_id])
+    # Never loaded implicitly; query PropertyOwnership or use selectinload
     property_ownerships: Mapped[list["PropertyOwnership"]] = relationship(
-        "PropertyOwnership", back_populates="dwelling"
+        "PropertyOwnership", back_populates="dwelling", lazy="raise"
+    )
+
+    __table_args__ = (
+        Index('ix_dwelling_parcel_type_use', 'parcel_id', 'dwelling_type', 'dwelling_use'),
+        Index(
+            'ix_dwellings_homestead_filed', 'parcel_id', postgresql_where=text('homestead_filed')
+        ),
     )
 
     def __repr__(self) -> str:
@@ -1304,64 +1679,22 @@ class Dwelling(Base):
     # COMPUTED PROPERTIES
     # ==========================================================================
 
-    @property
-    def is_habitable_dwelling(self) -> bool:
-        """True if this meets Act 73 dwelling definition (all habitability requirements)."""
-        return all([
-            self.has_separate_entrance,
-            self.has_sleeping_facilities,
-            self.has_cooking_facilities,
-            self.has_sanitary_facilities,
-            self.is_year_round_habitable,
-        ])
-
-    @property
-    def tax_classification(self) -> TaxClassification | None:
-        """Derive Act 73 tax classification from dwelling_use + is_owner_occupied.
-
-        Classification Logic:
-        - FULL_TIME_RESIDENCE + is_owner_occupied=True → HOMESTEAD
-        - FULL_TIME_RESIDENCE + is_owner_occupied=False → NHS_NONRESIDENTIAL (LTR)
-        - SECOND_HOME, SHORT_TERM_RENTAL, VACANT → NHS_RESIDENTIAL
-        - SEASONAL, COMMERCIAL → NHS_NONRESIDENTIAL
-
-        Note: 5+ unit buildings are NHS_NONRESIDENTIAL regardless of use,
-        but that check requires parcel-level context.
-        """
-        if not self.dwelling_use:
-            return None
-
-        if self.dwelling_use == DwellingUse.FULL_TIME_RESIDENCE:
-            if self.is_owner_occupied is True:
-                return TaxClassification.HOMESTEAD
-            elif self.is_owner_occupied is False:
-                return TaxClassification.NHS_NONRESIDENTIAL  # Long-term rental
-            else:
-                return None  # Unknown
-
-        if self.dwelling_use in [
-            DwellingUse.SECOND_HOME,
-            DwellingUse.SHORT_TERM_RENTAL,
-            DwellingUse.VACANT,
-        ]:
-            return TaxClassification.NHS_RESIDENTIAL
-
-        if self.dwelling_use in [DwellingUse.SEASONAL, DwellingUse.COMMERCIAL]:
-            return TaxClassification.NHS_NONRESIDENTIAL
-
-        return None
-
-    @property
+    @hybrid_property
     def is_homestead(self) -> bool:
         """True if this is owner's primary residence (HOMESTEAD classification)."""
         return self.tax_classification == TaxClassification.HOMESTEAD
 
-    @property
+    @hybrid_property
     def has_str_listing(self) -> bool:
         """True if this dwelling has a matched STR listing (separate from use!)."""
         return self.str_listing_id is not None
 
-    @property
+    @has_str_listing.inplace.expression
+    @classmethod
+    def _has_str_listing_expression(cls):
+        return cls.str_listing_id.isnot(None)
+
+    @hybrid_property
     def is_primary_str(self) -> bool:
         """True if SHORT_TERM_RENTAL is the primary use (not just occasional hosting)."""
         return self.dwelling_use == DwellingUse.SHORT_TERM_RENTAL
@@ -1390,7 +1723,7 @@ class DwellingAttestation(Base):
     __tablename__ = "dwelling_attestations"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
 
     # Link to dwelling
@@ -1400,7 +1733,7 @@ class DwellingAttestation(Base):
 
     # Filing info
     filing_year: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
-    filed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    filed_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     filed_by: Mapped[str | None] = mapped_column(Text)  # Filer name
 
     # Declared use (same as Dwelling.dwelling_use)
@@ -1439,3 +1772,33 @@ class DwellingAttestation(Base):
 
     def __repr__(self) -> str:
         return f"<DwellingAttestation {self.filing_year} {self.declared_use}>"
+
+
+# =============================================================================
+# GOLD LAYER: Current Parcel Owners (materialized view)
+# Precomputed Parcel ⨝ PropertyOwnership ⨝ Person/Organization join
+# =============================================================================
+
+class CurrentParcelOwner(Base):
+    """Read-only mapping of the mv_current_parcel_owner materialized view.
+
+    One row per current primary ownership (disposed_date IS NULL). Condo
+    parcels can have several. The view is created by init_db() and
+    refreshed by refresh_current_parcel_owners() after each Grand List
+    import. Its Table lives outside Base.metadata so create_all never
+    tries to create it as a table.
+    """
+
+    __table__ = Table(
+        "mv_current_parcel_owner",
+        MetaData(),
+        Column("ownership_id", UUID(as_uuid=True), primary_key=True),
+        Column("parcel_id", UUID(as_uuid=True)),
+        Column("person_id", UUID(as_uuid=True)),
+        Column("organization_id", UUID(as_uuid=True)),
+        Column("display_name", String),
+        Column("ownership_share", Numeric(5, 4)),
+    )
+
+    def __repr__(self) -> str:
+        return f"<CurrentParcelOwner {self.display_name} @ parcel {self.parcel_id}>"
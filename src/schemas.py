@@ -11,13 +11,24 @@ References:
 - RP-1354 Legislative Report: Dwelling classification guidance
 """
 
+import string
+import sys
 from datetime import date, datetime
-from decimal import Decimal
-from enum import Enum
+from enum import Enum, IntFlag, StrEnum
+from functools import lru_cache
 from typing import Annotated, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    JsonValue,
+    StringConstraints,
+    computed_field,
+    model_validator,
+)
 
 
 # =============================================================================
@@ -226,6 +237,19 @@ class OwnershipType(str, Enum):
     """Joint ownership without right of survivorship."""
 
 
+class DataSource(IntFlag):
+    """Where we learned about a person, stored as a bitmask (people.data_sources_mask).
+
+    Filter with bitwise AND, e.g. known from both Grand List and FPF:
+    ``Person.data_sources_mask.op("&")(DataSource.GRAND_LIST | DataSource.FPF) == 3``
+    """
+
+    GRAND_LIST = 1
+    FPF = 2
+    PTTR = 4
+    MANUAL = 8
+
+
 class TransactionType(str, Enum):
     """Type of property transfer."""
 
@@ -274,6 +298,17 @@ class IntendedUse(str, Enum):
 # CORE ENTITY SCHEMAS
 # =============================================================================
 
+# 2-letter state (or country) code, stripped and uppercased by pydantic-core
+# rather than a Python validator per field
+StateCode = Annotated[
+    str, StringConstraints(strip_whitespace=True, to_upper=True, min_length=2, max_length=2)
+]
+
+# Owner name as listed in source records. The same strings recur across many
+# rows (joint owners, repeat LLC buyers), so each is interned: equal names
+# share one str object and compare by identity
+OwnerName = Annotated[str, AfterValidator(sys.intern)]
+
 
 class PersonBase(BaseModel):
     """A human individual in the Warren community.
@@ -346,18 +381,11 @@ class PersonBase(BaseModel):
         examples=["Warren", "Waitsfield", "Fayston"]
     )
 
-    primary_state: str | None = Field(
+    primary_state: StateCode | None = Field(
         default=None,
-        min_length=2,
-        max_length=2,
         description="State of primary residence as 2-letter code. Use country code for international."
     )
 
-    is_warren_resident: bool = Field(
-        default=False,
-        description="True if this person's primary residence is in Warren, VT."
-    )
-
     # Data provenance
     data_sources: list[str] = Field(
         default_factory=list,
@@ -369,23 +397,18 @@ class PersonBase(BaseModel):
         description="Free-form notes about this person."
     )
 
-    @field_validator("primary_state")
-    @classmethod
-    def normalize_state(cls, v: str | None) -> str | None:
-        """Normalize state to uppercase 2-letter code."""
-        if v is None:
-            return None
-        return v.upper().strip()
+    @computed_field(description="True if this person's primary residence is in Warren, VT.")
+    @property
+    def is_warren_resident(self) -> bool:
+        return (
+            self.primary_town is not None
+            and self.primary_town.lower() == "warren"
+            and self.primary_state == "VT"
+        )
 
-    @model_validator(mode="after")
-    def validate_warren_resident(self) -> "PersonBase":
-        """Auto-set is_warren_resident based on primary location."""
-        if self.primary_town and self.primary_state:
-            self.is_warren_resident = (
-                self.primary_town.lower() == "warren" and
-                self.primary_state.upper() == "VT"
-            )
-        return self
+
+# Organization types that may file a homestead declaration
+_HOMESTEAD_ELIGIBLE_ORG_TYPES: frozenset[OrganizationType] = frozenset({OrganizationType.TRUST})
 
 
 class OrganizationBase(BaseModel):
@@ -427,10 +450,8 @@ class OrganizationBase(BaseModel):
         description="Type of organization. Determines if homestead filing is possible."
     )
 
-    registered_state: str | None = Field(
+    registered_state: StateCode | None = Field(
         default=None,
-        min_length=2,
-        max_length=2,
         description="State where registered (from mailing address). 2-letter code."
     )
 
@@ -444,13 +465,6 @@ class OrganizationBase(BaseModel):
         description="Free-form notes."
     )
 
-    @field_validator("registered_state")
-    @classmethod
-    def normalize_state(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        return v.upper().strip()
-
     @property
     def can_file_homestead(self) -> bool:
         """True if this organization type can file a homestead declaration.
@@ -458,7 +472,26 @@ class OrganizationBase(BaseModel):
         In Vermont, only natural persons can claim homestead exemption.
         Trusts may allow this if the beneficiary is an individual.
         """
-        return self.org_type == OrganizationType.TRUST
+        return self.org_type in _HOMESTEAD_ELIGIBLE_ORG_TYPES
+
+
+# Act 73 class for each dwelling use other than FULL_TIME_RESIDENCE, which
+# depends on owner occupancy (_FULL_TIME_TAX)
+_USE_TAX_MAP: dict[DwellingUse, TaxClassification | None] = {
+    DwellingUse.SHORT_TERM_RENTAL: TaxClassification.NHS_RESIDENTIAL,
+    DwellingUse.SECOND_HOME: TaxClassification.NHS_RESIDENTIAL,
+    DwellingUse.VACANT: TaxClassification.NHS_RESIDENTIAL,
+    DwellingUse.COMMERCIAL: TaxClassification.NHS_NONRESIDENTIAL,
+    DwellingUse.SEASONAL: None,  # Not a dwelling under Act 73
+    DwellingUse.UNKNOWN: None,
+}
+
+# Owner-occupied = HOMESTEAD, tenant-occupied (LTR) = NHS_NONRESIDENTIAL
+_FULL_TIME_TAX: dict[bool | None, TaxClassification | None] = {
+    True: TaxClassification.HOMESTEAD,
+    False: TaxClassification.NHS_NONRESIDENTIAL,
+    None: None,  # Unknown
+}
 
 
 class DwellingBase(BaseModel):
@@ -510,7 +543,7 @@ class DwellingBase(BaseModel):
         description="Number of bedrooms. 0 = studio."
     )
 
-    bathrooms: Decimal | None = Field(
+    bathrooms: float | None = Field(
         default=None,
         ge=0,
         le=10,
@@ -573,8 +606,8 @@ class DwellingBase(BaseModel):
     )
 
     # === STR LISTING LINK (separate from use) ===
-    str_listing_ids: list[str] = Field(
-        default_factory=list,
+    str_listing_ids: tuple[str, ...] = Field(
+        default=(),
         description="IDs of matched STR listings (Airbnb, VRBO) for this dwelling. "
                     "ANY dwelling can have STR listings - even FULL_TIME_RESIDENCE "
                     "(e.g., homeowner rents for 2 weeks over holidays). "
@@ -587,7 +620,7 @@ class DwellingBase(BaseModel):
         description="How this dwelling was identified."
     )
 
-    source_confidence: Decimal | None = Field(
+    source_confidence: float | None = Field(
         default=None,
         ge=0,
         le=1,
@@ -610,13 +643,13 @@ class DwellingBase(BaseModel):
         - Sanitary facilities
         - Year-round habitability
         """
-        return all([
-            self.has_separate_entrance,
-            self.has_sleeping_facilities,
-            self.has_cooking_facilities,
-            self.has_sanitary_facilities,
-            self.is_year_round_habitable,
-        ])
+        return (
+            self.has_separate_entrance
+            and self.has_sleeping_facilities
+            and self.has_cooking_facilities
+            and self.has_sanitary_facilities
+            and self.is_year_round_habitable
+        )
 
     def get_tax_classification(self) -> TaxClassification | None:
         """Derive Act 73 tax classification from dwelling use + owner occupancy.
@@ -625,33 +658,16 @@ class DwellingBase(BaseModel):
         1. DwellingUse (occupancy pattern)
         2. For FULL_TIME_RESIDENCE: is_owner_occupied (owner vs tenant)
         """
-        if not self.use:
+        if self.use is None:
             return None
-
-        if self.use == DwellingUse.FULL_TIME_RESIDENCE:
-            # Owner-occupied = HOMESTEAD, tenant-occupied = NHS_NONRESIDENTIAL
-            if self.is_owner_occupied is True:
-                return TaxClassification.HOMESTEAD
-            elif self.is_owner_occupied is False:
-                return TaxClassification.NHS_NONRESIDENTIAL  # LTR
-            else:
-                return None  # Unknown
-
-        # All other uses map directly
-        mapping = {
-            DwellingUse.SHORT_TERM_RENTAL: TaxClassification.NHS_RESIDENTIAL,
-            DwellingUse.SECOND_HOME: TaxClassification.NHS_RESIDENTIAL,
-            DwellingUse.VACANT: TaxClassification.NHS_RESIDENTIAL,
-            DwellingUse.COMMERCIAL: TaxClassification.NHS_NONRESIDENTIAL,
-            DwellingUse.SEASONAL: None,  # Not a dwelling under Act 73
-            DwellingUse.UNKNOWN: None,
-        }
-        return mapping.get(self.use)
+        if self.use is DwellingUse.FULL_TIME_RESIDENCE:
+            return _FULL_TIME_TAX[self.is_owner_occupied]
+        return _USE_TAX_MAP[self.use]
 
     @property
     def has_str_listing(self) -> bool:
         """True if this dwelling has any matched STR listings."""
-        return len(self.str_listing_ids) > 0
+        return bool(self.str_listing_ids)
 
     @property
     def is_primary_str(self) -> bool:
@@ -700,8 +716,8 @@ class PropertyOwnershipBase(BaseModel):
     )
 
     # Ownership details
-    ownership_share: Decimal = Field(
-        default=Decimal("1.0"),
+    ownership_share: float = Field(
+        default=1.0,
         ge=0,
         le=1,
         description="Ownership percentage as decimal (0.5 = 50%)."
@@ -717,7 +733,7 @@ class PropertyOwnershipBase(BaseModel):
         description="True if this is the primary/first-listed owner."
     )
 
-    as_listed_name: str = Field(
+    as_listed_name: OwnerName = Field(
         min_length=1,
         description="Owner name exactly as it appears in Grand List (preserve original text)."
     )
@@ -794,25 +810,18 @@ class TransactionBase(BaseModel):
     )
 
     # Buyer information
-    buyer_name: str | None = Field(
+    buyer_name: OwnerName | None = Field(
         default=None,
         description="Buyer name(s) as listed on PTTR."
     )
 
-    buyer_state: Annotated[str | None, Field(
+    buyer_state: StateCode | None = Field(
         default=None,
-        min_length=2,
-        max_length=2,
         description="Buyer's state as 2-letter code. Critical for residency analysis."
-    )]
-
-    is_out_of_state_buyer: bool = Field(
-        default=False,
-        description="True if buyer_state is not 'VT'. Strong signal of non-primary residence."
     )
 
     # Seller information
-    seller_name: str | None = Field(
+    seller_name: OwnerName | None = Field(
         default=None,
         description="Seller name(s) as listed on PTTR."
     )
@@ -823,11 +832,6 @@ class TransactionBase(BaseModel):
         description="Buyer's declared intended use. Self-reported on PTTR filing."
     )
 
-    is_primary_residence: bool | None = Field(
-        default=None,
-        description="True if intended_use is PRIMARY_RESIDENCE."
-    )
-
     # Data provenance
     bronze_id: UUID | None = Field(
         default=None,
@@ -839,27 +843,21 @@ class TransactionBase(BaseModel):
         description="Notes from validation process."
     )
 
-    @field_validator("buyer_state")
-    @classmethod
-    def normalize_state(cls, v: str | None) -> str | None:
-        if v is None:
-            return None
-        return v.upper().strip()
-
-    @model_validator(mode="after")
-    def compute_derived_fields(self) -> "TransactionBase":
-        """Compute derived fields from source data."""
-        # Set is_out_of_state_buyer
-        if self.buyer_state:
-            self.is_out_of_state_buyer = self.buyer_state.upper() != "VT"
-
-        # Set is_primary_residence from intended_use
-        if self.intended_use:
-            self.is_primary_residence = (
-                self.intended_use == IntendedUse.PRIMARY_RESIDENCE
-            )
+    @computed_field(
+        description="True if buyer_state is not 'VT'. Strong signal of non-primary residence."
+    )
+    @property
+    def is_out_of_state_buyer(self) -> bool:
+        return self.buyer_state is not None and self.buyer_state != "VT"
 
-        return self
+    @computed_field(
+        description="True if intended_use is PRIMARY_RESIDENCE; None if intended_use is UNKNOWN."
+    )
+    @property
+    def is_primary_residence(self) -> bool | None:
+        if self.intended_use is IntendedUse.UNKNOWN:
+            return None
+        return self.intended_use is IntendedUse.PRIMARY_RESIDENCE
 
 
 class OrganizationMembershipBase(BaseModel):
@@ -952,14 +950,14 @@ class ChangeLogEntry(BaseModel):
         description="Which field changed (null for create/delete)."
     )
 
-    old_value: str | None = Field(
+    old_value: JsonValue = Field(
         default=None,
-        description="Previous value (JSON for complex types)."
+        description="Previous value (any JSON value; stored as jsonb)."
     )
 
-    new_value: str | None = Field(
+    new_value: JsonValue = Field(
         default=None,
-        description="New value (JSON for complex types)."
+        description="New value (any JSON value; stored as jsonb)."
     )
 
     # Who/why
@@ -1004,6 +1002,54 @@ class ChangeLogEntry(BaseModel):
 
 import re
 
+# Organization detection by whole-token lookup, matching the old \b word-boundary
+# regexes: "L.L.C" collapses to "LLC", then punctuation other than "_" (a
+# word character to \b) separates tokens
+_ORG_KEYWORDS = {
+    "LLC": OrganizationType.LLC,
+    "INC": OrganizationType.CORPORATION,
+    "CORP": OrganizationType.CORPORATION,
+    "CORPORATION": OrganizationType.CORPORATION,
+    "TRUST": OrganizationType.TRUST,
+    "TRUSTEE": OrganizationType.TRUST,
+}
+_ORG_TOKEN_SEPARATORS = str.maketrans({c: " " for c in string.punctuation if c != "_"})
+# When several markers appear, the first listed wins (an "LLC ... TRUST" is an LLC)
+_ORG_TYPE_PRIORITY = (OrganizationType.LLC, OrganizationType.CORPORATION, OrganizationType.TRUST)
+# "WESTON STACEY B REVOCABLE TRUST" → Stacey Weston
+_TRUST_GRANTOR_PATTERN = re.compile(r'^([A-Z]+)\s+([A-Z]+)(?:\s+[A-Z]\.?)?\s+(?:REVOCABLE\s+)?TRUST')
+_NAME_SUFFIXES = frozenset({"JR", "SR", "II", "III", "IV", "V"})
+_DWELLING_COUNT_PATTERN = re.compile(r'&\s*(\d+)\s*DWLS?')
+_SINGLE_DWELLING_PATTERN = re.compile(r'&\s*DWL[.\s:]?')
+
+
+def classify_org_name(name: str) -> OrganizationType | None:
+    """Classify a Grand List owner name as an organization type.
+
+    Returns None for names with no LLC/corporation/trust marker (individuals).
+
+    Examples:
+    >>> classify_org_name("MAD RIVER, L.L.C.")
+    <OrganizationType.LLC: 'llc'>
+    >>> classify_org_name("SMITH.LLC")
+    <OrganizationType.LLC: 'llc'>
+    >>> classify_org_name("X LLC.TRUST")
+    <OrganizationType.LLC: 'llc'>
+    >>> classify_org_name("ACME CORP.INC")
+    <OrganizationType.CORPORATION: 'corporation'>
+    >>> classify_org_name("A.TRUST")
+    <OrganizationType.TRUST: 'trust'>
+    >>> classify_org_name("FOO_LLC") is None
+    True
+    >>> classify_org_name("TRUSTY JOHN") is None
+    True
+    """
+    found = {
+        _ORG_KEYWORDS.get(token)
+        for token in name.upper().replace("L.L.C", "LLC").translate(_ORG_TOKEN_SEPARATORS).split()
+    }
+    return next((t for t in _ORG_TYPE_PRIORITY if t in found), None)
+
 
 def parse_owner_name(raw_name: str) -> tuple[list[dict], dict | None]:
     """Parse Grand List owner name into Person(s) and/or Organization.
@@ -1021,31 +1067,35 @@ def parse_owner_name(raw_name: str) -> tuple[list[dict], dict | None]:
     Returns:
         Tuple of (list of person dicts, organization dict or None)
     """
-    # Detection patterns
-    LLC_PATTERN = re.compile(r'\bLLC\b|\bL\.L\.C\b', re.IGNORECASE)
-    TRUST_PATTERN = re.compile(r'\bTRUST\b|\bTRUSTEE\b', re.IGNORECASE)
-    CORP_PATTERN = re.compile(r'\bINC\b|\bCORP\b|\bCORPORATION\b', re.IGNORECASE)
+    # Results are cached, so hand out copies the caller may mutate
+    people, org = _parse_owner_name(raw_name)
+    return [dict(person) for person in people], (dict(org) if org else None)
+
+
+# Owner names repeat heavily across Grand List rows (households owning
+# several parcels, condo units), so each distinct name is parsed once
+OWNER_NAME_CACHE_SIZE = 65536
 
+
+@lru_cache(maxsize=OWNER_NAME_CACHE_SIZE)
+def _parse_owner_name(raw_name: str) -> tuple[list[dict], dict | None]:
     people: list[dict] = []
     org: dict | None = None
 
     name = raw_name.strip()
 
     # Check for organization patterns
-    if LLC_PATTERN.search(name):
-        org = {"name": name, "type": OrganizationType.LLC.value}
-        # LLCs typically don't have individual names to extract
-        return people, org
+    org_type = classify_org_name(name)
 
-    if CORP_PATTERN.search(name):
-        org = {"name": name, "type": OrganizationType.CORPORATION.value}
+    if org_type in (OrganizationType.LLC, OrganizationType.CORPORATION):
+        # LLCs and corporations don't have individual names to extract
+        org = {"name": name, "type": org_type.value}
         return people, org
 
-    if TRUST_PATTERN.search(name):
-        org = {"name": name, "type": OrganizationType.TRUST.value}
+    if org_type == OrganizationType.TRUST:
+        org = {"name": name, "type": org_type.value}
         # Try to extract the person's name from trust
-        # "WESTON STACEY B REVOCABLE TRUST" → Stacey Weston
-        trust_match = re.match(r'^([A-Z]+)\s+([A-Z]+)(?:\s+[A-Z]\.?)?\s+(?:REVOCABLE\s+)?TRUST', name)
+        trust_match = _TRUST_GRANTOR_PATTERN.match(name)
         if trust_match:
             people.append({
                 "last_name": trust_match.group(1).title(),
@@ -1060,39 +1110,34 @@ def parse_owner_name(raw_name: str) -> tuple[list[dict], dict | None]:
     # - "LASTNAME FIRSTNAME M" (middle initial)
     # - "LASTNAME JR FIRSTNAME" (suffix before first name - Grand List quirk)
 
-    # Split by "&" for joint ownership
-    parts = [p.strip() for p in name.split("&")]
+    # Split by "&" for joint ownership; str.split() on each part also trims it
+    parts = name.split("&") if "&" in name else (name,)
 
     for i, part in enumerate(parts):
         tokens = part.split()
-        if not tokens:
-            continue
-
-        person: dict = {}
 
         if i == 0:
             # First person: "LASTNAME [SUFFIX] FIRSTNAME [MIDDLE]"
-            # Check for suffix in position 2
-            suffixes = {"JR", "SR", "II", "III", "IV", "V"}
-
-            if len(tokens) >= 2:
-                person["last_name"] = tokens[0].title()
+            if len(tokens) < 2:
+                continue
 
-                if len(tokens) >= 3 and tokens[1].upper() in suffixes:
-                    person["suffix"] = tokens[1].upper()
-                    person["first_name"] = tokens[2].title()
-                else:
-                    person["first_name"] = tokens[1].title()
-        else:
+            # Check for suffix in position 2
+            person = {"last_name": tokens[0].title()}
+            if len(tokens) >= 3 and tokens[1].upper() in _NAME_SUFFIXES:
+                person["suffix"] = tokens[1].upper()
+                person["first_name"] = tokens[2].title()
+            else:
+                person["first_name"] = tokens[1].title()
+        elif tokens:
             # Subsequent persons: just "FIRSTNAME" (shares last name with first)
-            if len(tokens) >= 1:
-                person["first_name"] = tokens[0].title()
-                # Inherit last name from first person if available
-                if people and "last_name" in people[0]:
-                    person["last_name"] = people[0]["last_name"]
+            person = {"first_name": tokens[0].title()}
+            # Inherit last name from first person if available
+            if people and "last_name" in people[0]:
+                person["last_name"] = people[0]["last_name"]
+        else:
+            continue
 
-        if person.get("first_name"):
-            people.append(person)
+        people.append(person)
 
     return people, org
 
@@ -1121,14 +1166,16 @@ def parse_descprop_dwelling_count(descprop: str | None) -> int:
 
     text = descprop.upper()
 
-    # Check for explicit count: "& 2 DWLS", "& 3 DWLS"
-    multi_match = re.search(r'&\s*(\d+)\s*DWLS?', text)
-    if multi_match:
-        return int(multi_match.group(1))
+    # Most rows ("7.37 ACRES") have no "& ... DWL" at all; skip the regexes
+    if "&" in text and "DWL" in text:
+        # Check for explicit count: "& 2 DWLS", "& 3 DWLS"
+        multi_match = _DWELLING_COUNT_PATTERN.search(text)
+        if multi_match:
+            return int(multi_match.group(1))
 
-    # Check for singular dwelling: "& DWL"
-    if re.search(r'&\s*DWL[.\s:]?', text):
-        return 1
+        # Check for singular dwelling: "& DWL"
+        if _SINGLE_DWELLING_PATTERN.search(text):
+            return 1
 
     # Check for condo
     if "CONDO" in text or "UNIT" in text:
@@ -1147,6 +1194,20 @@ def parse_descprop_dwelling_count(descprop: str | None) -> int:
 # =============================================================================
 
 
+class STRPlatform(StrEnum):
+    """Short-term rental platform of a validated listing."""
+    AIRBNB = "airbnb"
+    VRBO = "vrbo"
+
+
+class STRMatchMethod(StrEnum):
+    """How an STR listing was matched to a parcel."""
+    SPATIAL = "spatial"
+    SPATIAL_CENTROID = "spatial_centroid"
+    ADDRESS = "address"
+    MANUAL = "manual"
+
+
 class STRReviewStatusEnum(str, Enum):
     """Review status for STR-dwelling linking."""
     UNREVIEWED = "unreviewed"
@@ -1156,17 +1217,17 @@ class STRReviewStatusEnum(str, Enum):
 
 
 class STRRejectionReason(str, Enum):
-    """Reasons for rejecting an STR-dwelling link."""
-    NOT_IN_WARREN = "not_in_warren"
+    """Reasons for rejecting an STR-dwelling link (the admin review UI's choices)."""
+    NOT_STR = "not_str"
     DUPLICATE = "duplicate"
-    INVALID_LISTING = "invalid_listing"
-    CANNOT_DETERMINE = "cannot_determine"
+    WRONG_LOCATION = "wrong_location"
+    NO_MATCHING_DWELLING = "no_matching_dwelling"
     OTHER = "other"
 
 
 class STRReviewQueueItem(BaseModel):
     """STR listing in the review queue."""
-    id: str = Field(description="UUID of the STR listing")
+    id: UUID = Field(description="UUID of the STR listing")
     platform: str = Field(description="Platform: airbnb, vrbo")
     listing_id: str = Field(description="Platform's listing ID")
     name: str | None = Field(default=None, description="Listing name/title")
@@ -1180,7 +1241,7 @@ class STRReviewQueueItem(BaseModel):
     average_rating: float | None = Field(default=None, description="Average rating (0-5)")
 
     # Parcel match info
-    parcel_id: str | None = Field(default=None, description="Matched parcel UUID")
+    parcel_id: UUID | None = Field(default=None, description="Matched parcel UUID")
     parcel_span: str | None = Field(default=None, description="Parcel SPAN ID")
     parcel_address: str | None = Field(default=None, description="Parcel address")
     match_method: str | None = Field(default=None, description="How match was made: spatial, address, manual")
@@ -1188,23 +1249,23 @@ class STRReviewQueueItem(BaseModel):
 
     # Review state
     review_status: str = Field(default="unreviewed", description="Review status")
-    dwelling_id: str | None = Field(default=None, description="Confirmed dwelling UUID")
+    dwelling_id: UUID | None = Field(default=None, description="Confirmed dwelling UUID")
     candidate_dwelling_count: int = Field(default=0, description="Number of dwellings on parcel")
 
     # Review metadata
     reviewed_by: str | None = Field(default=None)
-    reviewed_at: str | None = Field(default=None)
+    reviewed_at: datetime | None = Field(default=None)
 
 
 class CandidateDwelling(BaseModel):
     """A candidate dwelling that an STR listing might belong to."""
-    id: str = Field(description="UUID of the dwelling")
+    id: UUID = Field(description="UUID of the dwelling")
     unit_number: str | None = Field(default=None, description="Unit number if condo")
     use_type: str | None = Field(default=None, description="Use type from grand list")
     bedrooms: int | None = Field(default=None, description="Number of bedrooms")
     tax_classification: str | None = Field(default=None, description="HOMESTEAD, NHS_RESIDENTIAL, etc.")
     homestead_filed: bool = Field(default=False, description="Whether homestead was filed")
-    existing_str_id: str | None = Field(default=None, description="Existing STR link if any")
+    existing_str_id: UUID | None = Field(default=None, description="Existing STR link if any")
     existing_str_name: str | None = Field(default=None, description="Name of existing linked STR")
     match_score: float = Field(default=0, ge=0, le=1, description="Computed match likelihood")
 
@@ -1229,11 +1290,11 @@ class STRReviewQueueResponse(BaseModel):
 class STRReviewAction(BaseModel):
     """Request body for review action (confirm/reject/skip)."""
     action: Literal["confirm", "reject", "skip"] = Field(description="Action to take")
-    dwelling_id: str | None = Field(
+    dwelling_id: UUID | None = Field(
         default=None,
         description="UUID of dwelling to link (required if action=confirm)"
     )
-    rejection_reason: str | None = Field(
+    rejection_reason: STRRejectionReason | None = Field(
         default=None,
         description="Reason for rejection (required if action=reject)"
     )
@@ -11,12 +11,20 @@ Schema Engineering Philosophy:
 """
 
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+)
 
 
 # =============================================================================
@@ -79,12 +87,39 @@ STATE_CODES = {
 }
 
 
+@lru_cache(maxsize=1024)
 def normalize_state(raw_state: str | None) -> str | None:
     """Normalize state name/abbreviation to 2-letter code."""
     if not raw_state:
         return None
     clean = raw_state.strip().upper()
-    return STATE_CODES.get(clean, clean[:2] if len(clean) == 2 else None)
+    code = STATE_CODES.get(clean)
+    if code is not None:
+        return code
+    return clean if len(clean) == 2 and clean.isascii() and clean.isalpha() else None
+
+
+# Spelled-out state names (and long abbreviations like "MASS") as one
+# alternation, so a free-text address is scanned once for all of them.
+# Longest names first: "WEST VIRGINIA" must win over "VIRGINIA".
+_STATE_NAME_ALTERNATION = "|".join(
+    re.escape(name)
+    for name in sorted(STATE_CODES, key=len, reverse=True)
+    if len(name) > 2 and name.replace(" ", "").isalpha()
+)
+_STATE_NAME_PATTERN = re.compile(rf"\b(?:{_STATE_NAME_ALTERNATION})\b")
+
+
+def normalize_state_in_text(text: str | None) -> str | None:
+    """Find a spelled-out state name in free text and return its 2-letter code.
+
+    The last name in the text wins: states follow street and city names
+    ("12 VIRGINIA AVE, ALBANY, NEW YORK" → NY).
+    """
+    if not text:
+        return None
+    names = _STATE_NAME_PATTERN.findall(text.upper())
+    return STATE_CODES[names[-1]] if names else None
 
 
 # =============================================================================
@@ -137,8 +172,8 @@ class PTTRBronzeInput(BaseModel):
     seller_name: str | None
     intended_use: str | None
     property_type_code: str | None
-    lat: Decimal | None
-    lng: Decimal | None
+    lat: float | None
+    lng: float | None
 
 
 class PTTRSilverOutput(BaseModel):
@@ -178,26 +213,12 @@ class PTTRSilverOutput(BaseModel):
         max_length=2,
         description="Normalized 2-letter state code"
     )
-    is_out_of_state_buyer: bool = Field(
-        default=False,
-        description="True if buyer_state is not VT"
-    )
-
     seller_name: str | None = Field(default=None)
 
     intended_use: str | None = Field(
         default=None,
         description="Normalized: primary, secondary, investment, commercial, agriculture, land, other"
     )
-    is_primary_residence: bool | None = Field(
-        default=None,
-        description="True if intended_use is 'primary'"
-    )
-    is_secondary_residence: bool | None = Field(
-        default=None,
-        description="True if intended_use is 'secondary'"
-    )
-
     validation_notes: str | None = Field(
         default=None,
         description="Notes about data quality issues or transformations applied"
@@ -215,15 +236,22 @@ class PTTRSilverOutput(BaseModel):
         """Auto-normalize intended use category."""
         return normalize_intended_use(v)
 
-    @model_validator(mode="after")
-    def derive_flags(self):
-        """Derive boolean flags from normalized values."""
-        if self.buyer_state:
-            self.is_out_of_state_buyer = self.buyer_state != "VT"
-        if self.intended_use:
-            self.is_primary_residence = self.intended_use == "primary"
-            self.is_secondary_residence = self.intended_use == "secondary"
-        return self
+    # Flags derived from the normalized values on access, not by a
+    # post-validator on every instance
+    @computed_field(description="True if buyer_state is not VT")
+    @property
+    def is_out_of_state_buyer(self) -> bool:
+        return self.buyer_state is not None and self.buyer_state != "VT"
+
+    @computed_field(description="True if intended_use is 'primary'")
+    @property
+    def is_primary_residence(self) -> bool | None:
+        return None if self.intended_use is None else self.intended_use == "primary"
+
+    @computed_field(description="True if intended_use is 'secondary'")
+    @property
+    def is_secondary_residence(self) -> bool | None:
+        return None if self.intended_use is None else self.intended_use == "secondary"
 
     @classmethod
     def from_bronze(
@@ -239,13 +267,10 @@ class PTTRSilverOutput(BaseModel):
         if not bronze.span or not bronze.sale_price or not bronze.transfer_date:
             return None
 
-        notes = []
-
-        # Check for suspicious data
-        if bronze.sale_price == 0:
-            notes.append("Zero sale price - may be interfamily transfer")
-        if bronze.sale_price and bronze.sale_price > 10_000_000:
-            notes.append(f"Unusually high sale price: ${bronze.sale_price:,}")
+        # Check for suspicious data; most rows have nothing to note
+        validation_notes = None
+        if bronze.sale_price > 10_000_000:
+            validation_notes = f"Unusually high sale price: ${bronze.sale_price:,}"
 
         return cls(
             bronze_id=bronze.id,
@@ -258,7 +283,7 @@ class PTTRSilverOutput(BaseModel):
             buyer_state=bronze.buyer_state,
             seller_name=bronze.seller_name,
             intended_use=bronze.intended_use,
-            validation_notes="; ".join(notes) if notes else None,
+            validation_notes=validation_notes,
         )
 
 
@@ -270,6 +295,8 @@ class PTTRSilverOutput(BaseModel):
 class STRBronzeInput(BaseModel):
     """Input model for raw STR listing from bronze table."""
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     platform: str
     listing_id: str
@@ -281,8 +308,8 @@ class STRBronzeInput(BaseModel):
     city: str | None
     state: str | None
     zip_code: str | None
-    lat: Decimal | None
-    lng: Decimal | None
+    lat: float | None
+    lng: float | None
     bedrooms: int | None
     bathrooms: Decimal | None
     max_guests: int | None
@@ -298,6 +325,10 @@ class STRBronzeInput(BaseModel):
     scraped_at: datetime
 
 
+# Validates a whole batch of BronzeSTRListing rows in one pydantic-core call
+STR_BRONZE_LIST_ADAPTER = TypeAdapter(list[STRBronzeInput])
+
+
 # Property type normalization
 STR_PROPERTY_TYPE_MAP = {
     "ENTIRE HOME": "entire_home",
@@ -312,16 +343,28 @@ STR_PROPERTY_TYPE_MAP = {
 }
 
 
+# All STR_PROPERTY_TYPE_MAP keys as one alternation: a single scan finds the
+# first known type anywhere in the raw string
+_STR_PROPERTY_TYPE_PATTERN = re.compile("|".join(map(re.escape, STR_PROPERTY_TYPE_MAP)))
+
+
+@lru_cache(maxsize=1024)
 def normalize_str_property_type(raw_type: str | None) -> str | None:
     """Normalize STR property type."""
     if not raw_type:
         return None
-    clean = raw_type.strip().upper()
     # Check for partial matches
-    for pattern, normalized in STR_PROPERTY_TYPE_MAP.items():
-        if pattern in clean:
-            return normalized
-    return "other"
+    match = _STR_PROPERTY_TYPE_PATTERN.search(raw_type.upper())
+    return STR_PROPERTY_TYPE_MAP[match.group()] if match else "other"
+
+
+# A listing with no review in this long is treated as inactive
+STR_ACTIVE_WINDOW = timedelta(days=365)
+
+
+def str_active_since(now: datetime) -> datetime:
+    """Cutoff for STR activity: listings last reviewed after it are active."""
+    return now - STR_ACTIVE_WINDOW
 
 
 class STRSilverOutput(BaseModel):
@@ -336,7 +379,7 @@ class STRSilverOutput(BaseModel):
         default=None,
         description="Method used to match listing to parcel"
     )
-    match_confidence: Decimal | None = Field(
+    match_confidence: float | None = Field(
         default=None,
         ge=0,
         le=1,
@@ -353,8 +396,8 @@ class STRSilverOutput(BaseModel):
         description="Normalized: entire_home, condo, apartment, private_room, shared_room, hotel, other"
     )
 
-    lat: Decimal | None = Field(default=None)
-    lng: Decimal | None = Field(default=None)
+    lat: float | None = Field(default=None)
+    lng: float | None = Field(default=None)
 
     bedrooms: int | None = Field(default=None, ge=0)
     max_guests: int | None = Field(default=None, ge=0)
@@ -366,7 +409,7 @@ class STRSilverOutput(BaseModel):
     )
 
     total_reviews: int | None = Field(default=None, ge=0)
-    average_rating: Decimal | None = Field(default=None, ge=0, le=5)
+    average_rating: float | None = Field(default=None, ge=0, le=5)
     is_active: bool = Field(
         default=True,
         description="False if listing appears to be inactive (no recent reviews)"
@@ -377,20 +420,19 @@ class STRSilverOutput(BaseModel):
     def normalize_property_type(cls, v):
         return normalize_str_property_type(v)
 
-    @classmethod
-    def from_bronze(
-        cls,
+    @staticmethod
+    def _silver_fields(
         bronze: STRBronzeInput,
-        parcel_id: UUID | None = None,
-        match_method: str | None = None,
-        match_confidence: float | None = None,
-    ) -> "STRSilverOutput":
-        """Transform bronze STR listing to silver."""
-        # Determine if listing is active
+        parcel_id: UUID | None,
+        match_method: str | None,
+        match_confidence: float | None,
+        active_since: datetime,
+    ) -> dict:
+        """Silver field values for one bronze listing, before validation."""
+        # Determine if listing is active: no reviews since active_since = inactive
         is_active = True
         if bronze.last_review_date:
-            days_since_review = (datetime.utcnow() - bronze.last_review_date).days
-            is_active = days_since_review < 365  # No reviews in a year = inactive
+            is_active = bronze.last_review_date > active_since
 
         # Convert price to USD (assume USD if currency not specified)
         price_usd = None
@@ -398,25 +440,66 @@ class STRSilverOutput(BaseModel):
             # Store as integer cents for precision
             price_usd = int(bronze.price_per_night * 100)
 
-        return cls(
-            bronze_id=bronze.id,
-            parcel_id=parcel_id,
-            match_method=match_method,
-            match_confidence=Decimal(str(match_confidence)) if match_confidence else None,
-            platform=bronze.platform.lower(),
-            listing_id=bronze.listing_id,
-            listing_url=bronze.listing_url,
-            name=bronze.name,
-            property_type=bronze.property_type,
-            lat=bronze.lat,
-            lng=bronze.lng,
-            bedrooms=bronze.bedrooms,
-            max_guests=bronze.max_guests,
-            price_per_night_usd=price_usd,
-            total_reviews=bronze.total_reviews,
-            average_rating=bronze.average_rating,
-            is_active=is_active,
-        )
+        return {
+            "bronze_id": bronze.id,
+            "parcel_id": parcel_id,
+            "match_method": match_method,
+            "match_confidence": match_confidence,
+            "platform": bronze.platform.lower(),
+            "listing_id": bronze.listing_id,
+            "listing_url": bronze.listing_url,
+            "name": bronze.name,
+            "property_type": bronze.property_type,
+            "lat": bronze.lat,
+            "lng": bronze.lng,
+            "bedrooms": bronze.bedrooms,
+            "max_guests": bronze.max_guests,
+            "price_per_night_usd": price_usd,
+            "total_reviews": bronze.total_reviews,
+            "average_rating": bronze.average_rating,
+            "is_active": is_active,
+        }
+
+    @classmethod
+    def from_bronze(
+        cls,
+        bronze: STRBronzeInput,
+        parcel_id: UUID | None = None,
+        match_method: str | None = None,
+        match_confidence: float | None = None,
+        now: datetime | None = None,
+    ) -> "STRSilverOutput":
+        """Transform bronze STR listing to silver.
+
+        Pass `now` when transforming many listings to read the clock once.
+        """
+        return cls(**cls._silver_fields(
+            bronze, parcel_id, match_method, match_confidence,
+            str_active_since(now or datetime.utcnow()),
+        ))
+
+    @classmethod
+    def from_bronze_batch(
+        cls,
+        bronzes: list[STRBronzeInput],
+        matches: list[tuple[UUID | None, str | None, float | None]],
+    ) -> list["STRSilverOutput"]:
+        """Transform a batch of bronze STR listings to silver.
+
+        `matches` holds one (parcel_id, match_method, match_confidence) per
+        listing. The clock is read once for the batch, and all rows are
+        validated in a single pydantic-core call; a ValidationError's loc
+        starts with the index of the failing listing.
+        """
+        active_since = str_active_since(datetime.utcnow())
+        return STR_SILVER_LIST_ADAPTER.validate_python([
+            cls._silver_fields(bronze, *match, active_since)
+            for bronze, match in zip(bronzes, matches)
+        ])
+
+
+# Validates a whole batch of silver STR rows in one pydantic-core call
+STR_SILVER_LIST_ADAPTER = TypeAdapter(list[STRSilverOutput])
 
 
 # =============================================================================
@@ -441,11 +524,22 @@ class ParcelMatch(BaseModel):
     notes: str | None = Field(default=None)
 
 
+# Deletes SPAN separators in one C-level pass (same as SQL translate(..., '- ', ''))
+_SPAN_SEPARATORS = str.maketrans("", "", "- ")
+
+
+@lru_cache(maxsize=65536)
+def normalize_span(span: str) -> str:
+    """Normalize a SPAN to the key form: trimmed, uppercase, no dashes or spaces.
+
+    Build span_to_parcel_id lookups keyed by this form.
+    """
+    return span.strip().upper().translate(_SPAN_SEPARATORS)
+
+
 def match_by_span(span: str, span_to_parcel_id: dict[str, UUID]) -> ParcelMatch:
     """Match by SPAN identifier (highest confidence)."""
-    # Normalize SPAN format
-    clean_span = span.strip().upper().replace("-", "").replace(" ", "")
-    parcel_id = span_to_parcel_id.get(clean_span)
+    parcel_id = span_to_parcel_id.get(normalize_span(span))
 
     if parcel_id:
         return ParcelMatch(
@@ -463,6 +557,11 @@ def match_by_span(span: str, span_to_parcel_id: dict[str, UUID]) -> ParcelMatch:
 # =============================================================================
 
 
+# Error messages kept per run; later errors are only counted, so a
+# pathological source can't grow the list without bound
+MAX_VALIDATION_ERRORS = 10_000
+
+
 class TransformationStats(BaseModel):
     """Statistics from a bronze → silver transformation run."""
 
@@ -472,7 +571,25 @@ class TransformationStats(BaseModel):
     records_skipped: int = 0
     records_with_parcel_match: int = 0
     records_without_parcel_match: int = 0
-    validation_errors: list[str] = Field(default_factory=list)
+    validation_errors: list[str] = Field(
+        default_factory=list,
+        description=f"The first {MAX_VALIDATION_ERRORS:,} error messages",
+    )
+    errors_dropped: int = Field(
+        default=0,
+        description="Errors counted but not kept once validation_errors is full",
+    )
+
+    def add_error(self, message: str) -> None:
+        """Record a validation error message, or just count it once the list is full."""
+        if len(self.validation_errors) < MAX_VALIDATION_ERRORS:
+            self.validation_errors.append(message)
+        else:
+            self.errors_dropped += 1
+
+    @property
+    def error_count(self) -> int:
+        return len(self.validation_errors) + self.errors_dropped
 
     @property
     def success_rate(self) -> float: